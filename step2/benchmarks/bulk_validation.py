@@ -0,0 +1,120 @@
+"""
+객체 단위 검증 vs 리스트 단위 일괄 검증 벤치마크
+
+JSONL 덤프(MovieInfo, 약 1%는 평점 범위 위반)를 두 방식으로 검증 → 재직렬화합니다.
+- 객체 단위: 줄마다 json.loads → MovieInfo(**obj) → .dict() → json.dumps
+- 일괄: validate_jsonl() (리스트 TypeAdapter로 원본 바이트 검증) → dump_jsonl()
+두 방식의 정상/실패 레코드 수와 재직렬화 결과가 같은지 확인합니다.
+한 줄에 레코드가 두 개 있는 JSONL도 줄 단위로 에러 인덱스가 유지되는지 먼저 확인합니다.
+
+실행 예:
+    python benchmarks/bulk_validation.py
+    python benchmarks/bulk_validation.py --rows 10000 100000 1000000
+"""
+
+import argparse
+import json
+import sys
+import time
+import warnings
+from pathlib import Path
+
+from pydantic import BaseModel, Field, ValidationError
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.bulk_validation import dump_jsonl, validate_jsonl
+from common.schema_registry import registry
+
+
+class MovieInfo(BaseModel):
+    """영화 정보를 담는 Pydantic 모델 (phase2 예제 1과 동일)"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+    rating: float = Field(description="평점 (0.0 ~ 10.0)", ge=0.0, le=10.0)
+
+
+def make_dump(n: int, invalid_every: int = 100) -> bytes:
+    lines = []
+    for i in range(n):
+        rating = 15.0 if i % invalid_every == invalid_every - 1 else round((i % 100) / 10, 1)
+        row = {"title": f"영화 {i}", "director": f"감독 {i % 500}", "year": 1950 + i % 75, "rating": rating}
+        lines.append(json.dumps(row, ensure_ascii=False))
+    return "\n".join(lines).encode("utf-8")
+
+
+def per_object(data: bytes):
+    """예제 1 방식: 한 줄씩 dict → 모델 → dict → JSON"""
+    out, errors = [], 0
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # .dict() deprecation 경고
+        for line in data.splitlines():
+            try:
+                movie = MovieInfo(**json.loads(line))
+            except ValidationError:
+                errors += 1
+                continue
+            out.append(json.dumps(movie.dict(), ensure_ascii=False))
+    return "\n".join(out).encode("utf-8") + b"\n", len(out), errors
+
+
+def bulk(data: bytes):
+    result = validate_jsonl(MovieInfo, data)
+    return dump_jsonl(MovieInfo, result.items), len(result.items), result.error_count
+
+
+# 1번 줄에 레코드 두 개: 한 줄의 에러여야 하고, 뒤 줄(2번 평점 위반)의 인덱스가 밀리면 안 됨
+MERGED_LINES = b"""{"title": "a", "director": "x", "year": 2001, "rating": 7.0}
+{"title": "c", "director": "x", "year": 2003, "rating": 7.0},{"title": "d", "director": "x", "year": 2004, "rating": 7.0}
+{"title": "e", "director": "x", "year": 2005, "rating": 15.0}
+{"title": "f", "director": "x", "year": 2006, "rating": 7.0}
+"""
+
+
+def check_line_boundaries():
+    result = validate_jsonl(MovieInfo, MERGED_LINES)
+    indexes = sorted({error["index"] for error in result.errors})
+    if (result.total, len(result.items), indexes) != (4, 2, [1, 2]):
+        raise AssertionError(f"줄 경계가 맞지 않습니다: total={result.total}, valid={len(result.items)}, 에러 줄={indexes}")
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="일괄 검증 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    registry.warm_up(MovieInfo)
+    check_line_boundaries()
+
+    print("=" * 70)
+    print("객체 단위 (json.loads → Model → .dict()) vs validate_jsonl() 일괄 검증")
+    print("=" * 70)
+    print(f"{'rows':>10}{'invalid':>10}{'per-object':>14}{'bulk':>12}{'speedup':>10}{'rows/s':>14}")
+    print("-" * 70)
+
+    for n in args.rows:
+        data = make_dump(n)
+
+        (expected, valid, invalid), baseline = timed(lambda: per_object(data))
+        (dumped, bulk_valid, bulk_invalid), fast = timed(lambda: bulk(data))
+
+        if (bulk_valid, bulk_invalid) != (valid, invalid):
+            raise AssertionError(f"검증 결과가 다릅니다: {valid}/{invalid} vs {bulk_valid}/{bulk_invalid}")
+        if [json.loads(line) for line in dumped.splitlines()] != [json.loads(line) for line in expected.splitlines()]:
+            raise AssertionError("재직렬화 결과가 다릅니다")
+
+        print(f"{n:>10,}{invalid:>10,}{baseline:>13.3f}s{fast:>11.3f}s{baseline / fast:>9.1f}x{n / fast:>14,.0f}")
+
+    print("\n✅ 정상/실패 레코드 수와 재직렬화 결과가 객체 단위 방식과 동일합니다.")
+    print("✅ 한 줄에 레코드가 두 개인 줄은 그 줄의 에러로 보고되고 뒤 줄의 인덱스는 유지됩니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,122 @@
+"""
+calculate 도구 벤치마크: eval() vs common.calculator
+
+LLM이 보내는 것과 비슷한 산술 표현식을 만들어 같은 값이 나오는지 확인하고 시간을 비교합니다.
+- eval: 기존 도구 구현 (매번 파싱/컴파일)
+- evaluate (cold): 캐시가 빈 상태에서 AST 검사 + 계산
+- evaluate (warm): 같은 표현식 반복 (LRU 캐시 조회)
+- evaluate_many: 중복이 섞인 목록을 한 번에 계산 (API 호출 없음)
+
+실행 예:
+    python benchmarks/calculator.py
+    python benchmarks/calculator.py --exprs 100 1000 10000 --distinct 0.1
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common import calculator
+from common.calculator import evaluate, evaluate_many
+
+OPERATORS = ["+", "-", "*", "/", "//", "%", "**"]
+
+# 반드시 CalculationError로 거부되어야 하는 표현식
+REJECTED = [
+    "9**9**9",                    # 결과가 너무 큼 (eval()은 사실상 멈춤)
+    "__import__('os').getcwd()",  # 이름 / 호출
+    "(-8) ** 0.5",                # 복소수 결과
+    "1 / 0",
+]
+
+
+def make_expression(rng: random.Random) -> str:
+    """(15 + 10 + 18) / 3 같은 형태의 무작위 표현식"""
+    terms = rng.randint(2, 6)
+    parts = [str(rng.randint(1, 99))]
+    used_power = False
+    for _ in range(terms - 1):
+        # "2 ** 3 ** 3"처럼 거듭제곱이 이어지면 eval()이 사실상 멈추므로 한 번만 사용
+        op = rng.choice(OPERATORS[:-1] if used_power else OPERATORS)
+        used_power = used_power or op == "**"
+        operand = rng.randint(1, 3) if op == "**" else rng.randint(1, 99)
+        parts.append(f"{op} {operand}")
+    expression = " ".join(parts)
+    return f"({expression}) / {rng.randint(1, 9)}" if rng.random() < 0.5 else expression
+
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="calculate 도구 벤치마크")
+    parser.add_argument("--exprs", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--distinct", type=float, default=0.2,
+                        help="서로 다른 표현식 비율 (나머지는 반복, 기본 0.2)")
+    args = parser.parse_args()
+
+    for expression in REJECTED:
+        result = evaluate_many([expression])[0]
+        assert isinstance(result, calculator.CalculationError), f"거부되어야 합니다: {expression} → {result!r}"
+
+    rng = random.Random(42)
+
+    print("=" * 78)
+    print("calculate 도구: eval() vs AST 계산기 (표현식 N개 전체 시간)")
+    print("=" * 78)
+    print(f"{'exprs':>8}{'eval':>12}{'cold':>12}{'warm':>12}{'many':>12}{'speedup':>10}")
+    print("-" * 66)
+
+    for n in args.exprs:
+        pool = [make_expression(rng) for _ in range(max(int(n * args.distinct), 1))]
+        expressions = [rng.choice(pool) for _ in range(n)]
+
+        # 같은 값인지 먼저 확인 (둘 다 실패하는 0으로 나누기 등은 제외)
+        expected = []
+        for expression in expressions:
+            try:
+                expected.append(eval(expression))
+            except ZeroDivisionError:
+                expected.append(None)
+        actual = [None if isinstance(r, calculator.CalculationError) else r for r in evaluate_many(expressions)]
+        assert actual == expected, "eval()과 계산 결과가 다릅니다"
+
+        def run_eval():
+            for expression in expressions:
+                try:
+                    eval(expression)
+                except ZeroDivisionError:
+                    pass
+
+        def run_evaluate():
+            for expression in expressions:
+                try:
+                    evaluate(expression)
+                except calculator.CalculationError:
+                    pass
+
+        baseline = timed(run_eval)
+        calculator._compile.cache_clear()
+        cold = timed(run_evaluate)
+        warm = timed(run_evaluate)
+        calculator._compile.cache_clear()
+        many = timed(lambda: evaluate_many(expressions))
+
+        print(f"{n:>8}{baseline * 1000:>10.1f}ms{cold * 1000:>10.1f}ms{warm * 1000:>10.1f}ms"
+              f"{many * 1000:>10.1f}ms{baseline / warm:>9.1f}x")
+
+    print()
+    print("cold: 캐시 없이 AST 검사 + 계산 / warm: 같은 표현식 재요청 / many: evaluate_many (cold)")
+    print(f"캐시 크기: {calculator.CACHE_SIZE} (서로 다른 표현식이 더 많으면 오래된 것부터 삭제)")
+    print(f"거부 확인: {len(REJECTED)}개 표현식 모두 CalculationError ({', '.join(REJECTED)})")
+
+
+if __name__ == "__main__":
+    main()
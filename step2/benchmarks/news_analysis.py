@@ -0,0 +1,232 @@
+"""
+뉴스 기사 분석: fanout(5개 호출) vs fused(1개 구조화 호출) 비교 (LLM API 호출)
+
+phase5 예제 4의 5개 분석(요약/감정/주제/키워드/개체명)을 두 방식으로 실행합니다.
+- fanout: 분석별 프롬프트 5개를 동시 호출 (기사를 5번 전송, 캐시 가능한 길이면 공통 접두사 캐시 읽기)
+- fused:  common.news_analysis의 ArticleAnalysis로 1번 호출
+기사마다 입력(일반 + 캐시 읽기/쓰기)/출력 토큰 합계, 비용, 소요 시간과
+출력 품질(허용된 감정/주제 레이블, 키워드 5개, 두 방식의 감정/주제 일치, 키워드 겹침)을 비교합니다.
+
+짧은 기사 3개는 프롬프트 캐시 최소 길이(claude-3-haiku 2048토큰)보다 짧아 캐시되지 않고,
+long_article.txt(약 12,000자, 추정 ~3,100토큰)는 fanout에서 첫 분석이 캐시를 기록한 뒤 나머지 4개가 캐시를 읽습니다.
+
+실행 예:
+    python benchmarks/news_analysis.py
+    python benchmarks/news_analysis.py --runs 3
+"""
+
+import argparse
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.news_analysis import build_fused_analyzer, to_report_fields
+from common.prompt_cache import (
+    MIN_CACHEABLE_TOKENS,
+    PROMPT_CACHING_HEADERS,
+    cache_usage,
+    estimate_prefix_tokens,
+    shared_prefix_parallel,
+    shared_prefix_prompt,
+)
+
+# claude-3-haiku 가격 (USD / 1M 토큰)
+INPUT_PRICE = 0.25
+OUTPUT_PRICE = 1.25
+CACHE_WRITE_PRICE = 0.30
+CACHE_READ_PRICE = 0.03
+
+SENTIMENTS = ["긍정적", "중립적", "부정적"]
+TOPICS = ["Technology", "Health", "Politics", "Business", "Other"]
+
+# 분석별 지시문 (phase5 예제 4와 동일, 기사는 공통 접두사)
+FANOUT_INSTRUCTIONS = {
+    "summary": "위 영문 기사를 3문장 이내로 요약해주세요.",
+    "sentiment": "위 영문 기사의 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나).",
+    "topic": "위 영문 기사의 주제를 분류해주세요 (Technology/Health/Politics/Business/Other 중 하나).",
+    "keywords": "위 영문 기사에서 핵심 키워드 5개를 추출해주세요 (쉼표로 구분).",
+    "entities": "위 영문 기사에서 주요 인물, 조직, 장소를 추출해주세요 (각각 쉼표로 구분하여 나열).",
+}
+
+ARTICLES = [
+    """Apple Inc. announced today that its latest iPhone model has broken all previous
+sales records in the first quarter of 2024. CEO Tim Cook stated that the
+integration of advanced AI features has been a major driver of consumer interest.
+The new device includes enhanced camera capabilities, longer battery life, and
+improved privacy features. Analysts predict that Apple's market value could
+surpass $4 trillion by the end of the year. However, some critics have raised
+concerns about the environmental impact of increased electronic waste. Meanwhile,
+competitors like Samsung and Google are preparing their own AI-powered smartphone
+releases for later this year.""",
+    """The World Health Organization warned on Monday that cases of measles in Europe
+have risen sharply, with more than 40,000 infections reported across 41 countries.
+Dr. Hans Kluge, WHO regional director for Europe, urged governments in Romania and
+Kazakhstan to expand vaccination campaigns. Health officials said declining
+immunization rates during the pandemic left many children unprotected.""",
+    """Shares of Tesla fell 8 percent after the company reported lower than expected
+quarterly deliveries. Chief executive Elon Musk told investors in Austin that price
+cuts in China and Germany had squeezed margins. Analysts at Morgan Stanley lowered
+their price target, citing slowing demand for electric vehicles.""",
+    # 캐시 최소 길이를 넘는 실제 크기의 기사 (프롬프트 캐시 효과 측정용)
+    (Path(__file__).resolve().parent / "long_article.txt").read_text(encoding="utf-8"),
+]
+
+
+def first_label(text: str, labels: List[str]) -> Optional[str]:
+    """자유 텍스트 응답에서 가장 먼저 나오는 레이블 (없으면 None)"""
+    found = [(text.find(label), label) for label in labels if label in text]
+    return min(found)[1] if found else None
+
+
+def keyword_set(text: str) -> set:
+    return {k.strip(" .*-0123456789\n").lower() for k in re.split(r"[,\n]", text)} - {""}
+
+
+def cost(row: Dict[str, Any]) -> float:
+    return (
+        row["input_tokens"] * INPUT_PRICE + row["cache_creation"] * CACHE_WRITE_PRICE
+        + row["cache_read"] * CACHE_READ_PRICE + row["output_tokens"] * OUTPUT_PRICE
+    ) / 1_000_000
+
+
+def run_fanout(fanout, article: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    messages = fanout.invoke({"article": article})
+    wall_time = time.perf_counter() - started
+    usages = [cache_usage(message) for message in messages.values()]
+    return {
+        "calls": len(messages),
+        **{key: sum(u[key] for u in usages) for key in ("input_tokens", "cache_read", "cache_creation", "output_tokens")},
+        "wall_time": wall_time,
+        "fields": {name: message.content for name, message in messages.items()},
+        "error": None,
+    }
+
+
+def run_fused(fused, article: str) -> Dict[str, Any]:
+    started = time.perf_counter()
+    output = fused.invoke({"article": article})
+    wall_time = time.perf_counter() - started
+    error = output.get("parsing_error")
+    return {
+        "calls": 1,
+        **cache_usage(output["raw"]),
+        "wall_time": wall_time,
+        "fields": to_report_fields(output["parsed"]) if output["parsed"] else None,
+        "error": str(error) if error else None,
+    }
+
+
+def quality(fields: Optional[Dict[str, str]]) -> Dict[str, Any]:
+    """허용된 레이블 / 키워드 개수 검사"""
+    if fields is None:
+        return {"sentiment": None, "topic": None, "labels_valid": False, "keywords": 0}
+    sentiment = first_label(fields["sentiment"], SENTIMENTS)
+    topic = first_label(fields["topic"], TOPICS)
+    return {
+        "sentiment": sentiment,
+        "topic": topic,
+        # fanout은 설명이 붙은 자유 텍스트이므로 레이블이 포함되어 있는지만 확인
+        "labels_valid": sentiment is not None and topic is not None,
+        "keywords": len(keyword_set(fields["keywords"])),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="fanout vs fused 뉴스 분석 토큰/비용/지연/품질 비교")
+    parser.add_argument("--runs", type=int, default=1, help="기사별 반복 횟수 (기본 1)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("❌ ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        return
+
+    llm = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0, default_headers=PROMPT_CACHING_HEADERS)
+    fanout = shared_prefix_parallel({
+        name: shared_prefix_prompt(instruction) | llm
+        for name, instruction in FANOUT_INSTRUCTIONS.items()
+    })
+    fused = build_fused_analyzer(llm, include_raw=True)
+
+    print("=" * 70)
+    print("뉴스 기사 분석: fanout (5개 호출) vs fused (1개 호출)")
+    print("=" * 70)
+
+    rows = {"fanout": [], "fused": []}
+    agreement = []
+    per_article = []
+    for index, article in enumerate(ARTICLES, 1):
+        article = " ".join(article.split())
+        prefix_tokens = estimate_prefix_tokens(article)
+        for _ in range(args.runs):
+            fanout_row = run_fanout(fanout, article)
+            per_article.append((index, len(article), prefix_tokens, fanout_row))
+            fused_row = run_fused(fused, article)
+            for mode, row in (("fanout", fanout_row), ("fused", fused_row)):
+                row["quality"] = quality(row["fields"])
+                rows[mode].append(row)
+                if row["error"]:
+                    print(f"  ❌ 기사 {index} {mode}: {row['error'][:100]}")
+
+            a, b = fanout_row["quality"], fused_row["quality"]
+            overlap = 0.0
+            if fused_row["fields"]:
+                left = keyword_set(fanout_row["fields"]["keywords"])
+                right = keyword_set(fused_row["fields"]["keywords"])
+                overlap = len(left & right) / len(left | right) if left | right else 0.0
+            agreement.append({
+                "sentiment": a["sentiment"] is not None and a["sentiment"] == b["sentiment"],
+                "topic": a["topic"] is not None and a["topic"] == b["topic"],
+                "keywords": overlap,
+            })
+
+    print(f"\n기사 {len(ARTICLES)}개 x {args.runs}회, 기사당 평균")
+    print(f"{'mode':<8}{'calls':>7}{'input tok':>11}{'cache r/w':>13}{'output tok':>12}{'cost($)':>11}"
+          f"{'wall time':>11}{'labels ok':>11}{'kw=5':>7}{'errors':>8}")
+    print("-" * 99)
+    for mode, calls in rows.items():
+        n = len(calls)
+        mean = {key: sum(c[key] for c in calls) / n for key in ("input_tokens", "cache_read", "cache_creation", "output_tokens")}
+        cache_rw = f"{mean['cache_read']:.0f}/{mean['cache_creation']:.0f}"
+        print(
+            f"{mode:<8}{calls[0]['calls']:>7}{mean['input_tokens']:>11.1f}{cache_rw:>13}{mean['output_tokens']:>12.1f}"
+            f"{cost(mean):>11.6f}"
+            f"{sum(c['wall_time'] for c in calls) / n:>10.2f}s"
+            f"{sum(c['quality']['labels_valid'] for c in calls):>8}/{n:<2}"
+            f"{sum(c['quality']['keywords'] == 5 for c in calls):>4}/{n:<2}"
+            f"{sum(1 for c in calls if c['error']):>6}"
+        )
+
+    print(f"\nfanout 기사별 프롬프트 캐시 (최소 {MIN_CACHEABLE_TOKENS}토큰 이상이면 첫 분석 후 나머지 병렬)")
+    print(f"{'article':<9}{'chars':>8}{'prefix~':>9}{'cacheable':>11}{'input tok':>11}{'cache read':>12}{'cache write':>13}{'cost($)':>11}{'wall time':>11}")
+    print("-" * 95)
+    for index, chars, prefix_tokens, row in per_article:
+        cacheable = "yes" if prefix_tokens >= MIN_CACHEABLE_TOKENS else "no"
+        print(f"{index:<9}{chars:>8}{prefix_tokens:>9}{cacheable:>11}{row['input_tokens']:>11}"
+              f"{row['cache_read']:>12}{row['cache_creation']:>13}{cost(row):>11.6f}{row['wall_time']:>10.2f}s")
+
+    n = len(agreement)
+    print(f"\n두 방식의 결과 일치 ({n}쌍):")
+    print(f"  - 감정 레이블 일치: {sum(a['sentiment'] for a in agreement)}/{n}")
+    print(f"  - 주제 레이블 일치: {sum(a['topic'] for a in agreement)}/{n}")
+    print(f"  - 키워드 겹침 (Jaccard 평균): {sum(a['keywords'] for a in agreement) / n:.2f}")
+
+    fanout_cost = sum(cost(c) for c in rows["fanout"])
+    fused_cost = sum(cost(c) for c in rows["fused"])
+    if fanout_cost:
+        print(f"\nfused 비용 = fanout의 {fused_cost / fanout_cost:.1%}")
+    print("참고: fanout의 wall time은 5개 호출을 병렬로 실행한 시간 (가장 느린 호출 기준),")
+    print("      캐시 가능한 기사는 첫 분석 1회 + 나머지 4개 병렬 시간")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+PromptTemplate.format() vs CompiledPrompt.format_many() 벤치마크
+
+- phase1 인사 템플릿 (변수 2개, 짧은 템플릿)
+- phase2 영화 정보 템플릿 (format_instructions partial 포함, 긴 템플릿)
+두 경우에 대해 행 수별 렌더링 시간과 처리량을 비교하고, 결과가 동일한지 검증합니다.
+
+실행 예:
+    python benchmarks/prompt_render.py
+    python benchmarks/prompt_render.py --rows 10000 100000 1000000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from pydantic import BaseModel, Field
+from langchain.prompts import PromptTemplate
+from langchain.output_parsers import PydanticOutputParser
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.prompt_renderer import CompiledPrompt
+
+
+class MovieInfo(BaseModel):
+    """영화 정보를 담는 Pydantic 모델 (phase2 예제 2와 동일)"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+    genre: str = Field(description="장르")
+
+
+def build_cases():
+    greeting = PromptTemplate(
+        input_variables=["name", "greeting"],
+        template="안녕하세요, {name}님! {greeting}",
+    )
+
+    parser = PydanticOutputParser(pydantic_object=MovieInfo)
+    movie = PromptTemplate(
+        input_variables=["movie_query"],
+        partial_variables={"format_instructions": parser.get_format_instructions()},
+        template="""당신은 영화 정보 제공 어시스턴트입니다.
+
+사용자가 요청한 영화에 대해 다음 정보를 제공해주세요:
+- 제목
+- 감독
+- 개봉 연도
+- 장르
+
+영화: {movie_query}
+
+{format_instructions}
+""",
+    )
+
+    return [
+        ("phase1 인사", greeting, lambda i: {"name": f"사용자{i}", "greeting": "반갑습니다!"}),
+        ("phase2 영화 정보", movie, lambda i: {"movie_query": f"영화 {i}"}),
+    ]
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description="프롬프트 렌더링 벤치마크")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    args = parser.parse_args()
+
+    print("=" * 70)
+    print("PromptTemplate.format() vs CompiledPrompt.format_many()")
+    print("=" * 70)
+
+    for name, prompt, make_row in build_cases():
+        compiled, compile_time = timed(lambda: CompiledPrompt.from_prompt(prompt))
+        print(f"\n[{name}] 컴파일 1회: {compile_time * 1000:.3f}ms")
+        print(f"{'rows':>10}{'format()':>14}{'format_many':>14}{'speedup':>10}{'rows/s':>14}")
+        print("-" * 62)
+
+        for n in args.rows:
+            rows = [make_row(i) for i in range(n)]
+
+            expected, baseline = timed(lambda: [prompt.format(**row) for row in rows])
+            rendered, fast = timed(lambda: compiled.format_many(rows))
+
+            if rendered != expected:
+                raise AssertionError(f"{name}: 렌더링 결과가 PromptTemplate.format()과 다릅니다")
+
+            print(f"{n:>10,}{baseline:>13.3f}s{fast:>13.3f}s{baseline / fast:>9.1f}x{n / fast:>14,.0f}")
+
+    print("\n✅ 모든 결과가 PromptTemplate.format()과 동일합니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+검색 도구 인덱스 벤치마크: 순회 vs KeywordIndex / NgramIndex
+
+한국어 음절로 만든 가상 문서를 10^3 ~ 10^6개 생성해 질문당 검색 시간을 비교합니다.
+- keyword: search_web처럼 "등록된 키워드가 질문에 포함되는가" (순회 vs Aho-Corasick)
+- substring: search_news처럼 "질문이 분류/제목에 포함되는가" (순회 vs 2-gram 역색인)
+두 방식의 검색 결과가 같은지도 확인합니다. (API 호출 없음)
+
+실행 예:
+    python benchmarks/search_index.py
+    python benchmarks/search_index.py --docs 1000 10000 --queries 500
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.search_index import KeywordIndex, LinearScanIndex, NgramIndex
+
+# 자주 쓰이는 음절 일부 (n-gram이 문서 사이에 적당히 겹치도록 제한된 집합 사용)
+SYLLABLES = list(
+    "가각간강개거건경고공과관교구국군그기김나남내노누다대도동두드라래로리마만명모무문미민바박반"
+    "방배백보부분비사산상새서선성세소수시신실아안양어업여연영오요우운원위유은의이인일자장재전정"
+    "제조주중지진차천청초최추치카타터통파판평포프하한해행현화회후"
+)
+
+
+def make_word(rng: random.Random, low: int, high: int) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(low, high)))
+
+
+def timed(func) -> float:
+    started = time.perf_counter()
+    func()
+    return time.perf_counter() - started
+
+
+def bench_keyword(n: int, queries: int, rng: random.Random):
+    """키워드 n개 등록, 질문(문장) 안에서 키워드 찾기"""
+    keywords = list(dict.fromkeys(make_word(rng, 3, 6) for _ in range(n)))
+    texts = []
+    for _ in range(queries):
+        words = [make_word(rng, 2, 4) for _ in range(5)]
+        if rng.random() < 0.5:
+            words.insert(rng.randint(0, 5), rng.choice(keywords))
+        texts.append(" ".join(words))
+
+    linear = LinearScanIndex(keywords, mode="keyword")
+    build = timed(lambda: KeywordIndex(keywords))
+    index = KeywordIndex(keywords)
+
+    for text in texts:
+        assert index.search(text) == linear.search(text), text
+    scan = timed(lambda: [linear.search(text) for text in texts]) / queries
+    lookup = timed(lambda: [index.search(text) for text in texts]) / queries
+    return build, scan, lookup
+
+
+def bench_substring(n: int, queries: int, rng: random.Random):
+    """(분류, 제목) 문서 n개 등록, 질문을 포함하는 문서 찾기"""
+    documents = {i: (make_word(rng, 2, 4), " ".join(make_word(rng, 2, 4) for _ in range(5))) for i in range(n)}
+    keys = list(documents)
+    texts = []
+    for _ in range(queries):
+        if rng.random() < 0.5:
+            # 실제 제목의 일부 (2~4글자)
+            title = documents[rng.choice(keys)][1]
+            start = rng.randrange(len(title) - 1)
+            texts.append(title[start:start + rng.randint(2, 4)])
+        else:
+            texts.append(make_word(rng, 2, 3))
+
+    linear = LinearScanIndex(documents)
+    build = timed(lambda: NgramIndex(documents))
+    index = NgramIndex(documents)
+
+    for text in texts:
+        assert index.search(text) == linear.search(text), text
+    scan = timed(lambda: [linear.search(text) for text in texts]) / queries
+    lookup = timed(lambda: [index.search(text) for text in texts]) / queries
+    return build, scan, lookup
+
+
+def main():
+    parser = argparse.ArgumentParser(description="검색 인덱스 벤치마크")
+    parser.add_argument("--docs", type=int, nargs="+", default=[1000, 10000, 100000, 1000000])
+    parser.add_argument("--queries", type=int, default=50, help="문서 수별 질문 수 (기본 50)")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+
+    for title, bench in [
+        ("keyword: 질문에 포함된 키워드 찾기 (search_web)", bench_keyword),
+        ("substring: 질문을 포함하는 문서 찾기 (search_news)", bench_substring),
+    ]:
+        print("=" * 66)
+        print(title)
+        print("=" * 66)
+        print(f"{'docs':>9}{'build':>11}{'scan/query':>14}{'index/query':>14}{'speedup':>11}")
+        print("-" * 59)
+        for n in args.docs:
+            build, scan, lookup = bench(n, args.queries, rng)
+            print(f"{n:>9}{build:>10.2f}s{scan * 1e6:>12.0f}µs{lookup * 1e6:>12.0f}µs{scan / lookup:>10.0f}x")
+        print()
+
+    print("build: 인덱스 생성 시간 (로드 시 1회) / scan: 기존 순회 방식 / index: 인덱스 조회")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,115 @@
+"""
+예제 스크립트 시작 시간(cold start) 벤치마크
+
+각 스크립트의 최상위 import 문만 뽑아 새 파이썬 프로세스에서 실행하고,
+- 프로세스 전체 소요 시간 (중앙값)
+- python -X importtime 기준 가장 무거운 최상위 모듈
+을 보고합니다. 스크립트 본문은 실행하지 않으므로 API 호출이나 input() 대기가 없습니다.
+
+실행 예:
+    python benchmarks/startup_time.py                      # phase*/example*.py 전체
+    python benchmarks/startup_time.py phase1/example1_simple_prompt.py --runs 10
+"""
+
+import argparse
+import ast
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+STEP2_DIR = Path(__file__).resolve().parent.parent
+
+
+def extract_startup_code(script: Path) -> str:
+    """스크립트에서 시작 시 실행되는 import 관련 최상위 문장만 추출
+
+    - import / from ... import
+    - sys.path.insert(...) (common 모듈 경로 추가)
+    - x = lazy_module(...) (지연 import 등록)
+    """
+    tree = ast.parse(script.read_text(encoding="utf-8"))
+    startup = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            startup.append(node)
+        elif isinstance(node, ast.Expr) and "sys.path" in ast.unparse(node):
+            startup.append(node)
+        elif isinstance(node, ast.Assign) and "lazy_module(" in ast.unparse(node.value):
+            startup.append(node)
+    source = "\n".join(ast.unparse(node) for node in startup)
+    # __file__ 기준 경로 계산이 동작하도록 스크립트 경로를 지정
+    return f"__file__ = {str(script)!r}\n{source}"
+
+
+def measure_wall_time(code: str, runs: int) -> float:
+    """새 프로세스에서 code를 runs회 실행한 소요 시간의 중앙값(초)"""
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=STEP2_DIR, check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def parse_import_time(code: str) -> Dict[str, float]:
+    """python -X importtime 출력에서 최상위(들여쓰기 없는) 모듈별 누적 시간(초)"""
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], cwd=STEP2_DIR,
+                            capture_output=True, text=True, check=True)
+    modules: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if name.startswith("  "):  # 다른 모듈이 끌어온 하위 import
+            continue
+        modules[name.strip()] = int(cumulative) / 1_000_000
+    return modules
+
+
+def heaviest_imports(code: str, startup_modules: set, top: int = 3) -> List[Tuple[str, float]]:
+    """인터프리터 자체 시작 모듈(site 등)을 제외한 무거운 최상위 import 상위 top개"""
+    modules = parse_import_time(code)
+    script_modules = [(name, t) for name, t in modules.items() if name not in startup_modules]
+    return sorted(script_modules, key=lambda item: item[1], reverse=True)[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="예제 스크립트 시작 시간 벤치마크")
+    parser.add_argument("scripts", nargs="*", help="측정할 스크립트 (기본: phase*/example*.py)")
+    parser.add_argument("--runs", type=int, default=5, help="스크립트당 반복 횟수 (기본 5)")
+    args = parser.parse_args()
+
+    scripts = [Path(s).resolve() for s in args.scripts] or sorted(STEP2_DIR.glob("phase*/example*.py"))
+
+    print("=" * 70)
+    print("예제 스크립트 시작 시간 벤치마크")
+    print("=" * 70)
+    print(f"파이썬: {sys.version.split()[0]} / 반복: {args.runs}회 (중앙값)")
+    print()
+
+    baseline = measure_wall_time("pass", args.runs)
+    startup_modules = set(parse_import_time("pass"))
+    print(f"빈 인터프리터 시작: {baseline * 1000:.0f}ms")
+    print()
+
+    print(f"{'script':<42}{'startup':>10}{'imports':>10}  heaviest top-level imports")
+    print("-" * 110)
+    for script in scripts:
+        code = extract_startup_code(script)
+        wall = measure_wall_time(code, args.runs)
+        heaviest = heaviest_imports(code, startup_modules)
+        heaviest_text = ", ".join(f"{name} {seconds * 1000:.0f}ms" for name, seconds in heaviest)
+        name = str(script.relative_to(STEP2_DIR))
+        print(f"{name:<42}{wall * 1000:>8.0f}ms{(wall - baseline) * 1000:>8.0f}ms  {heaviest_text}")
+
+    print()
+    print("startup: 프로세스 시작 ~ 최상위 import 완료까지 걸린 시간")
+    print("imports: startup - 빈 인터프리터 시작 시간")
+
+
+if __name__ == "__main__":
+    main()
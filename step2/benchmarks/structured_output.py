@@ -0,0 +1,136 @@
+"""
+구조화 출력 모드별 토큰 / 지연 시간 비교 (LLM API 호출)
+
+phase2 예제 2 (MovieInfo), 예제 3 (MovieRecommendations)을 두 모드로 실행합니다.
+- parser: 프롬프트에 포맷 지시문 포함 → 응답 텍스트를 PydanticOutputParser로 파싱
+- tool:   포맷 지시문 없이 llm.with_structured_output(Model)
+호출마다 usage_metadata의 입력/출력 토큰과 소요 시간을 기록해 모드별 평균을 출력합니다.
+
+실행 예:
+    python benchmarks/structured_output.py
+    python benchmarks/structured_output.py --runs 5
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from typing import List
+
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+from langchain.prompts import PromptTemplate
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.schema_registry import registry
+from common.structured_output import format_usage_comparison, invoke_with_usage, structured_chain
+
+
+class MovieInfo(BaseModel):
+    """영화 정보를 담는 Pydantic 모델 (phase2 예제 2와 동일)"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+    genre: str = Field(description="장르")
+
+
+class Movie(BaseModel):
+    """개별 영화 정보"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+
+
+class MovieRecommendations(BaseModel):
+    """영화 추천 리스트 (phase2 예제 3과 동일)"""
+    category: str = Field(description="추천 카테고리")
+    movies: List[Movie] = Field(description="추천 영화 리스트 (3개)")
+
+
+CASES = [
+    (
+        "예제 2 MovieInfo",
+        MovieInfo,
+        """당신은 영화 정보 제공 어시스턴트입니다.
+
+사용자가 요청한 영화에 대해 다음 정보를 제공해주세요:
+- 제목
+- 감독
+- 개봉 연도
+- 장르
+
+영화: {movie_query}
+
+{format_instructions}
+""",
+        [{"movie_query": "인셉션"}, {"movie_query": "기생충"}],
+    ),
+    (
+        "예제 3 MovieRecommendations",
+        MovieRecommendations,
+        """당신은 영화 추천 전문가입니다.
+
+다음 카테고리에 맞는 영화를 정확히 3개 추천해주세요:
+카테고리: {category}
+
+각 영화에 대해 제목, 감독, 개봉 연도를 포함해주세요.
+
+{format_instructions}
+""",
+        [{"category": "한국 영화"}, {"category": "SF 영화"}],
+    ),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="parser 모드 vs tool 모드 토큰/지연 비교")
+    parser.add_argument("--runs", type=int, default=1, help="입력별 반복 횟수 (기본 1)")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("❌ ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        return
+
+    llm = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0)
+
+    print("=" * 70)
+    print("구조화 출력: 포맷 지시문(parser) vs tool calling(tool)")
+    print("=" * 70)
+
+    for name, model, template, inputs in CASES:
+        input_variables = list(inputs[0])
+        parser_prompt = PromptTemplate(
+            input_variables=input_variables,
+            partial_variables={"format_instructions": registry.get_format_instructions(model)},
+            template=template,
+        )
+        tool_prompt = PromptTemplate(
+            input_variables=input_variables,
+            partial_variables={"format_instructions": ""},
+            template=template,
+        )
+
+        parser_chain = parser_prompt | llm
+        tool_chain = structured_chain(tool_prompt, llm, model, include_raw=True)
+        parse = registry.get_parser(model).parse
+
+        parser_calls, tool_calls = [], []
+        for _ in range(args.runs):
+            for row in inputs:
+                parser_calls.append(invoke_with_usage(parser_chain, row, parse=parse))
+                tool_calls.append(invoke_with_usage(tool_chain, row))
+
+        print(f"\n[{name}] 호출당 평균")
+        print(format_usage_comparison([("parser", parser_calls), ("tool", tool_calls)]))
+
+        for mode, calls in (("parser", parser_calls), ("tool", tool_calls)):
+            for call in calls:
+                if call["error"]:
+                    print(f"  ❌ {mode}: {call['error'][:100]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+llm.bind_tools() vs bind_tools_cached() 바인딩 비용 벤치마크
+
+phase4 예제의 tool 함수와 같은 형태(타입 힌트 + Google 스타일 docstring)의 함수를
+3 / 30 / 300개 만들어, 요청마다 다시 바인딩하는 상황을 재현합니다.
+- bind_tools: 매번 시그니처/docstring을 분석해 스키마 생성
+- cached (cold): 첫 바인딩 (스키마 변환 + 캐시 저장)
+- cached (warm): 이후 바인딩 (dict 조회 + 바인딩된 모델 재사용)
+캐시 경로의 tool 정의가 bind_tools() 결과와 동일한지도 확인합니다. (API 호출 없음)
+
+실행 예:
+    python benchmarks/tool_schema.py
+    python benchmarks/tool_schema.py --tools 3 30 300 --repeat 50
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.tool_schema import ToolSchemaCache
+
+TOOL_TEMPLATE = '''
+def tool_{i}(city: str, days: int = 1, unit: str = "celsius") -> str:
+    """{i}번 도시의 날씨 예보를 조회합니다.
+
+    Args:
+        city: 날씨를 조회할 도시 이름 (예: 서울, 부산)
+        days: 예보 일수
+        unit: 온도 단위 (celsius 또는 fahrenheit)
+
+    Returns:
+        날씨 예보 문자열
+    """
+    return f"{{city}}: 맑음"
+'''
+
+
+def make_tools(n: int):
+    namespace = {}
+    for i in range(n):
+        exec(TOOL_TEMPLATE.format(i=i), namespace)
+    return [namespace[f"tool_{i}"] for i in range(n)]
+
+
+def timed(func, repeat: int) -> float:
+    """repeat회 실행한 평균 시간(초)"""
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat
+
+
+def main():
+    parser = argparse.ArgumentParser(description="bind_tools 스키마 캐시 벤치마크")
+    parser.add_argument("--tools", type=int, nargs="+", default=[3, 30, 300])
+    parser.add_argument("--repeat", type=int, default=20, help="바인딩 반복 횟수 (기본 20)")
+    args = parser.parse_args()
+
+    llm = ChatAnthropic(model="claude-3-haiku-20240307", temperature=0, api_key="benchmark")
+
+    print("=" * 70)
+    print("요청당 바인딩 비용: llm.bind_tools() vs bind_tools_cached()")
+    print("=" * 70)
+    print(f"{'tools':>7}{'bind_tools':>14}{'cached cold':>14}{'cached warm':>14}{'speedup':>10}")
+    print("-" * 59)
+
+    for n in args.tools:
+        tools = make_tools(n)
+        cache = ToolSchemaCache()
+
+        baseline = timed(lambda: llm.bind_tools(tools), args.repeat)
+        cold = timed(lambda: cache.bind(llm, tools), 1)
+        warm = timed(lambda: cache.bind(llm, tools), args.repeat)
+
+        if cache.bind(llm, tools).kwargs["tools"] != llm.bind_tools(tools).kwargs["tools"]:
+            raise AssertionError(f"{n}개: 캐시된 tool 정의가 bind_tools() 결과와 다릅니다")
+
+        print(
+            f"{n:>7}{baseline * 1000:>12.3f}ms{cold * 1000:>12.3f}ms"
+            f"{warm * 1000:>12.4f}ms{baseline / warm:>9.0f}x"
+        )
+
+    print("\n✅ 캐시된 tool 정의가 bind_tools() 결과와 동일합니다.")
+
+
+if __name__ == "__main__":
+    main()
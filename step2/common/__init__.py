@@ -0,0 +1,9 @@
+"""
+Step 2 예제들이 함께 사용하는 공용 유틸리티 모음
+
+각 phase의 예제 스크립트는 독립적으로 실행되므로,
+스크립트 상단에서 step2 디렉토리를 sys.path에 추가한 뒤 import 합니다.
+
+    sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+    from common.batch import run_batch
+"""
@@ -0,0 +1,265 @@
+"""
+배치 실행 유틸리티
+
+- JSONL 파일 입력 읽기 / 출력 쓰기
+- chain.batch() / chain.abatch() 기반 동시 실행 (max_concurrency)
+- 처리량(rows/s) 및 p50/p95 지연 시간 측정
+- 키별 fan-out: 동시 실행 후 완료 순서대로 검증, 키별 결과로 집계
+"""
+
+import asyncio
+import json
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Tuple
+
+
+# ============================================================================
+# 1. JSONL 입출력
+# ============================================================================
+
+def read_jsonl(path: str) -> Iterator[Dict[str, Any]]:
+    """JSONL 파일을 한 줄씩 읽어 dict로 반환 (빈 줄은 건너뜀)"""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+
+def write_jsonl(path: str, rows: Iterable[Dict[str, Any]], append: bool = False):
+    """dict 목록을 JSONL 파일로 저장 (입력 순서 유지)"""
+    with open(path, "a" if append else "w", encoding="utf-8") as f:
+        for row in rows:
+            f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+
+# ============================================================================
+# 2. 지연 시간 통계
+# ============================================================================
+
+def percentile(values: List[float], pct: float) -> float:
+    """선형 보간 방식의 백분위수 (values가 비어 있으면 0.0)"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * pct / 100
+    lower = math.floor(k)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (k - lower)
+
+
+class LatencyStats:
+    """행 단위 지연 시간과 전체 처리량 기록"""
+
+    def __init__(self):
+        self.latencies: List[float] = []
+        self.errors = 0
+        self.start_time = None
+        self.end_time = None
+        self._lock = threading.Lock()  # batch()는 스레드 풀에서 실행됨
+
+    def start(self):
+        self.start_time = time.perf_counter()
+
+    def end(self):
+        self.end_time = time.perf_counter()
+
+    def record(self, latency: float, ok: bool = True):
+        with self._lock:
+            self.latencies.append(latency)
+            if not ok:
+                self.errors += 1
+
+    def summary(self) -> Dict[str, float]:
+        end_time = self.end_time or time.perf_counter()
+        wall_time = end_time - self.start_time if self.start_time else 0.0
+        rows = len(self.latencies)
+        return {
+            "rows": rows,
+            "errors": self.errors,
+            "wall_time": wall_time,
+            "throughput": rows / wall_time if wall_time > 0 else 0.0,
+            "p50": percentile(self.latencies, 50),
+            "p95": percentile(self.latencies, 95),
+            "p99": percentile(self.latencies, 99),
+            "max": max(self.latencies) if self.latencies else 0.0,
+        }
+
+    def get_report(self) -> str:
+        s = self.summary()
+        return f"""
+📊 배치 실행 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+처리 행 수: {s['rows']}개 (실패 {s['errors']}개)
+총 소요 시간: {s['wall_time']:.2f}초
+처리량: {s['throughput']:.2f} rows/s
+지연 시간: p50 {s['p50']:.3f}초 / p95 {s['p95']:.3f}초 / p99 {s['p99']:.3f}초 / max {s['max']:.3f}초
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+
+# ============================================================================
+# 3. 배치 실행
+# ============================================================================
+
+def _to_output(result: Any) -> Any:
+    """AIMessage는 content만, 나머지는 그대로 반환"""
+    return getattr(result, "content", result)
+
+
+def _timed(chain, stats: LatencyStats):
+    """chain 호출을 감싸 행 단위 지연 시간을 기록하는 Runnable 생성
+
+    batch()는 행별 소요 시간을 알려주지 않으므로, 각 invoke를 측정합니다.
+    실패한 행은 예외 대신 error 필드로 반환하여 나머지 행은 계속 처리합니다.
+    """
+    # percentile 등 통계 함수만 쓰는 경우 LangChain을 import하지 않도록 지연 import
+    from langchain_core.runnables import RunnableLambda
+
+    def run(row: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            output = {"output": _to_output(chain.invoke(row)), "error": None}
+        except Exception as e:
+            output = {"output": None, "error": str(e)}
+        latency = time.perf_counter() - started
+        stats.record(latency, ok=output["error"] is None)
+        return {"input": row, **output, "latency": round(latency, 4)}
+
+    async def arun(row: Dict[str, Any]) -> Dict[str, Any]:
+        started = time.perf_counter()
+        try:
+            output = {"output": _to_output(await chain.ainvoke(row)), "error": None}
+        except Exception as e:
+            output = {"output": None, "error": str(e)}
+        latency = time.perf_counter() - started
+        stats.record(latency, ok=output["error"] is None)
+        return {"input": row, **output, "latency": round(latency, 4)}
+
+    return RunnableLambda(run, afunc=arun)
+
+
+def _chunks(rows: Iterable[Dict[str, Any]], size: int) -> Iterator[List[Dict[str, Any]]]:
+    chunk = []
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def iter_batch(
+    chain,
+    rows: Iterable[Dict[str, Any]],
+    stats: LatencyStats,
+    max_concurrency: int = 8,
+    chunk_size: int = 1000,
+    use_async: bool = False,
+) -> Iterator[List[Dict[str, Any]]]:
+    """입력을 chunk_size 단위로 나눠 batch/abatch 실행, 결과를 chunk 단위로 반환
+
+    수만 건의 입력도 메모리에 모두 올리지 않고 처리할 수 있도록
+    chunk 단위로 결과를 내보냅니다. 각 chunk의 결과는 입력 순서를 유지합니다.
+    """
+    timed_chain = _timed(chain, stats)
+    config = {"max_concurrency": max_concurrency}
+
+    for chunk in _chunks(rows, chunk_size):
+        if use_async:
+            yield asyncio.run(timed_chain.abatch(chunk, config=config))
+        else:
+            yield timed_chain.batch(chunk, config=config)
+
+
+def run_batch(
+    chain,
+    rows: Iterable[Dict[str, Any]],
+    max_concurrency: int = 8,
+    chunk_size: int = 1000,
+    use_async: bool = False,
+    output_path: str = None,
+) -> Tuple[List[Dict[str, Any]], LatencyStats]:
+    """배치 실행 후 (결과 목록, 통계) 반환
+
+    output_path가 주어지면 결과를 JSONL로 바로 기록하고, 반환 목록은 비워 둡니다.
+    """
+    stats = LatencyStats()
+    results = []
+
+    if output_path:
+        write_jsonl(output_path, [])  # 기존 파일 비우기
+
+    stats.start()
+    for chunk_results in iter_batch(
+        chain, rows, stats,
+        max_concurrency=max_concurrency,
+        chunk_size=chunk_size,
+        use_async=use_async,
+    ):
+        if output_path:
+            write_jsonl(output_path, chunk_results, append=True)
+        else:
+            results.extend(chunk_results)
+    stats.end()
+
+    return results, stats
+
+
+# ============================================================================
+# 4. 키별 fan-out (완료 순서대로 검증, 결과는 입력 순서로 집계)
+# ============================================================================
+
+def fan_out(
+    chain,
+    inputs: Dict[str, Dict[str, Any]],
+    validate: Callable[[Any], Any] = None,
+    max_concurrency: int = 8,
+    on_result: Callable[[str, Dict[str, Any]], None] = None,
+) -> Tuple[Dict[str, Dict[str, Any]], LatencyStats]:
+    """키(예: 카테고리)별 입력을 동시에 실행하고 키별 결과를 모아 반환
+
+    각 호출이 끝나는 즉시 validate(output)로 검증하므로, 느린 호출을 기다리는 동안
+    먼저 끝난 결과를 검증/출력할 수 있습니다. 전체 시간은 합계가 아니라 가장 느린 호출에 가까워집니다.
+
+    Args:
+        chain: 실행할 체인 (AIMessage를 반환하면 content만 validate에 전달)
+        inputs: {키: 체인 입력}
+        validate: 출력 검증 함수 (예: parser.parse). 실패하면 status="parse_error"
+        max_concurrency: 동시 요청 수 상한
+        on_result: 결과가 완료될 때마다 호출되는 콜백 (키, 결과)
+
+    Returns:
+        ({키: {"output", "error", "status", "latency"}} (inputs 순서), 통계)
+        status는 "ok" / "error" (호출 실패) / "parse_error" (검증 실패)
+    """
+    keys = list(inputs)
+    stats = LatencyStats()
+    results = {}
+    timed_chain = _timed(chain, stats)
+
+    stats.start()
+    for index, row in timed_chain.batch_as_completed(
+        [inputs[key] for key in keys],
+        config={"max_concurrency": max_concurrency},
+    ):
+        result = {
+            "output": row["output"],
+            "error": row["error"],
+            "status": "ok" if row["error"] is None else "error",
+            "latency": row["latency"],
+        }
+        if validate is not None and result["status"] == "ok":
+            try:
+                result["output"] = validate(result["output"])
+            except Exception as e:
+                result.update(output=None, error=str(e), status="parse_error")
+        results[keys[index]] = result
+        if on_result:
+            on_result(keys[index], result)
+    stats.end()
+
+    return {key: results[key] for key in keys}, stats
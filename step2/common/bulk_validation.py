@@ -0,0 +1,126 @@
+"""
+JSON 바이트 일괄 검증 엔진
+
+LLM 출력을 모아 둔 JSONL 덤프를 한 줄씩 json.loads → Model(**obj) → .dict() 하는 대신,
+리스트 단위 TypeAdapter로 원본 바이트를 한 번에(단일 패스) 검증하고 pydantic-core로 바로 직렬화합니다.
+
+- 예외를 던지지 않고 레코드별 에러(index, field, type, msg)를 수집
+- 정상 레코드만 모아 반환 (입력 순서 유지)
+- dump_json()으로 JSON 바이트 재직렬화 (json.dumps 경유 없음)
+
+사용법:
+    from common.bulk_validation import validate_jsonl, dump_json
+
+    result = validate_jsonl(MovieInfo, raw_bytes)
+    result.items     # List[MovieInfo]
+    result.errors    # [{"index": 3, "field": "rating", "type": "less_than_equal", "msg": "..."}]
+    dump_json(MovieInfo, result.items)   # b'[{"title": ...}, ...]'
+"""
+
+from typing import Any, Dict, List, Type, Union
+
+from pydantic import BaseModel, ValidationError
+
+from common.schema_registry import registry
+
+
+class BulkResult:
+    """일괄 검증 결과"""
+
+    def __init__(self, items: List[BaseModel], errors: List[Dict[str, Any]], total: int):
+        self.items = items
+        self.errors = errors
+        self.total = total
+
+    @property
+    def error_count(self) -> int:
+        return len({error["index"] for error in self.errors})
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "valid": len(self.items),
+            "invalid": self.error_count,
+        }
+
+
+def _format_error(index: int, error: Dict[str, Any]) -> Dict[str, Any]:
+    """pydantic 에러 dict를 예제 1의 출력 형식(필드/타입/메시지)으로 변환"""
+    loc = error.get("loc", ())
+    return {
+        "index": index,
+        "field": ".".join(str(part) for part in loc) if loc else None,
+        "type": error["type"],
+        "msg": error["msg"],
+    }
+
+
+def _split_lines(data: bytes) -> List[bytes]:
+    return [line for line in (raw.strip() for raw in data.splitlines()) if line]
+
+
+def _collect(model: Type[BaseModel], values: List[Any]) -> BulkResult:
+    """lenient 검증 결과에서 모델 객체만 모으고, 나머지 원본 값은 개별 검증해 에러를 수집"""
+    validator = registry.get_validator(model)
+    items, errors = [], []
+    for i, value in enumerate(values):
+        if isinstance(value, model):
+            items.append(value)
+            continue
+        try:
+            items.append(validator.validate_python(value))
+        except ValidationError as e:
+            errors.extend(_format_error(i, error) for error in e.errors(include_url=False))
+    return BulkResult(items, errors, len(values))
+
+
+def validate_records(model: Type[BaseModel], records: List[bytes]) -> BulkResult:
+    """JSON 객체 바이트 목록을 리스트 단위로 한 번에 검증
+
+    1. 전체를 JSON 배열로 이어 붙여 한 번에 검증. 실패한 원소는 예외 대신 원본 값으로 남음
+    2. 남은 원본 값(보통 소수)만 개별 검증해 에러 수집
+    3. JSON 문법 오류로 배열 전체를 읽을 수 없거나, 원소 수가 레코드 수와 다르면 레코드 단위로 검증
+       (한 줄에 '{...},{...}'처럼 값이 여러 개면 이어 붙인 배열에서 원소가 늘어나 인덱스가 밀림)
+    """
+    try:
+        values = registry.get_lenient_list_validator(model).validate_json(b"[" + b",".join(records) + b"]")
+    except ValidationError:
+        values = None
+    if values is not None and len(values) == len(records):
+        return _collect(model, values)
+
+    # JSON 문법 오류 / 레코드 경계 불일치 → 레코드 단위 검증 (한 레코드에 값이 여러 개면 그 레코드의 에러)
+    validator = registry.get_validator(model)
+    items, errors = [], []
+    for i, record in enumerate(records):
+        try:
+            items.append(validator.validate_json(record))
+        except ValidationError as e:
+            errors.extend(_format_error(i, error) for error in e.errors(include_url=False))
+    return BulkResult(items, errors, len(records))
+
+
+def validate_jsonl(model: Type[BaseModel], data: bytes) -> BulkResult:
+    """JSONL 바이트(한 줄에 JSON 객체 하나)를 일괄 검증"""
+    return validate_records(model, _split_lines(data))
+
+
+def validate_json_array(model: Type[BaseModel], data: Union[bytes, str]) -> BulkResult:
+    """JSON 배열 바이트를 일괄 검증 (실패 원소는 에러로 수집)"""
+    try:
+        values = registry.get_lenient_list_validator(model).validate_json(data)
+    except ValidationError as e:
+        # 배열 자체를 읽을 수 없는 경우는 원소를 나눌 수 없으므로 그대로 보고
+        return BulkResult([], [_format_error(-1, error) for error in e.errors(include_url=False)], 0)
+    return _collect(model, values)
+
+
+def dump_json(model: Type[BaseModel], items: List[BaseModel]) -> bytes:
+    """검증된 객체 목록을 JSON 배열 바이트로 직렬화 (pydantic-core 직렬화 경로)"""
+    return registry.get_list_validator(model).dump_json(items)
+
+
+def dump_jsonl(model: Type[BaseModel], items: List[BaseModel]) -> bytes:
+    """검증된 객체 목록을 JSONL 바이트로 직렬화"""
+    dump = registry.get_validator(model).dump_json
+    return b"\n".join(dump(item) for item in items) + (b"\n" if items else b"")
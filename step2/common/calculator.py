@@ -0,0 +1,131 @@
+"""
+calculate 도구용 안전한 산술 계산기
+
+LLM이 만든 문자열을 eval()로 실행하면 문자 화이트리스트가 있어도
+"9**9**9" 같은 입력 하나로 프로세스가 멈출 수 있고, 매번 파싱/컴파일 비용이 듭니다.
+
+- ast.parse로 파싱한 뒤 숫자 상수와 산술 연산자 노드만 허용 (이름, 호출, 속성 접근 등은 거부)
+- 지원 연산: + - * / // % ** (단항 + - 포함)
+- 거듭제곱은 결과 크기를 미리 추정해 너무 큰 정수 계산을 거부, 복소수 결과((-8) ** 0.5)도 거부
+- 변수가 없으므로 컴파일 결과는 계산된 값 자체 → 표현식 문자열을 키로 LRU 캐시
+- evaluate_many(): 여러 표현식을 한 번에 계산 (중복 표현식은 한 번만 계산)
+
+사용법:
+    from common.calculator import evaluate, evaluate_many, CalculationError
+
+    evaluate("(10 + 5) / 3")            # 5.0
+    evaluate_many(["2 ** 10", "1 / 0"])  # [1024, CalculationError(...)]
+"""
+
+import ast
+import operator
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, Union
+
+Number = Union[int, float]
+
+# 입력 크기 / 결과 크기 상한
+MAX_EXPRESSION_LENGTH = 1000
+MAX_POWER_BITS = 4096
+
+# 캐시할 컴파일 결과 수
+CACHE_SIZE = 4096
+
+
+class CalculationError(ValueError):
+    """허용되지 않는 표현식이거나 계산할 수 없는 경우"""
+
+
+def _power(base: Number, exponent: Number) -> Number:
+    # 정수 거듭제곱은 결과 비트 수를 미리 추정 (실수는 OverflowError로 처리됨)
+    if isinstance(base, int) and isinstance(exponent, int) and exponent > 0:
+        if abs(base) > 1 and base.bit_length() * exponent > MAX_POWER_BITS:
+            raise CalculationError(f"결과가 너무 큽니다: {base} ** {exponent}")
+    result = base ** exponent
+    # 음수의 분수 거듭제곱은 파이썬에서 complex가 되므로 거부
+    if isinstance(result, complex):
+        raise CalculationError(f"실수가 아닌 결과입니다: ({base}) ** {exponent}")
+    return result
+
+
+_BINARY_OPERATORS: Dict[type, Callable[[Number, Number], Number]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: _power,
+}
+
+_UNARY_OPERATORS: Dict[type, Callable[[Number], Number]] = {
+    ast.UAdd: operator.pos,
+    ast.USub: operator.neg,
+}
+
+
+def _fold(node: ast.AST) -> Number:
+    """허용된 노드만 따라가며 상수로 접기 (그 외 노드는 CalculationError)"""
+    if isinstance(node, ast.Constant):
+        # bool은 int의 하위 클래스이므로 명시적으로 제외
+        if type(node.value) in (int, float):
+            return node.value
+        raise CalculationError(f"숫자가 아닌 값은 사용할 수 없습니다: {node.value!r}")
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPERATORS:
+        return _BINARY_OPERATORS[type(node.op)](_fold(node.left), _fold(node.right))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPERATORS:
+        return _UNARY_OPERATORS[type(node.op)](_fold(node.operand))
+    raise CalculationError(f"허용되지 않는 구문입니다: {type(node).__name__}")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _compile(expression: str) -> Number:
+    """표현식 문자열 → 계산된 값 (성공한 결과만 캐시됨)"""
+    if len(expression) > MAX_EXPRESSION_LENGTH:
+        raise CalculationError(f"표현식이 너무 깁니다 (최대 {MAX_EXPRESSION_LENGTH}자)")
+    try:
+        tree = ast.parse(expression, mode="eval")
+    except SyntaxError as e:
+        raise CalculationError(f"잘못된 수식입니다: {e.msg}") from None
+    try:
+        return _fold(tree.body)
+    except ZeroDivisionError:
+        raise CalculationError("0으로 나눌 수 없습니다") from None
+    except (OverflowError, RecursionError):
+        raise CalculationError("결과가 너무 큽니다") from None
+
+
+def evaluate(expression: str) -> Number:
+    """산술 표현식 계산 (허용되지 않는 구문 / 0으로 나누기 등은 CalculationError)"""
+    return _compile(expression.strip())
+
+
+def evaluate_many(expressions: Iterable[str]) -> List[Union[Number, CalculationError]]:
+    """여러 표현식을 입력 순서대로 계산 (실패한 항목은 예외 객체를 값으로 반환)"""
+    results: Dict[str, Union[Number, CalculationError]] = {}
+    ordered = [expression.strip() for expression in expressions]
+    for expression in ordered:
+        if expression not in results:
+            try:
+                results[expression] = _compile(expression)
+            except CalculationError as e:
+                results[expression] = e
+    return [results[expression] for expression in ordered]
+
+
+def cache_info():
+    """LRU 캐시 통계 (hits, misses, maxsize, currsize)"""
+    return _compile.cache_info()
+
+
+def get_report() -> str:
+    info = cache_info()
+    calls = info.hits + info.misses
+    hit_rate = info.hits / calls if calls else 0.0
+    return f"""
+📊 계산기 캐시 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+계산 요청: {calls}회 (캐시 적중 {info.hits}회, 적중률 {hit_rate:.1%})
+캐시된 표현식: {info.currsize}개 / 최대 {info.maxsize}개
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
@@ -0,0 +1,92 @@
+"""
+phase4 예제 1 / 예제 5 공용 도구 (get_weather, calculate, search_web)
+
+도구 선택은 docstring에 크게 좌우되므로, 예제 1(LLM 도구 선택)과
+예제 5(도구 선택 평가 하네스)가 같은 정의를 import 합니다.
+→ 예제 1의 docstring을 고치면 예제 5의 케이스로 바로 회귀 확인 가능 (두 사본이 어긋나지 않음)
+
+사용법:
+    from common.example_tools import TOOLS, calculate, get_weather, search_web
+
+    llm_with_tools = bind_tools_cached(llm, TOOLS)
+"""
+
+from common.calculator import evaluate
+from common.search_index import KeywordIndex
+
+
+def get_weather(city: str) -> str:
+    """
+    지정된 도시의 현재 날씨를 조회합니다.
+
+    실시간 날씨 정보가 필요할 때 사용하세요.
+
+    Args:
+        city: 날씨를 조회할 도시 이름 (예: "서울", "뉴욕")
+
+    Returns:
+        현재 날씨 정보 문자열
+    """
+    weather_data = {
+        "서울": "맑음, 기온 15도",
+        "뉴욕": "흐림, 기온 10도",
+        "도쿄": "비, 기온 18도",
+        "파리": "눈, 기온 2도"
+    }
+    return weather_data.get(city, f"{city}의 날씨 정보를 찾을 수 없습니다.")
+
+
+def calculate(expression: str) -> float:
+    """
+    수학 표현식을 계산합니다.
+
+    복잡한 수학 계산이 필요할 때 사용하세요.
+    예: "123 * 456", "(10 + 5) / 3", "2 ** 10"
+
+    Args:
+        expression: 계산할 수학 표현식 문자열
+
+    Returns:
+        계산 결과 (실수)
+    """
+    try:
+        # eval() 대신 AST 기반 계산기 (산술 연산만 허용, 표현식별 캐시)
+        result = evaluate(expression)
+        return float(result)
+    except Exception as e:
+        return f"계산 오류: {str(e)}"
+
+
+# 검색 결과 (키워드 → 결과)
+# 실제로는 검색 API를 호출하지만, 예제에서는 하드코딩
+SEARCH_RESULTS = {
+    "파이썬": "Python은 1991년 귀도 반 로섬이 개발한 프로그래밍 언어입니다.",
+    "langchain": "LangChain은 LLM 애플리케이션 개발을 위한 프레임워크입니다.",
+    "한강공원": "한강공원은 서울의 대표적인 야외 휴식 공간입니다."
+}
+# 키워드 인덱스는 로드 시 한 번만 생성
+search_index = KeywordIndex(SEARCH_RESULTS)
+
+
+def search_web(query: str) -> str:
+    """
+    웹에서 정보를 검색합니다.
+
+    실시간 정보나 최신 뉴스, 일반 지식 검색이 필요할 때 사용하세요.
+
+    Args:
+        query: 검색할 쿼리 문자열
+
+    Returns:
+        검색 결과 요약
+    """
+    # 질문에 포함된 키워드를 인덱스로 한 번에 찾음 (키워드 수와 무관하게 질문 길이에 비례)
+    key = search_index.first(query)
+    if key is not None:
+        return SEARCH_RESULTS[key]
+
+    return f"'{query}'에 대한 검색 결과: 관련 정보를 찾았습니다."
+
+
+# 바인딩 순서 (예제 1의 도구 번호와 같음)
+TOOLS = [get_weather, calculate, search_web]
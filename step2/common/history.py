@@ -0,0 +1,188 @@
+"""
+토큰 예산 기반 메시지 히스토리 압축
+
+수동 루프는 매 반복마다 HumanMessage / AIMessage / ToolMessage 전체를 다시 보내므로
+루프가 길어질수록 입력 토큰이 제곱으로 늘어납니다. LLM에 보내기 직전에 히스토리를 예산 안으로 줄입니다.
+
+- 원래 질문(첫 HumanMessage)과 최근 N개 턴은 그대로 유지
+  (텍스트 요약은 질문 앞에 두어 질문이 사람 턴의 마지막 내용으로 남게 함)
+- 1단계: 오래된 턴의 ToolMessage 내용을 짧은 요약으로 접음 (tool_call_id 쌍은 그대로)
+- 2단계: 그래도 넘치면 오래된 턴 전체(AIMessage tool_calls + ToolMessage들)를
+  텍스트 요약 하나로 대체 → tool_use / tool_result를 항상 함께 제거하므로 tool_call_id가 고아가 되지 않음
+- 요약은 LLM 호출 없이 결정적으로 생성 (도구 이름 + 인자 + 결과 앞부분)
+
+사용법:
+    history = HistoryManager(token_budget=1000, keep_recent_turns=2)
+    response = llm_with_tools.invoke(history.compact(messages))   # messages 원본은 그대로
+"""
+
+import json
+import math
+from typing import Callable, Dict, List, Optional, Sequence, Set
+
+from langchain_core.messages import AIMessage, BaseMessage, HumanMessage, ToolMessage
+
+# 메시지 하나당 역할/구분자 등 고정 오버헤드 (추정)
+MESSAGE_OVERHEAD = 4
+
+
+def estimate_tokens(messages: Sequence[BaseMessage]) -> int:
+    """메시지 목록의 토큰 수 추정 (UTF-8 바이트 / 4, 한글은 글자당 약 0.75토큰)
+
+    정확한 값은 응답의 usage_metadata["input_tokens"]로 확인하고,
+    예산 판단에는 API 호출 없이 계산할 수 있는 이 추정치를 사용합니다.
+    """
+    total = 0
+    for message in messages:
+        text = message.content if isinstance(message.content, str) else json.dumps(message.content, ensure_ascii=False)
+        if isinstance(message, AIMessage) and message.tool_calls:
+            text += json.dumps([[tc["name"], tc["args"]] for tc in message.tool_calls], ensure_ascii=False)
+        total += math.ceil(len(text.encode("utf-8")) / 4) + MESSAGE_OVERHEAD
+    return total
+
+
+def split_turns(messages: Sequence[BaseMessage]) -> List[List[BaseMessage]]:
+    """메시지를 턴 단위로 묶음: AIMessage(tool_calls) + 이어지는 ToolMessage들이 한 턴"""
+    turns: List[List[BaseMessage]] = []
+    for message in messages:
+        if isinstance(message, ToolMessage) and turns and isinstance(turns[-1][0], AIMessage):
+            turns[-1].append(message)
+        else:
+            turns.append([message])
+    return turns
+
+
+def find_orphans(messages: Sequence[BaseMessage]) -> List[str]:
+    """짝이 없는 tool_call_id 목록 (tool_use만 있거나 tool_result만 있는 경우)"""
+    requested, answered = [], set()
+    for message in messages:
+        if isinstance(message, AIMessage):
+            requested.extend(tc["id"] for tc in message.tool_calls)
+        elif isinstance(message, ToolMessage):
+            answered.add(message.tool_call_id)
+    return [i for i in requested if i not in answered] + sorted(answered - set(requested))
+
+
+class HistoryManager:
+    """LLM에 보낼 메시지 목록을 토큰 예산 안으로 압축"""
+
+    def __init__(
+        self,
+        token_budget: int = 2000,
+        keep_recent_turns: int = 2,
+        summary_chars: int = 60,
+        counter: Optional[Callable[[Sequence[BaseMessage]], int]] = None,
+    ):
+        """
+        Args:
+            token_budget: 압축 목표 토큰 수 (원래 질문 + 최근 턴이 이미 넘으면 그대로 보냄)
+            keep_recent_turns: 그대로 유지할 최근 턴 수
+            summary_chars: 요약에 남길 도구 결과 앞부분 길이
+            counter: 토큰 수 계산 함수 (기본: estimate_tokens)
+        """
+        self.token_budget = token_budget
+        self.keep_recent_turns = keep_recent_turns
+        self.summary_chars = summary_chars
+        self.counter = counter or estimate_tokens
+        self.stats = {"calls": 0, "compacted": 0, "folded_results": 0, "collapsed_turns": 0,
+                      "tokens_before": 0, "tokens_after": 0}
+        # compact()는 매 반복 같은 히스토리를 다시 압축하므로 통계는 처음 접은 결과 / 합친 턴만 집계
+        self._folded_ids: Set[str] = set()
+        self._collapsed_keys: Set[str] = set()
+
+    def _short(self, text: str) -> str:
+        text = " ".join(str(text).split())
+        return text if len(text) <= self.summary_chars else text[:self.summary_chars] + "…"
+
+    def _fold_results(self, turn: List[BaseMessage]) -> List[BaseMessage]:
+        """턴의 ToolMessage 내용을 요약으로 교체 (tool_call_id는 유지)"""
+        folded = [turn[0]]
+        for message in turn[1:]:
+            if isinstance(message, ToolMessage) and len(message.content) > self.summary_chars:
+                message = ToolMessage(
+                    content=f"[요약] {self._short(message.content)}",
+                    tool_call_id=message.tool_call_id,
+                    status=message.status,
+                )
+            folded.append(message)
+        return folded
+
+    @staticmethod
+    def _turn_key(turn: List[BaseMessage]) -> str:
+        """턴 식별자 (tool_call_id, 없으면 메시지 객체 id)"""
+        head = turn[0]
+        if isinstance(head, AIMessage) and head.tool_calls:
+            return head.tool_calls[0]["id"]
+        return f"message:{id(head)}"
+
+    def _summarize_turns(self, turns: List[List[BaseMessage]]) -> HumanMessage:
+        """여러 턴을 텍스트 요약 메시지 하나로 대체 (tool_use / tool_result 쌍을 함께 제거)"""
+        lines = []
+        for turn in turns:
+            head = turn[0]
+            if isinstance(head, AIMessage) and head.tool_calls:
+                results: Dict[str, str] = {m.tool_call_id: m.content for m in turn[1:] if isinstance(m, ToolMessage)}
+                for tc in head.tool_calls:
+                    args = ", ".join(f"{k}={v!r}" for k, v in tc["args"].items())
+                    lines.append(f"- {tc['name']}({args}) → {self._short(results.get(tc['id'], '(결과 없음)'))}")
+            elif head.content:
+                lines.append(f"- {type(head).__name__}: {self._short(head.content)}")
+        return HumanMessage(content="[이전 도구 실행 요약]\n" + "\n".join(lines))
+
+    def compact(self, messages: Sequence[BaseMessage]) -> List[BaseMessage]:
+        """예산을 넘으면 압축한 새 목록을 반환 (원본 messages는 변경하지 않음)"""
+        self.stats["calls"] += 1
+        before = self.counter(messages)
+        self.stats["tokens_before"] += before
+        if before <= self.token_budget or len(messages) <= 1:
+            self.stats["tokens_after"] += before
+            return list(messages)
+
+        question, turns = messages[0], split_turns(messages[1:])
+        cut = max(len(turns) - self.keep_recent_turns, 0)
+        old, recent = turns[:cut], turns[cut:]
+        folded = [self._fold_results(turn) for turn in old]
+
+        def assemble(collapsed: int) -> List[BaseMessage]:
+            # 앞쪽 collapsed개 턴은 원본 기준 텍스트 요약 하나로, 나머지 오래된 턴은 접은 상태로
+            # 요약을 질문 뒤에 두면 연속된 HumanMessage가 한 턴으로 합쳐져 질문이 요약 앞에 묻히므로 질문 앞에 둠
+            head = ([self._summarize_turns(old[:collapsed])] if collapsed else []) + [question]
+            return head + [m for turn in folded[collapsed:] + recent for m in turn]
+
+        # 1단계: 오래된 턴의 도구 결과를 요약으로 접기
+        collapsed = 0
+        compacted = assemble(collapsed)
+
+        # 2단계: 오래된 턴부터 하나씩 텍스트 요약으로 합치기
+        while self.counter(compacted) > self.token_budget and collapsed < len(old):
+            collapsed += 1
+            compacted = assemble(collapsed)
+
+        folded_ids = {
+            m.tool_call_id
+            for original, turn in zip(old[collapsed:], folded[collapsed:])
+            for m, before in zip(turn, original)
+            if m is not before
+        }
+        collapsed_keys = {self._turn_key(turn) for turn in old[:collapsed]}
+        self.stats["compacted"] += 1
+        self.stats["folded_results"] += len(folded_ids - self._folded_ids)
+        self.stats["collapsed_turns"] += len(collapsed_keys - self._collapsed_keys)
+        self._folded_ids |= folded_ids
+        self._collapsed_keys |= collapsed_keys
+        self.stats["tokens_after"] += self.counter(compacted)
+        return compacted
+
+    def get_report(self) -> str:
+        s = self.stats
+        saved = s["tokens_before"] - s["tokens_after"]
+        ratio = saved / s["tokens_before"] if s["tokens_before"] else 0.0
+        return f"""
+📊 히스토리 압축 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+토큰 예산: {self.token_budget} (최근 {self.keep_recent_turns}개 턴 유지)
+압축 적용: {s['compacted']}회 / 전체 {s['calls']}회
+요약으로 접은 도구 결과: {s['folded_results']}개 / 텍스트 요약으로 합친 턴: {s['collapsed_turns']}개
+추정 입력 토큰 합계: {s['tokens_before']} → {s['tokens_after']} ({ratio:.1%} 절감)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
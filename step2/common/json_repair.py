@@ -0,0 +1,295 @@
+"""
+LLM 출력 JSON 로컬 복구
+
+PydanticOutputParser는 JSON이 조금만 어긋나도 실패하고, 복구 방법은 LLM을 한 번 더 부르는 것
+(OutputFixingParser 등)뿐입니다. 흔한 문법 결함은 검증 전에 결정적으로 고치고,
+로컬 복구가 실패했을 때만 재요청(fallback)으로 넘깁니다.
+
+복구 항목:
+- fence: ```json ... ``` 마크다운 코드 펜스 제거
+- prose: JSON 앞뒤의 설명 문장 제거 (첫 '{' 또는 '['부터 짝이 맞는 괄호까지)
+- trailing_comma: '}' / ']' 앞의 후행 쉼표 제거
+- python_literal: True / False / None → true / false / null
+- coerce_number: 숫자 필드의 "2010년" 같은 문자열에서 숫자만 추출 (스키마 검증 에러 기준)
+  천 단위 구분자(1,999 / 1_999)는 제거하고, 숫자가 두 개 이상이면 ("1999~2000년") 추측하지 않음
+
+복구하지 않는 결함 (fallback 재요청):
+- 응답이 잘려 문자열/괄호가 닫히지 않음: 잘린 위치의 값({"year": 20...)이 온전한지 알 수 없으므로
+  괄호를 닫아 통과시키지 않고 재요청
+
+사용법:
+    from common.json_repair import RepairingParser
+
+    repair_parser = RepairingParser(MovieInfo, fallback=OutputFixingParser.from_llm(llm=llm, parser=parser))
+    chain = prompt | llm | StrOutputParser() | repair_parser.parse
+    ...
+    print(repair_parser.get_report())
+"""
+
+import json
+import re
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from common.schema_registry import registry
+
+
+# ============================================================================
+# 1. 문법 복구
+# ============================================================================
+
+_FENCE = re.compile(r"```(?:json|JSON)?\s*\n?(.*?)(?:```|$)", re.DOTALL)
+_NUMBER = re.compile(r"-?\d+(?:\.\d+)?")
+_DIGIT_SEPARATOR = re.compile(r"(?<=\d)[,_](?=\d)")
+_LITERALS = {"True": "true", "False": "false", "None": "null"}
+_NUMBER_ERRORS = {"int_parsing", "float_parsing", "int_from_float"}
+
+
+def _strip_fence(text: str, fixes: List[str]) -> str:
+    match = _FENCE.search(text)
+    if match:
+        fixes.append("fence")
+        return match.group(1)
+    return text
+
+
+def _scan(text: str, fixes: List[str]) -> str:
+    """문자열 내부를 건너뛰며 JSON 값 하나를 잘라내고 문법 결함을 고침
+
+    첫 '{' 또는 '['부터 짝이 맞는 닫는 괄호까지를 JSON으로 보고, 그 앞뒤는 버립니다.
+
+    Raises:
+        ValueError: 닫는 괄호 전에 응답이 끝남 (잘린 응답은 재요청 대상)
+    """
+    start = min((i for i in (text.find("{"), text.find("[")) if i >= 0), default=-1)
+    if start < 0:
+        return text
+    if text[:start].strip():
+        fixes.append("prose")
+
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = escape = False
+    i = start
+    n = len(text)
+    while i < n:
+        ch = text[i]
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]":
+            # 후행 쉼표: 닫는 괄호 직전의 공백이 아닌 마지막 문자가 ','
+            j = len(out) - 1
+            while j >= 0 and out[j].isspace():
+                j -= 1
+            if j >= 0 and out[j] == ",":
+                del out[j]
+                fixes.append("trailing_comma")
+            if stack:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                if text[i + 1:].strip():
+                    fixes.append("prose")
+                return "".join(out)
+            i += 1
+            continue
+        elif ch.isalpha():
+            # 문자열 밖의 식별자: Python 리터럴이면 JSON 리터럴로 변환
+            j = i
+            while j < n and text[j].isalpha():
+                j += 1
+            word = text[i:j]
+            if word in _LITERALS:
+                fixes.append("python_literal")
+                word = _LITERALS[word]
+            out.append(word)
+            i = j
+            continue
+        out.append(ch)
+        i += 1
+
+    # 응답이 잘림: 마지막 값이 중간에 끊겼을 수 있으므로 ("year": 20 → 2000?) 닫지 않고 재요청
+    raise ValueError(f"JSON이 완전히 닫히지 않았습니다 (응답이 잘림, 열린 괄호 {len(stack)}개"
+                     f"{', 문자열 안에서 끝남' if in_string else ''}).")
+
+
+def repair_json(text: str) -> Tuple[str, List[str]]:
+    """문법 결함을 고친 JSON 문자열과 적용한 복구 항목 목록을 반환
+
+    Raises:
+        ValueError: 응답이 잘려 JSON이 닫히지 않음
+    """
+    fixes: List[str] = []
+    text = _strip_fence(text.strip(), fixes)
+    text = _scan(text, fixes)
+    return text, list(dict.fromkeys(fixes))
+
+
+# ============================================================================
+# 2. 스키마 기반 값 보정
+# ============================================================================
+
+def _coerce_numbers(data: Any, error: ValidationError, fixes: List[str]) -> bool:
+    """숫자 필드 파싱 에러 위치의 문자열에서 숫자만 추출해 덮어씀
+
+    천 단위 구분자를 먼저 지우고 ("약 1,999년" → 1999), 숫자가 정확히 하나일 때만 고칩니다.
+    ("1999~2000년", "2시간 12분"처럼 여럿이면 어느 값인지 알 수 없으므로 그대로 두고 재요청)
+
+    Returns:
+        하나라도 고쳤으면 True
+    """
+    changed = False
+    for item in error.errors(include_url=False):
+        if item["type"] not in _NUMBER_ERRORS or not isinstance(item.get("input"), str):
+            continue
+        numbers = _NUMBER.findall(_DIGIT_SEPARATOR.sub("", item["input"]))
+        if len(numbers) != 1:
+            continue
+        target = data
+        try:
+            for part in item["loc"][:-1]:
+                target = target[part]
+            target[item["loc"][-1]] = numbers[0]
+        except (KeyError, IndexError, TypeError):
+            continue
+        changed = True
+    if changed:
+        fixes.append("coerce_number")
+    return changed
+
+
+# ============================================================================
+# 3. 복구 → 검증 → fallback 파서
+# ============================================================================
+
+class RepairingParser:
+    """로컬 복구를 먼저 시도하고, 실패할 때만 fallback(재요청)을 호출하는 파서
+
+    체인에서는 문자열을 받는 함수로 연결합니다:
+        chain = prompt | llm | StrOutputParser() | repair_parser.parse
+    """
+
+    def __init__(self, model: Type[BaseModel], fallback=None):
+        """
+        Args:
+            model: 검증할 Pydantic 모델
+            fallback: 로컬 복구 실패 시 parse(text)를 호출할 파서 (예: OutputFixingParser).
+                      None이면 마지막 검증 에러를 그대로 발생
+        """
+        self.model = model
+        self.validator = registry.get_validator(model)
+        self.fallback = fallback
+        self.stats = {
+            "total": 0,
+            "clean": 0,          # 복구 없이 바로 검증 통과
+            "repaired": 0,       # 로컬 복구 후 통과 (재요청 절약)
+            "fallback": 0,       # 재요청으로 복구
+            "failed": 0,         # 재요청까지 실패
+            "repair_time": 0.0,
+            "fallback_time": 0.0,
+            "fixes": {},
+        }
+        self._lock = threading.Lock()  # batch()는 스레드 풀에서 실행됨
+
+    def _record(self, outcome: str, fixes: List[str], repair_time: float, fallback_time: float = 0.0):
+        with self._lock:
+            self.stats["total"] += 1
+            self.stats[outcome] += 1
+            self.stats["repair_time"] += repair_time
+            self.stats["fallback_time"] += fallback_time
+            for fix in fixes:
+                self.stats["fixes"][fix] = self.stats["fixes"].get(fix, 0) + 1
+
+    def repair(self, text: str) -> Tuple[Optional[BaseModel], List[str], Optional[Exception]]:
+        """LLM 호출 없이 복구/검증만 시도
+
+        Returns:
+            (검증된 객체 또는 None, 적용한 복구 항목, 마지막 에러)
+        """
+        try:
+            return self.validator.validate_json(text), [], None
+        except ValidationError:
+            pass
+
+        fixes: List[str] = []
+        try:
+            fixed, fixes = repair_json(text)
+            data = json.loads(fixed)
+        except ValueError as e:  # json.JSONDecodeError 포함
+            return None, fixes, e
+
+        for _ in range(2):
+            try:
+                return self.validator.validate_python(data), fixes, None
+            except ValidationError as e:
+                last_error = e
+                if not _coerce_numbers(data, e, fixes):
+                    break
+        return None, fixes, last_error
+
+    def parse(self, text: str) -> BaseModel:
+        started = time.perf_counter()
+        result, fixes, error = self.repair(text)
+        repair_time = time.perf_counter() - started
+
+        if result is not None:
+            self._record("repaired" if fixes else "clean", fixes, repair_time)
+            return result
+
+        if self.fallback is None:
+            self._record("failed", fixes, repair_time)
+            raise error
+
+        started = time.perf_counter()
+        try:
+            result = self.fallback.parse(text)
+        except Exception:
+            self._record("failed", fixes, repair_time, time.perf_counter() - started)
+            raise
+        self._record("fallback", fixes, repair_time, time.perf_counter() - started)
+        return result
+
+    def summary(self) -> Dict[str, Any]:
+        s = dict(self.stats)
+        total = s["total"] or 1
+        s["repair_rate"] = s["repaired"] / total
+        s["fallback_rate"] = s["fallback"] / total
+        s["avg_fallback_time"] = s["fallback_time"] / s["fallback"] if s["fallback"] else None
+        return s
+
+    def get_report(self) -> str:
+        s = self.summary()
+        fixes = ", ".join(f"{name} {count}회" for name, count in s["fixes"].items()) or "없음"
+        if s["avg_fallback_time"] is not None:
+            saved = f"약 {s['repaired'] * s['avg_fallback_time']:.2f}초 (재요청 평균 {s['avg_fallback_time']:.2f}초 기준)"
+        else:
+            saved = "측정 불가 (이번 실행에서 재요청 없음)"
+        return f"""
+📊 JSON 복구 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+전체 파싱: {s['total']}회
+  - 바로 통과: {s['clean']}회
+  - 로컬 복구: {s['repaired']}회 ({s['repair_rate']:.1%})
+  - 재요청: {s['fallback']}회 ({s['fallback_rate']:.1%})
+  - 실패: {s['failed']}회
+적용한 복구: {fixes}
+로컬 복구 소요: {s['repair_time'] * 1000:.2f}ms
+절약한 LLM 호출: {s['repaired']}회 / 절약한 시간: {saved}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
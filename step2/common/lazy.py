@@ -0,0 +1,38 @@
+"""
+지연 import 유틸리티
+
+langchain_anthropic 등 LLM 스택은 import에만 1초 이상 걸립니다.
+프롬프트 생성이나 인자 확인처럼 LLM을 호출하지 않는 경로에서는
+이 비용을 내지 않도록, 실제로 사용하는 시점까지 import를 미룹니다.
+
+사용법:
+    from common.lazy import lazy_module
+
+    langchain_anthropic = lazy_module("langchain_anthropic")  # 아직 import 안 됨
+    llm = langchain_anthropic.ChatAnthropic(...)               # 이 시점에 import
+"""
+
+import importlib.util
+import sys
+from types import ModuleType
+
+
+def lazy_module(name: str) -> ModuleType:
+    """모듈 객체를 바로 반환하고, 실제 모듈 코드는 첫 속성 접근 시 실행
+
+    이미 import된 모듈이면 그대로 반환합니다.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named '{name}'", name=name)
+
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
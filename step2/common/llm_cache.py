@@ -0,0 +1,215 @@
+"""
+temperature=0 호출용 SQLite 응답 캐시
+
+- LangChain BaseCache 구현 → set_llm_cache()로 등록하면 네트워크 호출 전에 조회
+- 캐시 키: llm_string(모델, temperature, bind_tools로 바인딩된 도구 스키마 포함)
+           + 렌더링된 메시지 목록(prompt)
+- 크기 기반(max_entries) / 기간 기반(max_age) LRU 삭제
+- hit / miss / skip 카운터 기록
+
+사용법:
+    from common.llm_cache import enable_llm_cache_from_env
+
+    # .env에 LLM_CACHE_PATH=.llm_cache.sqlite 가 있으면 캐시 활성화
+    llm_cache = enable_llm_cache_from_env()
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import warnings
+from typing import Any, Dict, Optional
+
+from langchain_core._api import LangChainBetaWarning
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.globals import set_llm_cache
+from langchain_core.load import dumps, loads
+
+
+def is_deterministic(llm_string: str) -> bool:
+    """llm_string에서 temperature를 읽어 0인지 확인
+
+    llm_string 형식: "<직렬화된 모델 JSON>---<호출 파라미터>"
+    모델이 직렬화되지 않는 경우 등 판단할 수 없으면 캐시하지 않습니다.
+    """
+    model_part = llm_string.split("---", 1)[0]
+    try:
+        kwargs = json.loads(model_part).get("kwargs", {})
+    except (json.JSONDecodeError, AttributeError):
+        return False
+    return float(kwargs.get("temperature", 1.0)) == 0.0
+
+
+class SQLiteLRUCache(BaseCache):
+    """SQLite에 저장되는 LRU 응답 캐시"""
+
+    def __init__(
+        self,
+        path: str = ".llm_cache.sqlite",
+        max_entries: Optional[int] = 10000,
+        max_age: Optional[float] = None,
+        deterministic_only: bool = True,
+    ):
+        """
+        Args:
+            path: SQLite 파일 경로
+            max_entries: 최대 저장 개수 (초과 시 가장 오래 사용되지 않은 항목부터 삭제)
+            max_age: 항목 유효 기간(초). None이면 기간 제한 없음
+            deterministic_only: True면 temperature=0 호출만 캐시
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.deterministic_only = deterministic_only
+        self.stats = {"hits": 0, "misses": 0, "skipped": 0, "evictions": 0}
+
+        # batch()의 스레드 풀에서도 사용하므로 연결 하나를 락으로 보호
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS llm_cache (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_access REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_llm_cache_last_access ON llm_cache(last_access)"
+        )
+        self._conn.commit()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+    @staticmethod
+    def _key(prompt: str, llm_string: str) -> str:
+        return hashlib.sha256(f"{llm_string}\x00{prompt}".encode("utf-8")).hexdigest()
+
+    def _cacheable(self, llm_string: str) -> bool:
+        return not self.deterministic_only or is_deterministic(llm_string)
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        if not self._cacheable(llm_string):
+            self.stats["skipped"] += 1
+            return None
+
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+
+            if row is not None and self.max_age is not None and now - row[1] > self.max_age:
+                # 기간 만료 → 삭제 후 miss 처리
+                self._conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._count -= 1
+                self.stats["evictions"] += 1
+                row = None
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key)
+            )
+            self._conn.commit()
+            self.stats["hits"] += 1
+
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", LangChainBetaWarning)  # load()는 beta API
+            return loads(row[0])
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        if not self._cacheable(llm_string):
+            return
+
+        key = self._key(prompt, llm_string)
+        now = time.time()
+        value = dumps(return_val)
+        with self._lock:
+            existed = self._conn.execute(
+                "SELECT 1 FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_access) "
+                "VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            if not existed:
+                self._count += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """기간 만료 항목과 max_entries 초과분(LRU 순) 삭제 (락을 잡은 상태에서 호출)"""
+        if self.max_age is not None:
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (time.time() - self.max_age,)
+            )
+            self._count -= cursor.rowcount
+            self.stats["evictions"] += cursor.rowcount
+
+        if self.max_entries is not None and self._count > self.max_entries:
+            overflow = self._count - self.max_entries
+            cursor = self._conn.execute(
+                "DELETE FROM llm_cache WHERE key IN "
+                "(SELECT key FROM llm_cache ORDER BY last_access ASC LIMIT ?)",
+                (overflow,),
+            )
+            self._count -= cursor.rowcount
+            self.stats["evictions"] += cursor.rowcount
+
+    def clear(self, **kwargs: Any) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM llm_cache")
+            self._conn.commit()
+            self._count = 0
+
+    def summary(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": self._count,
+            "hit_rate": self.stats["hits"] / lookups * 100 if lookups else 0.0,
+        }
+
+    def get_report(self) -> str:
+        s = self.summary()
+        return (
+            f"💾 LLM 캐시 ({self.path}): "
+            f"hit {s['hits']} / miss {s['misses']} / skip {s['skipped']} "
+            f"(적중률 {s['hit_rate']:.1f}%, 저장 {s['entries']}개, 삭제 {s['evictions']}개)"
+        )
+
+
+def enable_llm_cache(path: str = ".llm_cache.sqlite", **kwargs) -> SQLiteLRUCache:
+    """SQLiteLRUCache를 생성하여 전역 LLM 캐시로 등록"""
+    cache = SQLiteLRUCache(path, **kwargs)
+    set_llm_cache(cache)
+    return cache
+
+
+def enable_llm_cache_from_env() -> Optional[SQLiteLRUCache]:
+    """환경 변수 설정이 있을 때만 캐시 활성화
+
+    - LLM_CACHE_PATH: SQLite 파일 경로 (없으면 캐시 사용 안 함)
+    - LLM_CACHE_MAX_ENTRIES: 최대 저장 개수 (기본 10000)
+    - LLM_CACHE_MAX_AGE: 유효 기간(초, 기본 제한 없음)
+    """
+    path = os.getenv("LLM_CACHE_PATH")
+    if not path:
+        return None
+
+    max_age = os.getenv("LLM_CACHE_MAX_AGE")
+    return enable_llm_cache(
+        path,
+        max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", "10000")),
+        max_age=float(max_age) if max_age else None,
+    )
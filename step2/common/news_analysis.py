@@ -0,0 +1,69 @@
+"""
+뉴스 기사 통합 분석 (5개 분석을 한 번의 구조화 호출로)
+
+phase5 예제 4는 요약 / 감정 / 주제 / 키워드 / 개체명을 RunnableParallel의 5개 체인으로 나눠,
+같은 기사 본문을 입력 토큰으로 5번 보냅니다.
+fused 모드는 기사를 한 번만 보내고 5개 분석을 하나의 Pydantic 모델로 받습니다.
+
+- ArticleAnalysis: tool calling(with_structured_output)으로 받는 분석 결과 스키마
+- to_report_fields(): 예제 4의 report["analysis"]와 같은 모양 (분석 이름 → 문자열)으로 변환
+  → integrate_and_validate / format_final_output을 그대로 사용
+
+사용법:
+    from common.news_analysis import build_fused_analyzer, to_report_fields
+
+    fused_analyzer = build_fused_analyzer(llm)
+    fields = to_report_fields(fused_analyzer.invoke({"article": article}))
+"""
+
+from typing import Dict, List, Literal
+
+from pydantic import BaseModel, Field
+
+from common.structured_output import structured_chain
+
+# report["analysis"]의 키 순서 (예제 4의 RunnableParallel 분석 이름)
+ANALYSIS_FIELDS = ["summary", "sentiment", "topic", "keywords", "entities"]
+
+FUSED_ANALYSIS_TEMPLATE = """다음 영문 기사를 분석해주세요.
+
+1. 요약: 3문장 이내의 한국어 요약
+2. 감정: 긍정적/중립적/부정적 중 하나
+3. 주제: Technology/Health/Politics/Business/Other 중 하나
+4. 핵심 키워드 5개
+5. 주요 인물, 조직, 장소
+
+{article}"""
+
+
+class ArticleAnalysis(BaseModel):
+    """뉴스 기사 분석 결과 (요약, 감정, 주제, 키워드, 개체명)"""
+    summary: str = Field(description="3문장 이내의 한국어 요약")
+    sentiment: Literal["긍정적", "중립적", "부정적"] = Field(description="기사의 전반적인 감정")
+    topic: Literal["Technology", "Health", "Politics", "Business", "Other"] = Field(description="기사 주제")
+    keywords: List[str] = Field(description="핵심 키워드 5개", min_length=1)
+    people: List[str] = Field(default_factory=list, description="주요 인물")
+    organizations: List[str] = Field(default_factory=list, description="주요 조직")
+    places: List[str] = Field(default_factory=list, description="주요 장소")
+
+
+def build_fused_analyzer(llm, include_raw: bool = False):
+    """기사 → ArticleAnalysis 체인 (include_raw=True면 usage_metadata 확인용 raw 포함)"""
+    from langchain_core.prompts import PromptTemplate
+
+    return structured_chain(PromptTemplate.from_template(FUSED_ANALYSIS_TEMPLATE), llm, ArticleAnalysis, include_raw=include_raw)
+
+
+def to_report_fields(analysis: ArticleAnalysis) -> Dict[str, str]:
+    """ArticleAnalysis → 예제 4의 분석 결과와 같은 {분석 이름: 문자열}"""
+    entities = [
+        f"{label}: {', '.join(values) if values else '없음'}"
+        for label, values in (("인물", analysis.people), ("조직", analysis.organizations), ("장소", analysis.places))
+    ]
+    return {
+        "summary": analysis.summary,
+        "sentiment": analysis.sentiment,
+        "topic": analysis.topic,
+        "keywords": ", ".join(analysis.keywords[:5]),
+        "entities": "\n".join(entities),
+    }
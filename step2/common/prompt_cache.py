@@ -0,0 +1,155 @@
+"""
+공유 접두사 프롬프트 캐싱 (같은 기사를 여러 분석 체인에 보낼 때)
+
+phase5 예제 2~4의 분석 체인은 모두 "짧은 지시문 + 같은 {article}" 프롬프트라서
+기사가 길수록 같은 입력 토큰을 분석 개수만큼 반복해서 처리 / 과금합니다.
+기사를 모든 체인에 공통인 앞부분(system 블록)으로 옮기고 Anthropic 프롬프트 캐시를 지정합니다.
+
+- shared_prefix_prompt(): [system: 기사 (cache_control), human: 분석별 지시문] 메시지 생성
+  → 지시문이 뒤에 오므로 모든 분석의 프롬프트 앞부분이 바이트 단위로 같아짐
+- 캐시는 첫 응답이 시작된 뒤에야 읽을 수 있으므로 동시에 보낸 요청은 모두 캐시 미스 (쓰기 비용만 발생)
+  → shared_prefix_parallel(): 기사가 캐시 최소 길이 이상이면 첫 분석을 먼저 실행(캐시 기록)한 뒤 나머지를 병렬 실행
+- 최소 길이 미만의 접두사는 API가 캐시하지 않음 (claude-3-haiku 2048토큰, Sonnet/Opus 1024토큰)
+  → 짧은 기사는 그대로 전부 병렬 실행 (캐시 읽기 0이 정상)
+- PromptCacheUsage: 분석(branch)별 캐시 읽기 / 캐시 쓰기 / 일반 입력 / 출력 토큰 집계
+
+사용법:
+    llm = ChatAnthropic(model="claude-3-haiku-20240307", default_headers=PROMPT_CACHING_HEADERS)
+    cache_usage = PromptCacheUsage()
+
+    summarizer = shared_prefix_prompt("위 기사를 3문장 이내로 요약해주세요.") | llm | cache_usage.track("summary") | StrOutputParser()
+    parallel = shared_prefix_parallel({"summary": summarizer, "sentiment": sentiment_analyzer})
+    print(cache_usage.get_report())
+"""
+
+import math
+import threading
+from typing import Any, Dict, Optional
+
+from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.runnables import RunnableLambda, RunnableParallel
+
+# langchain-anthropic 0.1.x / anthropic 베타 기간의 프롬프트 캐시 활성화 헤더
+PROMPT_CACHING_HEADERS = {"anthropic-beta": "prompt-caching-2024-07-31"}
+
+# 캐시 가능한 최소 접두사 길이 (claude-3-haiku 기준)
+MIN_CACHEABLE_TOKENS = 2048
+
+ARTICLE_PREFIX = "다음은 분석할 영문 기사입니다:\n\n{article}"
+
+
+def shared_prefix_prompt(instruction: str, variable: str = "article") -> RunnableLambda:
+    """입력 → [SystemMessage(기사, 캐시 지정), HumanMessage(지시문)]"""
+
+    def build_messages(inputs: Dict[str, Any]):
+        prefix = {
+            "type": "text",
+            "text": ARTICLE_PREFIX.format(article=inputs[variable]),
+            "cache_control": {"type": "ephemeral"},
+        }
+        return [SystemMessage(content=[prefix]), HumanMessage(content=instruction)]
+
+    return RunnableLambda(build_messages)
+
+
+def estimate_prefix_tokens(text: str) -> int:
+    """접두사 토큰 수 추정 (UTF-8 바이트 / 4, common.history와 같은 기준)"""
+    return math.ceil(len(ARTICLE_PREFIX.format(article=text).encode("utf-8")) / 4)
+
+
+def shared_prefix_parallel(branches: Dict[str, Any], variable: str = "article", min_tokens: int = MIN_CACHEABLE_TOKENS) -> RunnableLambda:
+    """RunnableParallel(branches)와 같은 결과, 캐시 가능한 길이면 첫 분석을 먼저 실행
+
+    첫 분석의 응답으로 캐시가 기록된 뒤 나머지 분석이 동시에 캐시를 읽습니다.
+    (첫 분석 1회만큼 지연 시간이 늘어나는 대신 나머지 분석의 기사 토큰은 캐시 읽기 가격)
+    """
+    names = list(branches)
+    parallel = RunnableParallel(branches)
+    rest = RunnableParallel({name: branches[name] for name in names[1:]})
+
+    def run_branches(inputs: Dict[str, Any], config) -> Dict[str, Any]:
+        if estimate_prefix_tokens(inputs[variable]) < min_tokens:
+            return parallel.invoke(inputs, config)
+        results = {names[0]: branches[names[0]].invoke(inputs, config)}
+        results.update(rest.invoke(inputs, config))
+        return {name: results[name] for name in names}
+
+    return RunnableLambda(run_branches)
+
+
+def cache_usage(message) -> Dict[str, int]:
+    """AIMessage의 캐시 읽기 / 캐시 쓰기 / 일반 입력 / 출력 토큰
+
+    langchain-anthropic 0.1.x는 usage_metadata에 캐시 토큰이 없고 input_tokens가 캐시 제외 값이므로
+    response_metadata["usage"]를 읽고, 최신 버전의 input_token_details(입력 합계 기준)도 지원합니다.
+    """
+    usage = getattr(message, "usage_metadata", None) or {}
+    details = usage.get("input_token_details") or {}
+    raw = (getattr(message, "response_metadata", None) or {}).get("usage") or {}
+
+    if details:
+        cache_read = details.get("cache_read") or 0
+        cache_creation = details.get("cache_creation") or 0
+        uncached = usage.get("input_tokens", 0) - cache_read - cache_creation
+    else:
+        cache_read = raw.get("cache_read_input_tokens") or 0
+        cache_creation = raw.get("cache_creation_input_tokens") or 0
+        uncached = usage.get("input_tokens", raw.get("input_tokens", 0))
+    return {
+        "input_tokens": uncached,
+        "cache_read": cache_read,
+        "cache_creation": cache_creation,
+        "output_tokens": usage.get("output_tokens", raw.get("output_tokens", 0)),
+    }
+
+
+class PromptCacheUsage:
+    """분석(branch)별 프롬프트 캐시 토큰 집계"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def record(self, branch: str, message) -> Dict[str, int]:
+        usage = cache_usage(message)
+        with self._lock:
+            s = self.stats.setdefault(branch, {"calls": 0, "input_tokens": 0, "cache_read": 0, "cache_creation": 0, "output_tokens": 0})
+            s["calls"] += 1
+            for key, value in usage.items():
+                s[key] += value
+        return usage
+
+    def track(self, branch: str) -> RunnableLambda:
+        """llm 뒤에 연결: 응답(AIMessage)의 토큰을 기록하고 그대로 전달"""
+
+        def record_usage(message):
+            self.record(branch, message)
+            return message
+
+        return RunnableLambda(record_usage)
+
+    def summary(self, branch: Optional[str] = None) -> Dict[str, Any]:
+        rows = [self.stats[branch]] if branch else list(self.stats.values())
+        total = {key: sum(s[key] for s in rows) for key in ("calls", "input_tokens", "cache_read", "cache_creation", "output_tokens")}
+        prompt_tokens = total["input_tokens"] + total["cache_read"] + total["cache_creation"]
+        total["cache_hit_rate"] = total["cache_read"] / prompt_tokens if prompt_tokens else 0.0
+        return total
+
+    def get_report(self) -> str:
+        lines = [
+            f"  - {branch}: {s['calls']}회, 캐시 읽기 {s['cache_read']} / 캐시 쓰기 {s['cache_creation']} / "
+            f"일반 입력 {s['input_tokens']} / 출력 {s['output_tokens']}"
+            for branch, s in self.stats.items()
+        ]
+        total = self.summary()
+        note = ""
+        if total["calls"] and not (total["cache_read"] or total["cache_creation"]):
+            note = f"\n(캐시 토큰 0: 기사 접두사가 최소 길이 {MIN_CACHEABLE_TOKENS}토큰 미만이면 캐시되지 않음)"
+        return f"""
+📊 프롬프트 캐시 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+입력 토큰 중 캐시 읽기: {total['cache_hit_rate']:.1%} (캐시 읽기 {total['cache_read']} / 캐시 쓰기 {total['cache_creation']} / 일반 입력 {total['input_tokens']})
+분석별:
+{chr(10).join(lines) or '  (호출 없음)'}{note}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
@@ -0,0 +1,124 @@
+"""
+Pydantic 모델별 스키마 / 포맷 지시문 레지스트리
+
+PydanticOutputParser.get_format_instructions()는 호출할 때마다 JSON 스키마를 새로 만들고
+문자열로 직렬화합니다. 같은 모델 클래스에 대해 아래 항목을 프로세스 전체에서 한 번만 만들어 재사용합니다.
+
+- PydanticOutputParser
+- JSON 스키마 (dict)
+- 포맷 지시문 문자열
+- 미리 컴파일된 검증기 (TypeAdapter: 단일 객체 / 리스트 / 실패 원소를 남기는 리스트)
+
+사용법:
+    from common.schema_registry import registry
+
+    registry.warm_up(MovieInfo)                          # 프로세스 시작 시 (선택)
+    parser = registry.get_parser(MovieInfo)
+    format_instructions = registry.get_format_instructions(MovieInfo)
+"""
+
+import threading
+import time
+from typing import Annotated, Any, Dict, List, Type, Union
+
+from pydantic import BaseModel, Field, TypeAdapter
+
+
+class SchemaEntry:
+    """모델 클래스 하나에 대한 캐시 항목
+
+    검증기와 JSON 스키마는 바로 만들고, LangChain이 필요한 parser와 포맷 지시문은
+    처음 사용할 때 만듭니다 (검증만 하는 경로에서 langchain import 비용을 내지 않도록).
+    """
+
+    def __init__(self, model: Type[BaseModel]):
+        self.model = model
+        self.json_schema = model.model_json_schema()
+        self.validator = TypeAdapter(model)
+        self.list_validator = TypeAdapter(List[model])
+        # 검증에 실패한 원소는 예외 대신 원본 값 그대로 남기는 리스트 검증기 (일괄 검증용)
+        self.lenient_list_validator = TypeAdapter(
+            List[Annotated[Union[model, Any], Field(union_mode="left_to_right")]]
+        )
+        self._parser = None
+        self._format_instructions = None
+
+    @property
+    def parser(self):
+        if self._parser is None:
+            from langchain.output_parsers import PydanticOutputParser
+
+            self._parser = PydanticOutputParser(pydantic_object=self.model)
+        return self._parser
+
+    @property
+    def format_instructions(self) -> str:
+        if self._format_instructions is None:
+            self._format_instructions = self.parser.get_format_instructions()
+        return self._format_instructions
+
+
+class SchemaRegistry:
+    """모델 클래스를 키로 SchemaEntry를 보관하는 프로세스 전역 레지스트리"""
+
+    def __init__(self):
+        self._entries: Dict[Type[BaseModel], SchemaEntry] = {}
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "builds": 0, "build_time": 0.0}
+
+    def get(self, model: Type[BaseModel]) -> SchemaEntry:
+        entry = self._entries.get(model)
+        if entry is not None:
+            self.stats["hits"] += 1
+            return entry
+
+        with self._lock:
+            # 다른 스레드가 먼저 만들었을 수 있으므로 한 번 더 확인
+            entry = self._entries.get(model)
+            if entry is None:
+                started = time.perf_counter()
+                entry = SchemaEntry(model)
+                self.stats["build_time"] += time.perf_counter() - started
+                self.stats["builds"] += 1
+                self._entries[model] = entry
+        return entry
+
+    def get_parser(self, model: Type[BaseModel]):
+        return self.get(model).parser
+
+    def get_json_schema(self, model: Type[BaseModel]) -> Dict[str, Any]:
+        return self.get(model).json_schema
+
+    def get_format_instructions(self, model: Type[BaseModel]) -> str:
+        return self.get(model).format_instructions
+
+    def get_validator(self, model: Type[BaseModel]) -> TypeAdapter:
+        return self.get(model).validator
+
+    def get_list_validator(self, model: Type[BaseModel]) -> TypeAdapter:
+        return self.get(model).list_validator
+
+    def get_lenient_list_validator(self, model: Type[BaseModel]) -> TypeAdapter:
+        return self.get(model).lenient_list_validator
+
+    def warm_up(self, *models: Type[BaseModel]) -> float:
+        """프로세스 시작 시 항목을 미리 생성 (첫 요청이 스키마 생성 비용을 내지 않도록)
+
+        Returns:
+            소요 시간(초)
+        """
+        started = time.perf_counter()
+        for model in models:
+            entry = self.get(model)
+            entry.format_instructions  # parser와 포맷 지시문까지 생성
+            # 검증기 내부 지연 초기화까지 끝내 두기 위해 빈 리스트를 한 번 검증
+            entry.list_validator.validate_python([])
+        return time.perf_counter() - started
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+# 프로세스 전역 인스턴스
+registry = SchemaRegistry()
@@ -0,0 +1,203 @@
+"""
+검색 도구용 인덱스 (search_web / search_news)
+
+예제의 검색 도구는 질문마다 모든 키/제목을 순회하며 `key in query` 비교를 하므로,
+문서 수가 늘어나면 질문 하나의 비용이 문서 수에 비례해 커집니다.
+로드 시점에 인덱스를 한 번 만들어 두고 질문마다 조회만 합니다.
+
+- KeywordIndex: Aho-Corasick 오토마톤, 질문 텍스트 안에 등장하는 키워드를 한 번의 스캔으로 모두 찾음
+  (search_web처럼 "키워드가 질문에 포함되는가")
+- NgramIndex: 문자 n-gram 역색인, 질문이 부분 문자열로 포함된 문서를 찾음
+  (search_news처럼 "질문이 제목/분류에 포함되는가", 띄어쓰기 없는 한국어도 그대로 동작)
+- LinearScanIndex: 기존 방식과 같은 순회 (비교 기준, 결과 검증용)
+
+세 클래스 모두 search(text)가 같은 의미의 결과를 입력 순서대로 반환하므로 서로 바꿔 쓸 수 있습니다.
+
+사용법:
+    keyword_index = KeywordIndex(["파이썬", "langchain"])
+    keyword_index.first("LangChain이 뭐야?")          # "langchain"
+
+    news_index = NgramIndex({"AI 기술": ("AI 기술", "AI 기술 혁신")})
+    news_index.search("ai")                           # ["AI 기술"]
+"""
+
+from array import array
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Union
+
+Fields = Union[str, Sequence[str]]
+
+
+def _fields(value: Fields) -> List[str]:
+    return [value.lower()] if isinstance(value, str) else [field.lower() for field in value]
+
+
+# ============================================================================
+# 1. 키워드 → 텍스트 포함 검색 (Aho-Corasick)
+# ============================================================================
+
+
+class KeywordIndex:
+    """텍스트에 포함된 키워드 찾기 (대소문자 무시)"""
+
+    def __init__(self, keywords: Iterable[str]):
+        self.keywords: List[str] = list(dict.fromkeys(keywords))
+
+        # 트라이: 노드별 전이(dict), 실패 링크, 이 노드에서 끝나는 키워드 번호,
+        # 출력 링크 (실패 링크를 따라가다 처음 만나는 키워드 끝 노드)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail = array("l", [0])
+        self._match = array("l", [-1])
+        self._output = array("l", [0])
+
+        for number, keyword in enumerate(self.keywords):
+            node = 0
+            for char in keyword.lower():
+                child = self._goto[node].get(char)
+                if child is None:
+                    child = len(self._goto)
+                    self._goto[node][char] = child
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._match.append(-1)
+                    self._output.append(0)
+                node = child
+            if self._match[node] < 0:
+                # 소문자로 같은 키워드가 여럿이면 먼저 등록된 것 사용
+                self._match[node] = number
+
+        # 너비 우선으로 실패 링크 계산 (루트의 자식은 루트로 실패)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                target = self._fail[child]
+                self._output[child] = target if self._match[target] >= 0 else self._output[target]
+
+    def _scan(self, text: str):
+        """텍스트를 한 번 훑으며 등장한 키워드 번호를 생성"""
+        goto, fail, match, output = self._goto, self._fail, self._match, self._output
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            hit = node if match[node] >= 0 else output[node]
+            while hit:
+                yield match[hit]
+                hit = output[hit]
+
+    def search(self, text: str) -> List[str]:
+        """텍스트에 포함된 키워드 목록 (등록 순서)"""
+        return [self.keywords[number] for number in sorted(set(self._scan(text)))]
+
+    def first(self, text: str) -> Optional[str]:
+        """텍스트에 포함된 키워드 중 가장 먼저 등록된 것 (없으면 None)"""
+        number = min(self._scan(text), default=-1)
+        return self.keywords[number] if number >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self.keywords)
+
+
+# ============================================================================
+# 2. 질문 → 문서 부분 문자열 검색 (문자 n-gram 역색인)
+# ============================================================================
+
+
+class NgramIndex:
+    """질문이 필드 중 하나에 부분 문자열로 포함된 문서 찾기 (대소문자 무시)
+
+    문서의 모든 필드에서 문자 n-gram을 뽑아 n-gram → 문서 번호 목록을 만들어 둡니다.
+    질문에 포함된 n-gram 중 문서 수가 가장 적은 것의 문서만 후보로 보고,
+    후보마다 실제 포함 여부를 확인하므로 결과는 순회 방식과 같습니다.
+    """
+
+    def __init__(self, documents: Dict[Hashable, Fields], n: int = 2):
+        """
+        Args:
+            documents: 문서 키 → 검색 대상 필드 (문자열 또는 문자열 목록)
+            n: n-gram 길이 (한국어는 2글자가 기본)
+        """
+        self.n = n
+        self.keys: List[Hashable] = list(documents)
+        self._fields: List[List[str]] = [_fields(documents[key]) for key in self.keys]
+        self._postings: Dict[str, array] = {}
+
+        for number, fields in enumerate(self._fields):
+            grams = set()
+            for field in fields:
+                # n보다 짧은 필드는 필드 전체를 하나의 gram으로 색인
+                grams.update(field[i:i + n] for i in range(max(len(field) - n + 1, 1)))
+            for gram in grams:
+                posting = self._postings.get(gram)
+                if posting is None:
+                    posting = self._postings[gram] = array("l")
+                posting.append(number)
+
+    def _candidates(self, query: str) -> Iterable[int]:
+        if not query:
+            return range(len(self.keys))
+        if len(query) >= self.n:
+            grams = {query[i:i + self.n] for i in range(len(query) - self.n + 1)}
+            postings = [self._postings.get(gram) for gram in grams]
+            if any(posting is None for posting in postings):
+                return ()
+            return min(postings, key=len)
+        # n보다 짧은 질문: 질문을 포함하는 gram들의 문서를 합침 (gram 종류 수만큼만 확인)
+        numbers = set()
+        for gram, posting in self._postings.items():
+            if query in gram:
+                numbers.update(posting)
+        return sorted(numbers)
+
+    def search(self, query: str) -> List[Hashable]:
+        """질문을 포함하는 문서 키 목록 (문서 등록 순서)"""
+        query = query.lower()
+        return [
+            self.keys[number]
+            for number in self._candidates(query)
+            if any(query in field for field in self._fields[number])
+        ]
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+# ============================================================================
+# 3. 기준 구현 (순회)
+# ============================================================================
+
+
+class LinearScanIndex:
+    """인덱스 없이 매번 순회 (기존 도구 구현과 같은 방식)
+
+    mode="keyword": 텍스트에 포함된 키워드 (KeywordIndex와 같은 의미)
+    mode="substring": 질문을 포함하는 문서 (NgramIndex와 같은 의미)
+    """
+
+    def __init__(self, documents: Union[Iterable[str], Dict[Hashable, Fields]], mode: str = "substring"):
+        if mode == "keyword":
+            self.keys = list(dict.fromkeys(documents))
+            self._fields = [[key.lower()] for key in self.keys]
+        else:
+            self.keys = list(documents)
+            self._fields = [_fields(documents[key]) for key in self.keys]
+        self.mode = mode
+
+    def search(self, text: str) -> List[Hashable]:
+        text = text.lower()
+        if self.mode == "keyword":
+            return [key for key, fields in zip(self.keys, self._fields) if fields[0] in text]
+        return [key for key, fields in zip(self.keys, self._fields) if any(text in field for field in fields)]
+
+    def first(self, text: str) -> Optional[Hashable]:
+        return next(iter(self.search(text)), None)
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,164 @@
+"""
+추측(speculative) 도구 실행
+
+Function Calling 흐름은 LLM 1차 호출 → 도구 실행 → LLM 2차 호출이 순서대로 이어져,
+느린 도구(외부 API)의 지연이 그대로 사용자 지연에 더해집니다.
+
+질문 텍스트에서 도구 인자를 로컬로 추측할 수 있으면 (예: 알려진 도시 이름),
+LLM 1차 호출과 동시에 도구를 미리 실행해 둡니다.
+- LLM이 요청한 호출과 일치하면 미리 계산한 결과 사용 (hit)
+- 일치하지 않으면 평소처럼 실행 (miss), 사용하지 않은 추측 결과는 버림 (wasted)
+- 추측 실행은 ToolRegistry 통계에 바로 기록하지 않고, 사용된 경우(hit)에만 기록
+  → registry.get_report()의 호출 수는 LLM이 실제로 요청한 호출 수와 같음
+
+사용법:
+    speculator = SpeculativeExecutor(tool_registry, {
+        "get_weather": keyword_predictor("city", ["서울", "부산", "제주"]),
+    })
+    speculation = speculator.start(user_query)         # LLM 호출 전에
+    response = llm_with_tools.invoke(messages)
+    for tool_call in response.tool_calls:
+        result = speculator.resolve(speculation, tool_call)
+    speculator.finish(speculation)
+    print(speculator.get_report())
+    speculator.close()                                 # 스레드 풀 종료
+"""
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+from common.tool_registry import ToolRegistry
+
+# 질문 → 추측한 인자 dict 목록
+Predictor = Callable[[str], List[Dict[str, Any]]]
+
+
+def keyword_predictor(arg_name: str, keywords: Iterable[str]) -> Predictor:
+    """질문에 등장하는 키워드마다 {arg_name: 키워드} 인자를 추측하는 함수 생성
+
+    긴 키워드부터 매칭하도록 정규식을 한 번만 컴파일합니다 (예: "서울시"가 "서울"보다 우선).
+    """
+    ordered = sorted(set(keywords), key=len, reverse=True)
+    pattern = re.compile("|".join(re.escape(keyword) for keyword in ordered))
+
+    def predict(query: str) -> List[Dict[str, Any]]:
+        found = dict.fromkeys(match.group(0) for match in pattern.finditer(query))
+        return [{arg_name: keyword} for keyword in found]
+
+    return predict
+
+
+def call_key(name: str, args: Dict[str, Any]) -> Tuple[str, str]:
+    """도구 이름 + 인자를 비교 가능한 키로 변환
+
+    dict 키 순서만 무시하고 값은 그대로 비교합니다 (공백 / 대소문자 / 타입 정규화 없음).
+    예: {"city": "서울"}과 {"city": "서울 "}은 다른 호출로 보고 평소처럼 실행합니다.
+    """
+    return name, json.dumps(args, sort_keys=True, ensure_ascii=False)
+
+
+class Speculation:
+    """질문 하나에 대해 미리 시작한 도구 실행 목록"""
+
+    def __init__(self, query: str):
+        self.query = query
+        self.started_at = time.perf_counter()
+        self.futures: Dict[Tuple[str, str], Future] = {}
+        self.used: set = set()
+
+    @property
+    def predicted(self) -> List[Tuple[str, str]]:
+        return list(self.futures)
+
+
+class SpeculativeExecutor:
+    """질문에서 도구 호출을 추측해 LLM 응답 전에 미리 실행"""
+
+    def __init__(self, registry: ToolRegistry, predictors: Dict[str, Predictor], max_workers: int = 4):
+        self.registry = registry
+        self.predictors = predictors
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="speculative")
+        self._lock = threading.Lock()
+        self.stats = {
+            "speculated": 0,   # 미리 시작한 도구 호출
+            "hits": 0,         # LLM 요청과 일치해 재사용
+            "misses": 0,       # 추측하지 못해 평소처럼 실행
+            "wasted": 0,       # 추측했지만 사용되지 않음
+            "saved_time": 0.0, # 도구 실행 중 LLM 응답 대기와 겹친 시간
+        }
+
+    def start(self, query: str) -> Speculation:
+        """질문에서 추측한 도구 호출을 백그라운드로 시작"""
+        speculation = Speculation(query)
+        for name, predict in self.predictors.items():
+            for args in predict(query):
+                key = call_key(name, args)
+                if key not in speculation.futures:
+                    speculation.futures[key] = self._pool.submit(self.registry.call, name, args, record=False)
+        with self._lock:
+            self.stats["speculated"] += len(speculation.futures)
+        return speculation
+
+    def resolve(self, speculation: Speculation, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+        """LLM이 요청한 tool_call의 결과 반환 (추측이 맞으면 미리 실행한 결과 사용)
+
+        Returns:
+            ToolRegistry.call()과 같은 결과 dict + "speculative" (hit 여부)
+        """
+        key = call_key(tool_call["name"], tool_call.get("args") or {})
+        future = speculation.futures.get(key)
+
+        if future is None or key in speculation.used:
+            result = self.registry.execute(tool_call)
+            with self._lock:
+                self.stats["misses"] += 1
+            return {**result, "speculative": False}
+
+        speculation.used.add(key)
+        waited_from = time.perf_counter()
+        result = future.result()
+        waited = time.perf_counter() - waited_from
+        self.registry.record(result)
+        with self._lock:
+            self.stats["hits"] += 1
+            # 도구 실행 시간 중 결과를 기다리지 않아도 된 부분이 절약된 시간
+            self.stats["saved_time"] += max(result["latency"] - waited, 0.0)
+        return {**result, "id": tool_call.get("id"), "speculative": True}
+
+    def finish(self, speculation: Speculation) -> int:
+        """사용되지 않은 추측 실행을 버리고 그 개수를 반환"""
+        wasted = 0
+        for key, future in speculation.futures.items():
+            if key not in speculation.used:
+                future.cancel()  # 아직 시작 전이면 취소, 실행 중이면 결과만 버림
+                wasted += 1
+        with self._lock:
+            self.stats["wasted"] += wasted
+        return wasted
+
+    def close(self):
+        """스레드 풀 종료 (시작 전인 추측 실행은 취소, 실행 중인 도구는 기다리지 않음)"""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def summary(self) -> Dict[str, Any]:
+        s = dict(self.stats)
+        calls = s["hits"] + s["misses"]
+        s["hit_rate"] = s["hits"] / calls if calls else 0.0
+        s["precision"] = s["hits"] / s["speculated"] if s["speculated"] else 0.0
+        return s
+
+    def get_report(self) -> str:
+        s = self.summary()
+        return f"""
+📊 추측 실행 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+미리 시작한 도구 호출: {s['speculated']}회
+LLM 요청 도구 호출: {s['hits'] + s['misses']}회 (적중 {s['hits']}회, 적중률 {s['hit_rate']:.1%})
+사용되지 않은 추측: {s['wasted']}회 (추측 정확도 {s['precision']:.1%})
+절약한 지연 시간: {s['saved_time']:.2f}초
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
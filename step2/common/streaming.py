@@ -0,0 +1,121 @@
+"""
+스트리밍 실행 및 지연 시간 측정 유틸리티
+
+- chain.stream() / astream()으로 토큰이 도착하는 즉시 출력
+- TTFT(첫 토큰까지 시간), 토큰 간 지연(inter-token latency), 전체 지연 시간 기록
+- 같은 체인을 invoke()로 실행한 결과와 비교
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from common.batch import percentile
+
+
+def chunk_text(chunk: Any) -> str:
+    """스트림 청크(str 또는 AIMessageChunk)에서 텍스트만 추출"""
+    if isinstance(chunk, str):
+        return chunk
+    content = getattr(chunk, "content", "")
+    if isinstance(content, str):
+        return content
+    # content가 블록 리스트인 경우 (예: [{"type": "text", "text": "..."}])
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def _timing(started: float, first: Optional[float], ended: float, gaps: List[float]) -> Dict[str, float]:
+    return {
+        "ttft": (first or ended) - started,
+        "total": ended - started,
+        "chunks": len(gaps) + (1 if first is not None else 0),
+        "itl_mean": sum(gaps) / len(gaps) if gaps else 0.0,
+        "itl_p95": percentile(gaps, 95),
+    }
+
+
+def print_token(text: str):
+    """토큰을 줄바꿈 없이 즉시 출력"""
+    print(text, end="", flush=True)
+
+
+def stream_with_timing(
+    chain,
+    inputs: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]] = print_token,
+) -> Tuple[str, Dict[str, float]]:
+    """chain.stream()으로 실행하며 토큰마다 on_token 호출, (전체 텍스트, 측정값) 반환"""
+    parts = []
+    gaps = []
+    first = last = None
+
+    started = time.perf_counter()
+    for chunk in chain.stream(inputs):
+        text = chunk_text(chunk)
+        if not text:
+            continue
+        now = time.perf_counter()
+        if first is None:
+            first = now
+        else:
+            gaps.append(now - last)
+        last = now
+        parts.append(text)
+        if on_token:
+            on_token(text)
+    ended = time.perf_counter()
+
+    return "".join(parts), _timing(started, first, ended, gaps)
+
+
+async def astream_with_timing(
+    chain,
+    inputs: Dict[str, Any],
+    on_token: Optional[Callable[[str], None]] = print_token,
+) -> Tuple[str, Dict[str, float]]:
+    """stream_with_timing()의 비동기 버전 (chain.astream() 사용)"""
+    parts = []
+    gaps = []
+    first = last = None
+
+    started = time.perf_counter()
+    async for chunk in chain.astream(inputs):
+        text = chunk_text(chunk)
+        if not text:
+            continue
+        now = time.perf_counter()
+        if first is None:
+            first = now
+        else:
+            gaps.append(now - last)
+        last = now
+        parts.append(text)
+        if on_token:
+            on_token(text)
+    ended = time.perf_counter()
+
+    return "".join(parts), _timing(started, first, ended, gaps)
+
+
+def invoke_with_timing(chain, inputs: Dict[str, Any]) -> Tuple[str, Dict[str, float]]:
+    """chain.invoke()로 실행 (블로킹) - 첫 글자를 볼 수 있는 시점 = 전체 완료 시점"""
+    started = time.perf_counter()
+    text = chunk_text(chain.invoke(inputs))
+    ended = time.perf_counter()
+    return text, _timing(started, ended, ended, [])
+
+
+def format_comparison(rows: List[Tuple[str, Dict[str, float]]]) -> str:
+    """(모드 이름, 측정값) 목록을 표 형태 문자열로 변환"""
+    lines = [
+        f"{'mode':<12}{'TTFT':>10}{'total':>10}{'chunks':>8}{'ITL avg':>12}{'ITL p95':>12}",
+        "-" * 64,
+    ]
+    for name, t in rows:
+        lines.append(
+            f"{name:<12}{t['ttft']:>9.3f}s{t['total']:>9.3f}s{t['chunks']:>8}"
+            f"{t['itl_mean'] * 1000:>10.1f}ms{t['itl_p95'] * 1000:>10.1f}ms"
+        )
+    return "\n".join(lines)
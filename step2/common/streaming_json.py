@@ -0,0 +1,163 @@
+"""
+스트리밍 JSON 증분 파서
+
+LLM이 {"category": "...", "movies": [{...}, {...}, ...]} 형태의 JSON을
+토큰 단위로 보내는 동안, 리스트의 각 원소 객체가 닫히는 즉시 Pydantic으로 검증해 반환합니다.
+
+- 전체 JSON이 도착할 때까지 기다리지 않고 첫 원소부터 후속 처리 가능
+- 현재 파싱 중인 원소 텍스트만 버퍼에 유지 (keep_items=False면 긴 출력에서도 메모리 사용량 일정)
+- JSON 앞뒤의 설명 문장이나 ```json 코드 펜스는 무시
+
+사용법:
+    parser = IncrementalListParser(MovieRecommendations, list_key="movies")
+    for chunk in (prompt | llm).stream(inputs):
+        for movie in parser.feed(chunk_text(chunk)):
+            print(movie.title)          # Movie 객체가 완성되는 즉시
+    result = parser.close()             # MovieRecommendations 전체
+"""
+
+import json
+from typing import Any, Dict, Iterator, List, Optional, Type
+
+from pydantic import BaseModel, ValidationError
+
+from common.streaming import chunk_text
+
+
+class IncrementalListParser:
+    """최상위 객체의 list_key 리스트 원소를 하나씩 검증해 내보내는 증분 파서"""
+
+    def __init__(
+        self,
+        model: Type[BaseModel],
+        list_key: str,
+        item_model: Optional[Type[BaseModel]] = None,
+        keep_items: bool = True,
+    ):
+        """
+        Args:
+            model: 전체 결과 모델 (예: MovieRecommendations)
+            list_key: 원소를 하나씩 내보낼 리스트 필드 이름 (예: "movies")
+            item_model: 원소 모델. 생략하면 model의 List[...] 타입에서 추론
+            keep_items: False면 내보낸 원소를 보관하지 않음 (close() 결과의 리스트는 비어 있음)
+        """
+        self.model = model
+        self.list_key = list_key
+        self.item_model = item_model or self._infer_item_model(model, list_key)
+        self.keep_items = keep_items
+
+        self.items: List[BaseModel] = []
+        self.count = 0
+        self.errors: List[Dict[str, Any]] = []
+
+        self._depth = 0              # 현재 중첩 깊이 (최상위 객체 내부 = 1)
+        self._started = False        # 최상위 '{'를 만났는지
+        self._done = False           # 최상위 객체가 닫혔는지
+        self._in_string = False
+        self._escape = False
+        self._string_buf: List[str] = []
+        self._last_string = None     # 깊이 1에서 마지막으로 읽은 문자열 (키 후보)
+        self._current_key = None     # 깊이 1에서 현재 값이 속한 키
+        self._in_list = False        # list_key 리스트 내부인지
+        self._item_buf: List[str] = []   # 현재 원소 객체 텍스트
+        self._skeleton: List[str] = []   # 리스트 원소를 뺀 최상위 객체 텍스트
+
+    @staticmethod
+    def _infer_item_model(model: Type[BaseModel], list_key: str) -> Type[BaseModel]:
+        annotation = model.model_fields[list_key].annotation
+        args = getattr(annotation, "__args__", ())
+        if not args or not isinstance(args[0], type) or not issubclass(args[0], BaseModel):
+            raise ValueError(f"{model.__name__}.{list_key}의 원소 모델을 추론할 수 없습니다.")
+        return args[0]
+
+    def feed(self, text: str) -> List[BaseModel]:
+        """텍스트 조각을 입력하고, 이번 조각에서 완성된 원소들을 반환"""
+        completed = []
+        for ch in text:
+            if self._done:
+                break
+            if not self._started:
+                if ch == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._skeleton.append(ch)
+                continue
+            item = self._consume(ch)
+            if item is not None:
+                completed.append(item)
+        return completed
+
+    def _consume(self, ch: str) -> Optional[BaseModel]:
+        capturing = self._in_list and self._depth >= 3
+
+        if capturing:
+            self._item_buf.append(ch)
+        elif not self._in_list:
+            self._skeleton.append(ch)
+
+        # 문자열 내부: 이스케이프와 닫는 따옴표만 확인
+        if self._in_string:
+            if self._escape:
+                self._escape = False
+            elif ch == "\\":
+                self._escape = True
+            elif ch == '"':
+                self._in_string = False
+                if self._depth == 1:
+                    self._last_string = "".join(self._string_buf)
+            elif self._depth == 1:
+                self._string_buf.append(ch)
+            return None
+
+        if ch == '"':
+            self._in_string = True
+            self._string_buf = []
+        elif ch == ":" and self._depth == 1:
+            self._current_key = self._last_string
+        elif ch in "{[":
+            if ch == "[" and self._depth == 1 and self._current_key == self.list_key:
+                self._in_list = True
+                self._skeleton.append("]")  # 스켈레톤에는 빈 리스트로 남김
+            elif ch == "{" and self._in_list and self._depth == 2:
+                self._item_buf = [ch]
+            self._depth += 1
+        elif ch in "}]":
+            self._depth -= 1
+            if self._in_list and self._depth == 2 and ch == "}":
+                return self._emit()
+            if self._in_list and self._depth == 1:
+                self._in_list = False
+            if self._depth == 0:
+                self._done = True
+        return None
+
+    def _emit(self) -> Optional[BaseModel]:
+        raw = "".join(self._item_buf)
+        self._item_buf = []
+        try:
+            item = self.item_model.model_validate_json(raw)
+        except ValidationError as e:
+            self.errors.append({"index": self.count + len(self.errors), "raw": raw, "errors": e.errors()})
+            return None
+        self.count += 1
+        if self.keep_items:
+            self.items.append(item)
+        return item
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def close(self) -> BaseModel:
+        """스트림 종료 후 전체 모델을 검증해 반환 (리스트는 이미 검증된 원소로 채움)"""
+        if not self._done:
+            raise ValueError("JSON 객체가 완전히 닫히지 않았습니다 (스트림이 중간에 끊김).")
+        data = json.loads("".join(self._skeleton))
+        data[self.list_key] = self.items
+        return self.model.model_validate(data)
+
+
+def stream_items(chain, inputs: Dict[str, Any], parser: IncrementalListParser) -> Iterator[BaseModel]:
+    """chain.stream() 결과를 parser에 흘려보내며 완성된 원소를 즉시 yield"""
+    for chunk in chain.stream(inputs):
+        yield from parser.feed(chunk_text(chunk))
@@ -0,0 +1,82 @@
+"""
+구조화 출력 모드 비교 (포맷 지시문 vs tool calling)
+
+- parser 모드: 프롬프트에 parser.get_format_instructions() (JSON 스키마 문자열)를 넣고 응답 텍스트를 파싱
+- tool 모드: llm.with_structured_output(Model)로 모델의 tool 채널을 사용 (프롬프트에 포맷 지시문 없음)
+
+두 모드 모두 AIMessage.usage_metadata에서 입력/출력 토큰을 읽어 호출 단위로 기록합니다.
+
+사용법:
+    from common.structured_output import invoke_with_usage, format_usage_comparison
+
+    parser_row = invoke_with_usage(prompt | llm, inputs, parse=parser.parse)
+    tool_row = invoke_with_usage(prompt_no_fi | llm.with_structured_output(MovieInfo, include_raw=True), inputs)
+    print(format_usage_comparison([("parser", [parser_row]), ("tool", [tool_row])]))
+"""
+
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+
+def structured_chain(prompt, llm, model: Type[BaseModel], include_raw: bool = False):
+    """tool 모드 체인: prompt | llm.with_structured_output(model)
+
+    include_raw=True면 {"raw": AIMessage, "parsed": 객체, "parsing_error": 에러}를 반환하므로
+    usage_metadata(토큰 수)를 함께 확인할 수 있습니다.
+    """
+    return prompt | llm.with_structured_output(model, include_raw=include_raw)
+
+
+def invoke_with_usage(chain, inputs: Dict[str, Any], parse: Optional[Callable[[str], Any]] = None) -> Dict[str, Any]:
+    """체인을 한 번 실행하고 토큰 수 / 소요 시간 / 파싱 결과를 반환
+
+    Args:
+        chain: parser 모드면 prompt | llm (AIMessage 반환),
+               tool 모드면 structured_chain(..., include_raw=True)
+        parse: parser 모드에서 응답 텍스트를 검증할 함수 (예: parser.parse)
+    """
+    started = time.perf_counter()
+    output = chain.invoke(inputs)
+    wall_time = time.perf_counter() - started
+
+    if isinstance(output, dict) and "raw" in output:
+        raw, parsed, error = output["raw"], output["parsed"], output.get("parsing_error")
+    else:
+        raw, parsed, error = output, None, None
+        try:
+            parsed = parse(raw.content) if parse else raw.content
+        except Exception as e:
+            error = e
+
+    usage = getattr(raw, "usage_metadata", None) or {}
+    return {
+        "input_tokens": usage.get("input_tokens", 0),
+        "output_tokens": usage.get("output_tokens", 0),
+        "wall_time": wall_time,
+        "parsed": parsed,
+        "error": str(error) if error else None,
+    }
+
+
+def _mean(values: List[float]) -> float:
+    return sum(values) / len(values) if values else 0.0
+
+
+def format_usage_comparison(rows: List[Tuple[str, List[Dict[str, Any]]]]) -> str:
+    """모드별 호출 결과를 평균 토큰 / 시간 표로 정리"""
+    lines = [
+        f"{'mode':<12}{'calls':>7}{'input tok':>12}{'output tok':>12}{'wall time':>12}{'errors':>8}",
+        "-" * 63,
+    ]
+    for name, calls in rows:
+        errors = sum(1 for call in calls if call["error"])
+        lines.append(
+            f"{name:<12}{len(calls):>7}"
+            f"{_mean([c['input_tokens'] for c in calls]):>12.1f}"
+            f"{_mean([c['output_tokens'] for c in calls]):>12.1f}"
+            f"{_mean([c['wall_time'] for c in calls]):>11.3f}s"
+            f"{errors:>8}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,161 @@
+"""
+수동 도구 루프의 반복별 텔레메트리 (JSONL)
+
+루프가 느리거나 토큰을 많이 쓸 때 LLM 호출 / 도구 실행 / 히스토리 증가 중
+어디에서 시간과 토큰이 쓰이는지 반복 단위로 기록합니다.
+
+- 반복마다 이벤트 1개: LLM 지연 시간, usage_metadata 입력/출력 토큰, 도구 호출 수,
+  도구별 실행 시간, LLM에 보낸 메시지 수와 추정 토큰
+- 이벤트는 JSONL 파일에 한 줄씩 추가 (실행이 중간에 끊겨도 그때까지 기록 유지)
+- summarize(): 실행(run_id) + 시나리오별 / 도구별 합계 (저장된 JSONL을 load_events()로 읽어 다시 집계 가능)
+  → 같은 파일에 여러 실행이 쌓여도 시나리오 이름이 같은 실행끼리 합쳐지지 않음
+
+사용법:
+    telemetry = LoopTelemetry(Path(__file__).resolve().parent / "loop_telemetry.jsonl")
+
+    event = telemetry.start("시나리오 1", iteration, messages)   # LLM 호출 직전
+    response = llm_with_tools.invoke(messages)
+    telemetry.llm_done(event, response)
+    tool_results = [registry.execute(tc) for tc in response.tool_calls]
+    telemetry.finish(event, tool_results)
+
+    print(telemetry.get_report())
+"""
+
+import json
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from common.history import estimate_tokens
+
+
+def load_events(path: str) -> List[Dict[str, Any]]:
+    """JSONL 파일의 이벤트 목록 (빈 줄은 무시)"""
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def summarize(events: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """이벤트 목록을 (run_id, 시나리오)별 / 도구별로 집계"""
+    scenarios: Dict[Tuple[Optional[str], str], Dict[str, Any]] = {}
+    tools: Dict[str, Dict[str, Any]] = {}
+    for event in events:
+        s = scenarios.setdefault((event.get("run_id"), event["scenario"]), {
+            "iterations": 0, "llm_time": 0.0, "tool_time": 0.0, "tool_calls": 0,
+            "input_tokens": 0, "output_tokens": 0, "max_history_tokens": 0,
+        })
+        s["iterations"] += 1
+        s["llm_time"] += event["llm_latency"]
+        s["tool_time"] += event["tool_time"]
+        s["tool_calls"] += event["tool_calls"]
+        s["input_tokens"] += event["input_tokens"] or 0
+        s["output_tokens"] += event["output_tokens"] or 0
+        s["max_history_tokens"] = max(s["max_history_tokens"], event["history_tokens"])
+        for name, t in event["tools"].items():
+            tool = tools.setdefault(name, {"calls": 0, "time": 0.0})
+            tool["calls"] += t["calls"]
+            tool["time"] += t["time"]
+
+    totals = {key: sum(s[key] for s in scenarios.values())
+              for key in ("iterations", "llm_time", "tool_time", "tool_calls", "input_tokens", "output_tokens")}
+    runs = list(dict.fromkeys(run_id for run_id, _ in scenarios))
+    return {"runs": runs, "scenarios": scenarios, "tools": tools, "totals": totals}
+
+
+class LoopTelemetry:
+    """반복별 이벤트를 메모리와 JSONL 파일에 기록"""
+
+    def __init__(self, path: Optional[str] = None, run_id: Optional[str] = None):
+        """
+        Args:
+            path: JSONL 파일 경로 (None이면 메모리에만 기록). 기존 파일이면 뒤에 추가
+            run_id: 실행 구분용 ID (기본: 시작 시각)
+        """
+        self.path = path
+        self.run_id = run_id or time.strftime("%Y%m%d-%H%M%S")
+        self.events: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self._file = open(path, "a", encoding="utf-8") if path else None
+
+    def start(self, scenario: str, iteration: int, messages: Sequence) -> Dict[str, Any]:
+        """LLM 호출 직전: 보낼 히스토리 크기를 기록하고 타이머 시작"""
+        return {
+            "run_id": self.run_id,
+            "scenario": scenario,
+            "iteration": iteration,
+            "history_messages": len(messages),
+            "history_tokens": estimate_tokens(messages),
+            "llm_latency": 0.0,
+            "input_tokens": None,
+            "output_tokens": None,
+            "tool_calls": 0,
+            "tool_time": 0.0,
+            "tools": {},
+            "_started": time.perf_counter(),
+        }
+
+    def llm_done(self, event: Dict[str, Any], response) -> None:
+        """LLM 응답 직후: 지연 시간과 usage_metadata 토큰 기록"""
+        event["llm_latency"] = time.perf_counter() - event["_started"]
+        usage = getattr(response, "usage_metadata", None) or {}
+        event["input_tokens"] = usage.get("input_tokens")
+        event["output_tokens"] = usage.get("output_tokens")
+
+    def finish(self, event: Dict[str, Any], tool_results: Sequence[Dict[str, Any]] = ()) -> Dict[str, Any]:
+        """도구 실행 후: ToolRegistry 결과의 latency를 도구별로 합산해 이벤트 기록"""
+        for result in tool_results:
+            tool = event["tools"].setdefault(result["name"], {"calls": 0, "time": 0.0, "errors": 0})
+            tool["calls"] += 1
+            tool["time"] += result["latency"]
+            tool["errors"] += 0 if result["ok"] else 1
+        event["tool_calls"] = len(tool_results)
+        event["tool_time"] = sum(result["latency"] for result in tool_results)
+        event["wall_time"] = time.perf_counter() - event.pop("_started")
+        event["timestamp"] = time.time()
+
+        with self._lock:
+            self.events.append(event)
+            if self._file:
+                self._file.write(json.dumps(event, ensure_ascii=False) + "\n")
+                self._file.flush()
+        return event
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def summary(self) -> Dict[str, Any]:
+        return summarize(self.events)
+
+    def get_report(self) -> str:
+        s = self.summary()
+        lines = []
+        for (run_id, name), sc in s["scenarios"].items():
+            label = f"[{run_id}] {name}" if len(s["runs"]) > 1 else name
+            lines.append(
+                f"  - {label}: LLM {sc['iterations']}회 {sc['llm_time']:.2f}초, "
+                f"도구 {sc['tool_calls']}회 {sc['tool_time']:.3f}초, "
+                f"토큰 {sc['input_tokens']}→{sc['output_tokens']} (최대 히스토리 ~{sc['max_history_tokens']})"
+            )
+        tool_lines = [
+            f"  - {name}: {t['calls']}회, {t['time'] * 1000:.1f}ms"
+            for name, t in sorted(s["tools"].items(), key=lambda item: -item[1]["time"])
+        ]
+        t = s["totals"]
+        busy = t["llm_time"] + t["tool_time"]
+        llm_share = t["llm_time"] / busy if busy else 0.0
+        sink = self.path or "(메모리)"
+        return f"""
+📊 루프 텔레메트리 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+이벤트: {len(self.events)}개 → {sink}
+시간: LLM {t['llm_time']:.2f}초 ({llm_share:.1%}) / 도구 {t['tool_time']:.3f}초 ({1 - llm_share:.1%})
+토큰: 입력 {t['input_tokens']} / 출력 {t['output_tokens']} (LLM 호출 {t['iterations']}회)
+시나리오별:
+{chr(10).join(lines) or '  (기록 없음)'}
+도구별 실행 시간:
+{chr(10).join(tool_lines) or '  (도구 호출 없음)'}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
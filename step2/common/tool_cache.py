@@ -0,0 +1,213 @@
+"""
+결정적 도구 결과 메모이제이션 (TTL + 크기 제한)
+
+시나리오마다 같은 get_weather("서울"), search_news("AI 기술")를 다시 실행합니다.
+같은 인자에 같은 결과를 돌려주는 도구는 결과를 일정 시간 재사용합니다.
+
+- 키: 도구 이름 + 정규화된 인자 (기본값 적용, 위치/키워드 인자 구분 없음, 값은 그대로 비교)
+- 도구별 TTL (None이면 만료 없음)과 도구별 최대 항목 수 (LRU 삭제)
+- create_report처럼 호출할 때마다 결과가 달라지는 도구는 enabled=False로 제외 (호출 수만 기록)
+- 도구가 예외를 던지면 캐시하지 않음
+- 함수를 감싸는 데코레이터이므로 ToolRegistry(수동 루프)와 @tool(AgentExecutor)에서 똑같이 동작
+
+사용법:
+    from common.tool_cache import tool_cache
+
+    @tool_cache.memoize(ttl=600)
+    def get_weather(city: str) -> str: ...
+
+    @tool                                    # AgentExecutor용 도구는 @tool 아래에 적용
+    @tool_cache.memoize(enabled=False)
+    def create_report(title: str, content: str) -> str: ...
+
+    print(tool_cache.get_report())
+"""
+
+import functools
+import inspect
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+
+def normalize_args(func: Callable, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """호출 인자를 비교 가능한 문자열로 변환
+
+    f("서울")과 f(city="서울")이 같은 키가 되도록 시그니처에 맞춰 기본값을 채웁니다.
+    값은 바꾸지 않습니다 (f(" 서울 ")은 다른 키). 도구 함수가 받는 인자와 키가 항상 일치해야
+    다른 입력의 결과를 돌려주지 않습니다.
+    """
+    try:
+        bound = inspect.signature(func).bind(*args, **kwargs)
+        bound.apply_defaults()
+        arguments = dict(bound.arguments)
+    except TypeError:
+        arguments = {"args": list(args), **kwargs}
+
+    return json.dumps(arguments, sort_keys=True, ensure_ascii=False, default=repr)
+
+
+class ToolResultCache:
+    """도구별 TTL / LRU 결과 캐시"""
+
+    def __init__(self, default_ttl: Optional[float] = 300.0, max_entries: int = 256, clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            default_ttl: 도구별로 지정하지 않았을 때의 유효 기간(초), None이면 만료 없음
+            max_entries: 도구별로 지정하지 않았을 때의 최대 항목 수
+            clock: 현재 시각 함수 (테스트에서 교체 가능)
+        """
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._entries: Dict[str, "OrderedDict[str, Tuple[float, Any]]"] = {}
+        self._config: Dict[str, Dict[str, Any]] = {}
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def configure(self, name: str, ttl: Optional[float] = ..., max_entries: Optional[int] = None, enabled: bool = True):
+        """도구별 설정 (memoize()가 호출, 직접 바꿀 수도 있음)"""
+        self._config[name] = {
+            "ttl": self.default_ttl if ttl is ... else ttl,
+            "max_entries": max_entries or self.max_entries,
+            "enabled": enabled,
+        }
+        self._entries.setdefault(name, OrderedDict())
+        self.stats.setdefault(name, {"hits": 0, "misses": 0, "expired": 0, "evictions": 0, "bypassed": 0})
+
+    def _get(self, name: str, key: str) -> Tuple[bool, Any]:
+        with self._lock:
+            entries, stats = self._entries[name], self.stats[name]
+            entry = entries.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= self.clock():
+                    entries.move_to_end(key)
+                    stats["hits"] += 1
+                    return True, value
+                del entries[key]
+                stats["expired"] += 1
+            stats["misses"] += 1
+            return False, None
+
+    def _put(self, name: str, key: str, value: Any):
+        config = self._config[name]
+        expires_at = float("inf") if config["ttl"] is None else self.clock() + config["ttl"]
+        with self._lock:
+            entries = self._entries[name]
+            entries[key] = (expires_at, value)
+            entries.move_to_end(key)
+            while len(entries) > config["max_entries"]:
+                entries.popitem(last=False)
+                self.stats[name]["evictions"] += 1
+
+    def _bypass(self, name: str):
+        with self._lock:
+            self.stats[name]["bypassed"] += 1
+
+    def memoize(
+        self,
+        func: Optional[Callable] = None,
+        *,
+        ttl: Optional[float] = ...,
+        max_entries: Optional[int] = None,
+        enabled: bool = True,
+        name: Optional[str] = None,
+    ):
+        """도구 함수 결과를 캐시하는 데코레이터 (동기 / async 함수 모두 지원)
+
+        감싼 함수는 이름, docstring, 시그니처를 그대로 유지하므로
+        bind_tools(), ToolRegistry, @tool에 원래 함수처럼 넘길 수 있습니다.
+
+        Args:
+            ttl: 유효 기간(초). 생략하면 default_ttl, None이면 만료 없음
+            max_entries: 이 도구의 최대 항목 수
+            enabled: False면 캐시하지 않음 (결과가 매번 달라지는 도구)
+            name: 통계에 표시할 이름 (기본: 함수 이름)
+        """
+        if func is None:
+            return lambda f: self.memoize(f, ttl=ttl, max_entries=max_entries, enabled=enabled, name=name)
+
+        tool_name = name or func.__name__
+        self.configure(tool_name, ttl=ttl, max_entries=max_entries, enabled=enabled)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not self._config[tool_name]["enabled"]:
+                    self._bypass(tool_name)
+                    return await func(*args, **kwargs)
+                key = normalize_args(func, args, kwargs)
+                found, value = self._get(tool_name, key)
+                if not found:
+                    value = await func(*args, **kwargs)
+                    self._put(tool_name, key, value)
+                return value
+
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self._config[tool_name]["enabled"]:
+                self._bypass(tool_name)
+                return func(*args, **kwargs)
+            key = normalize_args(func, args, kwargs)
+            found, value = self._get(tool_name, key)
+            if not found:
+                value = func(*args, **kwargs)
+                self._put(tool_name, key, value)
+            return value
+
+        return wrapper
+
+    def invalidate(self, name: Optional[str] = None):
+        """도구 하나(name) 또는 전체 캐시 비우기"""
+        with self._lock:
+            for tool_name, entries in self._entries.items():
+                if name is None or tool_name == name:
+                    entries.clear()
+
+    def summary(self) -> Dict[str, Any]:
+        hits = sum(s["hits"] for s in self.stats.values())
+        misses = sum(s["misses"] for s in self.stats.values())
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+            "entries": sum(len(entries) for entries in self._entries.values()),
+            "bypassed": sum(s["bypassed"] for s in self.stats.values()),
+        }
+
+    def get_report(self) -> str:
+        lines = []
+        for name, s in self.stats.items():
+            config = self._config[name]
+            if not config["enabled"]:
+                lines.append(f"  - {name}: 캐시 제외 (호출 {s['bypassed']}회)")
+                continue
+            calls = s["hits"] + s["misses"]
+            if not calls:
+                continue
+            ttl = "만료 없음" if config["ttl"] is None else f"TTL {config['ttl']:g}초"
+            lines.append(
+                f"  - {name}: {calls}회 중 적중 {s['hits']}회 ({s['hits'] / calls:.1%}), "
+                f"만료 {s['expired']}회, 삭제 {s['evictions']}회 [{ttl}]"
+            )
+        body = "\n".join(lines) or "  (호출 없음)"
+        total = self.summary()
+        return f"""
+📊 도구 결과 캐시 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+전체 적중률: {total['hit_rate']:.1%} (적중 {total['hits']}회 / 실행 {total['misses']}회), 저장된 결과 {total['entries']}개
+{body}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+
+# ============================================================================
+# 프로세스 전역 인스턴스 (수동 루프와 AgentExecutor가 같은 캐시 공유)
+# ============================================================================
+
+tool_cache = ToolResultCache()
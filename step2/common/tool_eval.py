@@ -0,0 +1,216 @@
+"""
+도구 선택 평가 하네스 (오프라인 재생 지원)
+
+phase4 예제 1은 하드코딩된 시나리오 4개를 순차로, 매번 실제 API로 확인합니다.
+docstring을 고칠 때마다 도구 선택이 나빠지지 않았는지 빠르고 싸게 확인할 수 있도록 합니다.
+
+- JSONL 파일에서 (query, expected_tool) 케이스 로드 (수천 건도 chunk 단위로 처리)
+- run_batch()로 동시 실행 (max_concurrency), 처리량 / 지연 시간 기록
+- 모델 응답(tool_calls)을 기록해 두고 API 없이 재생
+  record 모드도 이미 기록된 키는 API를 다시 호출하지 않고 재사용 (한 번만 기록)
+  기록 키 = 모델 + 바인딩된 도구 스키마 + 질문 → docstring이 바뀌면 자동으로 새로 기록해야 함
+- 정확도, 도구별 precision / recall, 혼동 행렬(confusion matrix)
+- bind_for_query로 질문마다 다른 도구 조합을 바인딩해 비교 가능 (도구 사전 선택)
+
+사용법:
+    store = ResponseStore("tool_selection_responses.jsonl")
+    results, stats = evaluate_tool_selection(llm_with_tools, load_cases(path), mode="record", store=store)
+    print(format_confusion_matrix(score_selections(results)))
+"""
+
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from common.batch import LatencyStats, read_jsonl, run_batch
+from common.tool_pruning import estimate_tool_tokens
+
+# 도구를 호출하지 않은 경우의 레이블 (phase4 예제 1과 같은 표기)
+NO_TOOL = "None"
+
+MODES = ("live", "record", "replay")
+
+
+def load_cases(path: str) -> Iterable[Dict[str, Any]]:
+    """케이스 JSONL 로드: {"query": ..., "expected_tool": "get_weather" | "None"}"""
+    for case in read_jsonl(path):
+        yield {"query": case["query"], "expected_tool": case.get("expected_tool") or NO_TOOL}
+
+
+def binding_fingerprint(llm_with_tools) -> str:
+    """모델 이름 + 바인딩된 도구 정의의 해시 (docstring / 시그니처가 바뀌면 달라짐)"""
+    model = getattr(getattr(llm_with_tools, "bound", llm_with_tools), "model", "")
+    tools = getattr(llm_with_tools, "kwargs", {}).get("tools", [])
+    payload = json.dumps({"model": model, "tools": tools}, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16]
+
+
+class ResponseStore:
+    """질문별 모델 응답(tool_calls) 기록 / 재생 (JSONL, 추가 기록)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._responses: Dict[str, Dict[str, Any]] = {}
+        if os.path.exists(path):
+            for row in read_jsonl(path):
+                self._responses[row["key"]] = row
+
+    @staticmethod
+    def key(fingerprint: str, query: str) -> str:
+        return hashlib.sha256(f"{fingerprint}\n{query}".encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._responses.get(key)
+
+    def put(self, key: str, row: Dict[str, Any]):
+        """응답 기록 (이미 기록된 키면 파일에 중복 행을 추가하지 않음)"""
+        row = {"key": key, **row}
+        with self._lock:
+            if key in self._responses:
+                return
+            self._responses[key] = row
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+def evaluate_tool_selection(
+    llm_with_tools,
+    cases: Iterable[Dict[str, Any]],
+    mode: str = "live",
+    store: Optional[ResponseStore] = None,
+    max_concurrency: int = 8,
+    chunk_size: int = 1000,
+    bind_for_query: Optional[Callable[[str], Any]] = None,
+) -> Tuple[List[Dict[str, Any]], LatencyStats]:
+    """케이스마다 모델이 처음 선택한 도구를 구해 (결과 목록(케이스 순서), 통계) 반환
+
+    Args:
+        mode: "live" (API 호출), "record" (기록이 있으면 재사용, 없으면 API 호출 + 응답 기록),
+              "replay" (기록된 응답만 사용, 없으면 해당 케이스는 error)
+        bind_for_query: 질문 → 도구를 바인딩한 모델. 주어지면 llm_with_tools 대신 사용
+                        (예: lambda q: bind_tools_cached(llm, selector.select(q)))
+
+    Returns:
+        결과 행: {"input": 케이스, "output": {"tool", "args", "source", "tools_bound",
+                 "tool_tokens", "input_tokens"}, "error", "latency"}
+        tool_tokens는 바인딩된 도구 정의의 추정 토큰, input_tokens는 usage_metadata 값 (기록에 없으면 None)
+    """
+    if mode not in MODES:
+        raise ValueError(f"mode는 {MODES} 중 하나여야 합니다: {mode}")
+    if mode != "live" and store is None:
+        raise ValueError(f"{mode} 모드에는 ResponseStore가 필요합니다")
+
+    from langchain_core.messages import HumanMessage
+    from langchain_core.runnables import RunnableLambda
+
+    def select(case: Dict[str, Any]) -> Dict[str, Any]:
+        bound = bind_for_query(case["query"]) if bind_for_query else llm_with_tools
+        tool_definitions = getattr(bound, "kwargs", {}).get("tools", [])
+        key = ResponseStore.key(binding_fingerprint(bound), case["query"])
+        row = store.get(key) if mode != "live" else None
+        if row is not None:
+            source = "replay"
+        elif mode == "replay":
+            raise LookupError(f"기록된 응답이 없습니다 (도구 정의가 바뀌었으면 record 모드로 다시 기록): {case['query']}")
+        else:
+            response = bound.invoke([HumanMessage(content=case["query"])])
+            row = {
+                "query": case["query"],
+                "tool_calls": [{"name": tc["name"], "args": tc["args"]} for tc in response.tool_calls],
+                "content": response.content if isinstance(response.content, str) else "",
+                "input_tokens": (response.usage_metadata or {}).get("input_tokens"),
+            }
+            if mode == "record":
+                store.put(key, row)
+            source = "live"
+
+        first = row["tool_calls"][0] if row["tool_calls"] else None
+        return {
+            "tool": first["name"] if first else NO_TOOL,
+            "args": first["args"] if first else {},
+            "source": source,
+            "tools_bound": len(tool_definitions),
+            "tool_tokens": estimate_tool_tokens(tool_definitions),
+            "input_tokens": row.get("input_tokens"),
+        }
+
+    return run_batch(RunnableLambda(select), cases, max_concurrency=max_concurrency, chunk_size=chunk_size)
+
+
+def score_selections(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """정확도 / 도구별 precision·recall / 혼동 행렬 {예상: {실제: 개수}} 집계
+
+    응답을 얻지 못한 케이스(error)는 정확도에서 제외하고 따로 셉니다.
+    """
+    matrix: Dict[str, Dict[str, int]] = {}
+    labels: Dict[str, None] = {}
+    correct = total = errors = 0
+    for row in results:
+        if row["error"] is not None:
+            errors += 1
+            continue
+        expected, actual = row["input"]["expected_tool"], row["output"]["tool"]
+        labels.update({expected: None, actual: None})
+        matrix.setdefault(expected, {})
+        matrix[expected][actual] = matrix[expected].get(actual, 0) + 1
+        total += 1
+        correct += expected == actual
+
+    per_tool = {}
+    for label in labels:
+        true_positive = matrix.get(label, {}).get(label, 0)
+        predicted = sum(row.get(label, 0) for row in matrix.values())
+        actual = sum(matrix.get(label, {}).values())
+        per_tool[label] = {
+            "support": actual,
+            "precision": true_positive / predicted if predicted else 0.0,
+            "recall": true_positive / actual if actual else 0.0,
+        }
+
+    # 도구 이름 순, "None"은 마지막
+    ordered = sorted(labels, key=lambda label: (label == NO_TOOL, label))
+    return {
+        "total": total,
+        "correct": correct,
+        "errors": errors,
+        "accuracy": correct / total if total else 0.0,
+        "labels": ordered,
+        "matrix": matrix,
+        "per_tool": per_tool,
+    }
+
+
+def usage_totals(results: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """응답을 얻은 케이스의 평균 바인딩 도구 수 / 도구 정의 추정 토큰 / 실제 입력 토큰"""
+    rows = [row["output"] for row in results if row["error"] is None]
+    measured = [row["input_tokens"] for row in rows if row["input_tokens"] is not None]
+    count = len(rows) or 1
+    return {
+        "cases": len(rows),
+        "tools_bound": sum(row["tools_bound"] for row in rows) / count,
+        "tool_tokens": sum(row["tool_tokens"] for row in rows) / count,
+        "input_tokens": sum(measured) / len(measured) if measured else None,
+    }
+
+
+def format_confusion_matrix(score: Dict[str, Any]) -> str:
+    """혼동 행렬 + 도구별 precision / recall 표 (행: 예상, 열: 실제)"""
+    labels = score["labels"]
+    width = max([len(label) for label in labels] + [10]) + 2
+    lines = ["예상 \\ 실제".ljust(width) + "".join(label.rjust(width) for label in labels)
+             + "recall".rjust(9) + "precision".rjust(11)]
+    for expected in labels:
+        row = score["matrix"].get(expected, {})
+        stats = score["per_tool"][expected]
+        lines.append(
+            expected.ljust(width)
+            + "".join(str(row.get(actual, 0)).rjust(width) for actual in labels)
+            + f"{stats['recall']:>9.1%}{stats['precision']:>11.1%}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,123 @@
+"""
+async 수동 도구 실행 루프
+
+phase4 예제 2의 while 루프(llm_with_tools.invoke → 도구 실행 → ToolMessage 추가)를
+ainvoke 기반으로 옮겨, 한 프로세스에서 여러 대화를 동시에 처리합니다.
+
+- 대화마다 독립된 메시지 히스토리와 반복 횟수 상한 (max_iterations)
+- 전역 세마포어로 동시에 진행 중인 LLM 요청 수 제한 (max_concurrency)
+- 한 응답의 여러 tool_calls는 ToolRegistry.aexecute_many()로 동시 실행
+- rate를 주면 일정한 도착률(대화/초)로 대화를 시작 (부하 테스트용)
+
+사용법:
+    from common.tool_loop import arun_conversations
+
+    results, stats = asyncio.run(arun_conversations(
+        llm_with_tools, tool_registry, queries, max_concurrency=8, max_iterations=10,
+    ))
+    print(stats.get_report())
+"""
+
+import asyncio
+import contextlib
+import time
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from langchain_core.messages import AIMessage, HumanMessage
+
+from common.batch import LatencyStats
+from common.tool_registry import ToolRegistry
+
+
+async def arun_tool_loop(
+    llm_with_tools,
+    tool_registry: ToolRegistry,
+    query: str,
+    max_iterations: int = 10,
+    semaphore: Optional[asyncio.Semaphore] = None,
+) -> Dict[str, Any]:
+    """대화 하나를 도구 호출이 끝날 때까지 실행 (예외를 던지지 않음)
+
+    Returns:
+        {"query", "status", "answer", "iterations", "tool_calls", "latency", "messages", "error"}
+        status는 "done" (최종 답변) / "max_iterations" (상한 도달) / "error" (LLM 호출 실패)
+    """
+    started = time.perf_counter()
+    messages = [HumanMessage(content=query)]
+    result = {
+        "query": query,
+        "status": "max_iterations",
+        "answer": None,
+        "iterations": 0,
+        "tool_calls": 0,
+        "latency": 0.0,
+        "messages": messages,
+        "error": None,
+    }
+    guard = semaphore or contextlib.nullcontext()
+
+    try:
+        while result["iterations"] < max_iterations:
+            result["iterations"] += 1
+
+            # 세마포어는 LLM 요청에만 적용 (도구 실행 중에는 다른 대화가 LLM을 호출할 수 있도록)
+            async with guard:
+                response = await llm_with_tools.ainvoke(messages)
+
+            if not response.tool_calls:
+                result["status"] = "done"
+                result["answer"] = response.content
+                break
+
+            messages.append(AIMessage(content="", tool_calls=response.tool_calls))
+            tool_results = await tool_registry.aexecute_many(response.tool_calls)
+            messages.extend(tool_registry.to_message(tool_result) for tool_result in tool_results)
+            result["tool_calls"] += len(tool_results)
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+
+    result["latency"] = time.perf_counter() - started
+    return result
+
+
+async def arun_conversations(
+    llm_with_tools,
+    tool_registry: ToolRegistry,
+    queries: Sequence[str],
+    max_concurrency: int = 8,
+    max_iterations: int = 10,
+    rate: Optional[float] = None,
+    on_result=None,
+) -> Tuple[List[Dict[str, Any]], LatencyStats]:
+    """여러 대화를 동시에 실행하고 (결과 목록(queries 순서), 대화 단위 지연 통계) 반환
+
+    Args:
+        max_concurrency: 동시에 진행 중인 LLM 요청 수 상한 (전체 대화 공통)
+        max_iterations: 대화별 LLM 호출 횟수 상한
+        rate: 초당 시작할 대화 수. None이면 모두 즉시 시작
+        on_result: 대화가 끝날 때마다 호출되는 콜백 (순번, 결과)
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    stats = LatencyStats()
+
+    async def run(index: int, query: str) -> Dict[str, Any]:
+        if rate:
+            # 도착 시각을 미리 정해 두는 open-loop 방식 (앞선 대화가 느려도 도착률 유지)
+            delay = stats.start_time + index / rate - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+        result = await arun_tool_loop(
+            llm_with_tools, tool_registry, query,
+            max_iterations=max_iterations,
+            semaphore=semaphore,
+        )
+        stats.record(result["latency"], ok=result["status"] != "error")
+        if on_result:
+            on_result(index, result)
+        return result
+
+    stats.start()
+    results = await asyncio.gather(*(run(i, query) for i, query in enumerate(queries)))
+    stats.end()
+    return list(results), stats
@@ -0,0 +1,151 @@
+"""
+질문별 도구 사전 선택 (바인딩할 도구 스키마 줄이기)
+
+bind_tools()로 바인딩한 도구 정의는 매 요청의 입력 토큰에 포함됩니다.
+LLM을 호출하기 전에 도구 이름 + docstring에 대한 가벼운 어휘 인덱스로 질문과 관련된 도구만 고릅니다.
+
+- 용어: 영문/숫자 단어 (get_weather → get, weather, 숫자만으로 된 단어 제외) + 한글 연속 구간의 2글자 n-gram (조사/어미 제외)
+  + 산술 연산자(123 * 456)나 연산 단어(더하기, 나눈, 제곱)가 있으면 OPERATOR_TERM, 이때만 숫자마다 NUMBER_TERM
+  → "1234 더하기 5678은?"이 docstring 예시("123 * 456")와 같은 용어로 calculate에 매칭
+  → 연산 없이 숫자만 있는 연도 / 버전("2024년 노벨상", "파이썬 3.12")은 calculate 쪽으로 끌려가지 않음
+- 점수: 질문 용어 중 도구 문서에 있는 것의 idf 합 (idf = log(N / df))
+  → 모든 도구에 공통인 용어("합니다", "사용하세요")는 점수 0
+- 점수가 min_score 이상인 도구 중 상위 top_k개만 바인딩
+  동점이면 일치한 용어가 도구 문서에 더 많이 나오는 도구 → 그래도 같으면 도구 목록 순서
+- 관련 도구를 찾지 못하면 전체 도구로 폴백 (인사말 등 → 모델이 직접 판단)
+
+사용법:
+    selector = ToolSelector([get_weather, calculate, search_web], top_k=2)
+    llm_for_query = bind_tools_cached(llm, selector.select(query))   # 도구 조합별로 바인딩 캐시
+    print(selector.get_report())
+"""
+
+import json
+import math
+import re
+import threading
+from collections import Counter
+from typing import Any, Callable, Dict, List, Sequence
+
+_WORD = re.compile(r"[0-9a-z]+")
+_HANGUL = re.compile(r"[가-힣]+")
+
+_NUMBER = re.compile(r"\d")
+_OPERATOR = re.compile(r"[\d)]\s*(?:\*\*|[-+*/%^])\s*[\d(]")
+
+# 조사 / 어미로 자주 나오는 2-gram (도구와 무관하게 겹치므로 제외)
+STOPWORDS = {"에서", "에게", "으로", "니다", "합니", "하세", "세요", "하는", "하고", "해줘", "이나", "또는"}
+
+# 숫자 / 산술 연산을 나타내는 용어 (단어나 n-gram과 겹치지 않는 이름)
+NUMBER_TERM = "#number"
+OPERATOR_TERM = "#operator"
+
+# 한국어 산술 표현 (포함되면 OPERATOR_TERM)
+ARITHMETIC_WORDS = ("더하", "더한", "빼", "곱하", "곱한", "나누", "나눈", "제곱", "나머지", "평균", "합계")
+
+
+def _term_list(text: str) -> List[str]:
+    """용어 목록 (중복 포함, 불용어 제외)"""
+    text = text.lower()
+    # 숫자만으로 된 단어는 docstring 예시의 숫자("/ 3")와 우연히 겹칠 뿐이므로 용어에서 제외
+    found = [word for word in _WORD.findall(text) if not word.isdigit()]
+    for run in _HANGUL.findall(text):
+        if len(run) == 1:
+            found.append(run)
+        found.extend(run[i:i + 2] for i in range(len(run) - 1))
+    operators = [OPERATOR_TERM for _ in _OPERATOR.finditer(text)]
+    operators.extend(OPERATOR_TERM for word in ARITHMETIC_WORDS if word in text)
+    if operators:
+        # 숫자는 연산과 함께일 때만 산술 신호 (연도 / 버전 / 개수만으로는 계산 요청이 아님)
+        found.extend(NUMBER_TERM for _ in _NUMBER.finditer(text))
+        found.extend(operators)
+    return [term for term in found if term not in STOPWORDS]
+
+
+def terms(text: str) -> set:
+    """검색 용어 집합: 영문/숫자 단어 + 한글 2-gram (한 글자 구간은 그대로) + 연산 용어 (+ 연산이 있을 때 숫자 용어)"""
+    return set(_term_list(text))
+
+
+def estimate_tool_tokens(tool_definitions: Sequence[Dict[str, Any]]) -> int:
+    """바인딩된 도구 정의(JSON)의 입력 토큰 추정 (UTF-8 바이트 / 4)"""
+    return math.ceil(len(json.dumps(list(tool_definitions), ensure_ascii=False).encode("utf-8")) / 4)
+
+
+def _tool_name(tool: Any) -> str:
+    return getattr(tool, "name", None) or tool.__name__
+
+
+def _tool_text(tool: Any) -> str:
+    description = getattr(tool, "description", None) or tool.__doc__ or ""
+    return f"{_tool_name(tool).replace('_', ' ')} {description}"
+
+
+class ToolSelector:
+    """도구 이름 + docstring 어휘 인덱스로 질문별 도구 선택"""
+
+    def __init__(self, tools: Sequence[Callable], top_k: int = 2, min_score: float = 0.5):
+        """
+        Args:
+            tools: 전체 도구 목록 (폴백 시 그대로 반환, 선택 결과도 이 순서 유지)
+            top_k: 질문당 바인딩할 최대 도구 수
+            min_score: 관련 도구로 인정할 최소 점수 (없으면 전체 도구로 폴백)
+        """
+        self.tools = list(tools)
+        self.top_k = top_k
+        self.min_score = min_score
+        self._counts = [Counter(_term_list(_tool_text(tool))) for tool in self.tools]
+        self._terms = [set(counts) for counts in self._counts]
+
+        document_frequency: Dict[str, int] = {}
+        for tool_terms in self._terms:
+            for term in tool_terms:
+                document_frequency[term] = document_frequency.get(term, 0) + 1
+        n = len(self.tools)
+        self._idf = {term: math.log(n / df) for term, df in document_frequency.items()}
+
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "pruned": 0, "fallback": 0, "tools_bound": 0}
+
+    def scores(self, query: str) -> Dict[str, float]:
+        """도구 이름 → 점수 (도구 목록 순서)"""
+        query_terms = terms(query)
+        return {
+            _tool_name(tool): sum(self._idf[term] for term in query_terms & tool_terms)
+            for tool, tool_terms in zip(self.tools, self._terms)
+        }
+
+    def select(self, query: str) -> List[Callable]:
+        """질문에 바인딩할 도구 목록 (관련 도구가 없으면 전체)"""
+        query_terms = terms(query)
+        ranked = sorted(
+            (
+                # 점수 → 일치한 용어의 도구 문서 등장 횟수 → 도구 목록 순서
+                (-score, -sum(counts[term] for term in query_terms & counts.keys()), index)
+                for index, (score, counts) in enumerate(zip(self.scores(query).values(), self._counts))
+                if score >= self.min_score
+            )
+        )
+        chosen = sorted(index for _, _, index in ranked[:self.top_k])
+        selected = [self.tools[index] for index in chosen] if chosen else list(self.tools)
+
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats["tools_bound"] += len(selected)
+            if not chosen:
+                self.stats["fallback"] += 1
+            elif len(selected) < len(self.tools):
+                self.stats["pruned"] += 1
+        return selected
+
+    def get_report(self) -> str:
+        s = self.stats
+        average = s["tools_bound"] / s["requests"] if s["requests"] else 0.0
+        return f"""
+📊 도구 사전 선택 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+전체 도구: {len(self.tools)}개 / top_k {self.top_k} / 최소 점수 {self.min_score}
+요청: {s['requests']}회 (축소 {s['pruned']}회, 전체 폴백 {s['fallback']}회)
+요청당 평균 바인딩 도구: {average:.2f}개
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
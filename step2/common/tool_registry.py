@@ -0,0 +1,246 @@
+"""
+이름 기반 도구 실행 레지스트리
+
+수동 루프의 if tool_name == "get_weather": ... elif ... 분기를 대체합니다.
+
+- 이름 → 함수 dict 조회로 O(1) 디스패치 (도구 수백 개에서도 동일)
+- 등록 시 타입 힌트로 인자 검증기를 미리 컴파일 (TypeAdapter)
+- 잘못된 인자 / 알 수 없는 도구 / 도구 내부 예외를 예외 대신 구조화된 결과로 반환
+  → 루프가 중간에 TypeError로 멈추지 않고, 에러 내용을 ToolMessage로 LLM에 전달
+- 도구별 호출 수 / 에러 수 / 지연 시간 기록
+- 한 응답의 여러 tool_calls를 동시에 실행 (스레드 풀 / asyncio), 결과는 tool_calls 순서 유지
+
+사용법:
+    from common.tool_registry import ToolRegistry
+
+    registry = ToolRegistry([get_weather, calculate])
+    llm_with_tools = bind_tools_cached(llm, registry.tools)
+
+    for tool_call in response.tool_calls:
+        result = registry.execute(tool_call)
+        messages.append(registry.to_message(result))
+    print(registry.get_report())
+"""
+
+import asyncio
+import inspect
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence, get_type_hints
+
+from pydantic import ConfigDict, TypeAdapter, ValidationError
+from typing_extensions import NotRequired, Required, TypedDict
+
+
+def build_arg_validator(func: Callable) -> TypeAdapter:
+    """함수 시그니처와 타입 힌트로 인자 dict 검증기를 생성
+
+    기본값이 있는 인자는 생략 가능(NotRequired)하고, 정의되지 않은 인자는 거부합니다.
+    검증 결과는 그대로 func(**args)에 넘길 수 있는 dict입니다.
+    """
+    hints = get_type_hints(func)
+    fields = {}
+    for name, param in inspect.signature(func).parameters.items():
+        if param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        annotation = hints.get(name, Any)
+        fields[name] = Required[annotation] if param.default is param.empty else NotRequired[annotation]
+
+    args_type = TypedDict(f"{func.__name__}_args", fields)
+    args_type.__pydantic_config__ = ConfigDict(extra="forbid")
+    return TypeAdapter(args_type)
+
+
+class ToolRegistry:
+    """도구 이름 → (함수, 인자 검증기) 레지스트리"""
+
+    def __init__(self, tools: Optional[Sequence[Callable]] = None, max_workers: int = 8):
+        """
+        Args:
+            tools: 등록할 함수 목록
+            max_workers: execute_many()에서 동시에 실행할 도구 수 상한
+        """
+        self.max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None  # execute_many()에서 처음 필요할 때 생성
+        self._tools: Dict[str, Callable] = {}
+        self._validators: Dict[str, TypeAdapter] = {}
+        self._lock = threading.Lock()  # 도구를 동시에 실행하는 경우 통계 보호
+        self.stats: Dict[str, Dict[str, Any]] = {}
+        self.unknown_calls = 0
+        for tool in tools or []:
+            self.register(tool)
+
+    def register(self, func: Callable, name: Optional[str] = None) -> Callable:
+        """도구 등록 (데코레이터로도 사용 가능)"""
+        name = name or func.__name__
+        self._tools[name] = func
+        self._validators[name] = build_arg_validator(func)
+        self.stats[name] = {"calls": 0, "errors": 0, "total_time": 0.0, "max_time": 0.0}
+        return func
+
+    @property
+    def tools(self) -> List[Callable]:
+        """bind_tools()에 넘길 함수 목록 (등록 순서)"""
+        return list(self._tools.values())
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._tools
+
+    def __len__(self) -> int:
+        return len(self._tools)
+
+    def _record(self, name: str, latency: float, ok: bool):
+        with self._lock:
+            stats = self.stats[name]
+            stats["calls"] += 1
+            stats["total_time"] += latency
+            stats["max_time"] = max(stats["max_time"], latency)
+            if not ok:
+                stats["errors"] += 1
+
+    def _start(self, name: str, args: Dict[str, Any], call_id: Optional[str]):
+        """도구 조회 + 인자 검증
+
+        Returns:
+            (결과 dict, 함수, 검증된 인자). 알 수 없는 도구면 함수가 None,
+            인자 검증에 실패하면 검증된 인자가 None (결과 dict에 에러 기록)
+        """
+        result = {"id": call_id, "name": name, "ok": False, "content": None, "error": None, "latency": 0.0}
+
+        func = self._tools.get(name)
+        if func is None:
+            with self._lock:
+                self.unknown_calls += 1
+            result["error"] = {"type": "unknown_tool", "message": f"알 수 없는 도구: {name}"}
+            result["content"] = result["error"]["message"]
+            return result, None, None
+
+        try:
+            return result, func, self._validators[name].validate_python(args)
+        except ValidationError as e:
+            errors = [
+                {"field": ".".join(str(part) for part in error["loc"]), "type": error["type"], "msg": error["msg"]}
+                for error in e.errors(include_url=False)
+            ]
+            result["error"] = {"type": "invalid_arguments", "errors": errors}
+            result["content"] = f"{name} 인자 오류: " + "; ".join(f"{err['field']}: {err['msg']}" for err in errors)
+            return result, func, None
+
+    @staticmethod
+    def _set_output(result: Dict[str, Any], output: Any):
+        result["ok"] = True
+        result["content"] = output if isinstance(output, str) else str(output)
+
+    @staticmethod
+    def _set_exception(result: Dict[str, Any], e: Exception):
+        result["error"] = {"type": "tool_error", "message": f"{type(e).__name__}: {e}"}
+        result["content"] = f"{result['name']} 실행 오류: {result['error']['message']}"
+
+    def _finish(self, result: Dict[str, Any], started: float, record: bool = True) -> Dict[str, Any]:
+        result["latency"] = time.perf_counter() - started
+        if record:
+            self._record(result["name"], result["latency"], result["ok"])
+        return result
+
+    def record(self, result: Dict[str, Any]):
+        """call(record=False)로 실행한 결과를 나중에 통계에 반영 (예: 추측 실행 결과를 실제로 사용한 경우)"""
+        if result["name"] in self.stats:
+            self._record(result["name"], result["latency"], result["ok"])
+
+    def call(self, name: str, args: Dict[str, Any], call_id: Optional[str] = None, record: bool = True) -> Dict[str, Any]:
+        """도구 실행 결과를 dict로 반환 (예외를 던지지 않음)
+
+        Args:
+            record: False면 도구별 통계에 기록하지 않음 (사용될지 모르는 미리 실행용, 사용 시 record()로 반영)
+
+        Returns:
+            {"id", "name", "ok", "content", "error", "latency"}
+            error는 None 또는 {"type": "unknown_tool" | "invalid_arguments" | "tool_error", ...}
+        """
+        started = time.perf_counter()
+        result, func, validated = self._start(name, args, call_id)
+        if func is None:
+            return result
+
+        if validated is not None:
+            try:
+                if inspect.iscoroutinefunction(func):
+                    self._set_output(result, asyncio.run(func(**validated)))
+                else:
+                    self._set_output(result, func(**validated))
+            except Exception as e:
+                self._set_exception(result, e)
+        return self._finish(result, started, record)
+
+    async def acall(self, name: str, args: Dict[str, Any], call_id: Optional[str] = None) -> Dict[str, Any]:
+        """call()의 async 버전 (async 도구는 await, 동기 도구는 스레드에서 실행)"""
+        started = time.perf_counter()
+        result, func, validated = self._start(name, args, call_id)
+        if func is None:
+            return result
+
+        if validated is not None:
+            try:
+                if inspect.iscoroutinefunction(func):
+                    self._set_output(result, await func(**validated))
+                else:
+                    self._set_output(result, await asyncio.to_thread(func, **validated))
+            except Exception as e:
+                self._set_exception(result, e)
+        return self._finish(result, started)
+
+    def execute(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+        """response.tool_calls의 원소 하나를 실행"""
+        return self.call(tool_call["name"], tool_call.get("args") or {}, tool_call.get("id"))
+
+    async def aexecute(self, tool_call: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.acall(tool_call["name"], tool_call.get("args") or {}, tool_call.get("id"))
+
+    def execute_many(self, tool_calls: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """한 응답의 tool_calls를 스레드 풀에서 동시에 실행
+
+        결과는 완료 순서와 관계없이 tool_calls 순서 그대로 반환하므로,
+        ToolMessage 순서가 항상 같고 각 결과는 자신의 tool_call_id를 유지합니다.
+        """
+        if len(tool_calls) <= 1:
+            return [self.execute(tool_call) for tool_call in tool_calls]
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="tool")
+        return list(self._pool.map(self.execute, tool_calls))
+
+    async def aexecute_many(self, tool_calls: Sequence[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """execute_many()의 async 버전 (asyncio.gather, tool_calls 순서 유지)"""
+        return list(await asyncio.gather(*(self.aexecute(tool_call) for tool_call in tool_calls)))
+
+    @staticmethod
+    def to_message(result: Dict[str, Any]):
+        """실행 결과를 ToolMessage로 변환 (실패 시 status="error")"""
+        from langchain_core.messages import ToolMessage
+
+        return ToolMessage(
+            content=result["content"],
+            tool_call_id=result["id"],
+            status="success" if result["ok"] else "error",
+        )
+
+    def get_report(self) -> str:
+        lines = []
+        for name, s in self.stats.items():
+            if not s["calls"]:
+                continue
+            avg = s["total_time"] / s["calls"]
+            lines.append(
+                f"  - {name}: {s['calls']}회 (에러 {s['errors']}회), "
+                f"평균 {avg * 1000:.2f}ms / 최대 {s['max_time'] * 1000:.2f}ms"
+            )
+        body = "\n".join(lines) or "  (호출 없음)"
+        return f"""
+📊 도구 실행 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+등록된 도구: {len(self._tools)}개 / 알 수 없는 도구 호출: {self.unknown_calls}회
+{body}
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
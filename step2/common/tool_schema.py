@@ -0,0 +1,193 @@
+"""
+bind_tools() 스키마 캐시
+
+llm.bind_tools([get_weather, ...])는 호출할 때마다 함수 시그니처와 docstring을 분석해
+JSON 스키마(tool 정의)를 새로 만듭니다. 요청마다 다시 바인딩하는 서비스에서는 이 비용이 반복됩니다.
+
+- 함수 → tool 정의 변환 결과를 함수 객체(identity)와 소스 해시 기준으로 캐시
+  (같은 소스로 다시 정의된 함수, 예: 모듈 reload도 재사용)
+  소스가 같아도 스키마가 달라지는 속성(__name__, 기본값, 어노테이션, docstring)은 키에 포함
+  → 같은 팩토리로 만든 도구들이 서로의 tool 정의를 공유하지 않음
+- 이미 변환된 tool 정의(dict)를 bind_tools에 넘기므로 바인딩은 사실상 dict 조회
+- (llm, tools, 옵션)이 같으면 바인딩된 모델 자체를 재사용
+  (최근 max_bound개만 LRU로 보관: 요청마다 llm을 새로 만들거나 도구 조합이 바뀌어도 메모리가 늘지 않음)
+
+사용법:
+    from common.tool_schema import bind_tools_cached
+
+    llm_with_tools = bind_tools_cached(llm, [get_weather, calculate])
+"""
+
+import hashlib
+import inspect
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+def _default_converter(tool: Any) -> Dict[str, Any]:
+    # ChatAnthropic.bind_tools()가 내부에서 쓰는 것과 같은 변환 함수
+    from langchain_anthropic.chat_models import convert_to_anthropic_tool
+
+    return dict(convert_to_anthropic_tool(tool))
+
+
+def source_hash(func: Callable) -> str:
+    """함수 소스 코드의 해시 (소스를 읽을 수 없으면 바이트코드 기준)"""
+    try:
+        source = inspect.getsource(func)
+    except (OSError, TypeError):
+        code = func.__code__
+        source = repr((code.co_code, code.co_consts, code.co_varnames))
+    return hashlib.sha1(source.encode("utf-8")).hexdigest()
+
+
+def schema_state(tool: Any) -> Tuple[Optional[str], ...]:
+    """소스 코드 밖에서 tool 정의에 영향을 주는 속성 (docstring, 이름, 기본값, 어노테이션)
+
+    기본값은 리스트 등 해시할 수 없는 값일 수 있으므로 repr로 비교합니다.
+    """
+    return (
+        getattr(tool, "__doc__", None),
+        getattr(tool, "__name__", None),
+        repr(getattr(tool, "__defaults__", None)),
+        repr(getattr(tool, "__kwdefaults__", None)),
+        repr(getattr(tool, "__annotations__", None)),
+    )
+
+
+class ToolSchemaCache:
+    """tool 정의 변환 결과와 바인딩된 모델을 보관하는 캐시"""
+
+    def __init__(self, converter: Optional[Callable[[Any], Dict[str, Any]]] = None, max_bound: int = 128):
+        """
+        Args:
+            converter: tool → 제공자별 tool 정의 변환 함수 (기본: Anthropic 형식)
+            max_bound: 보관할 바인딩된 모델 수 상한 (가장 오래 사용하지 않은 것부터 제거)
+        """
+        self.converter = converter or _default_converter
+        self.max_bound = max_bound
+        # id(tool) → (tool, code, schema_state, tool 정의): 같은 객체라도 코드/docstring/기본값 등이 바뀌면 다시 변환
+        # (BaseTool처럼 해시할 수 없는 객체도 있으므로 id를 키로 쓰고 객체는 identity로 확인)
+        self._by_identity: Dict[int, Tuple[Any, Any, Tuple, Dict[str, Any]]] = {}
+        # (모듈, qualname, 소스 해시, schema_state) → tool 정의
+        self._by_source: Dict[Tuple, Dict[str, Any]] = {}
+        # (llm id, tool 정의 id들, 옵션) → (llm, tool 정의 목록, 바인딩된 모델), LRU 순서
+        # 항목이 llm을 참조하므로 상한이 없으면 요청마다 만든 llm이 해제되지 않음
+        self._bound: "OrderedDict[Tuple, Tuple[Any, List[Dict[str, Any]], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0,
+            "source_hits": 0,
+            "conversions": 0,
+            "convert_time": 0.0,
+            "bind_hits": 0,
+            "binds": 0,
+            "bind_evictions": 0,
+        }
+
+    # ------------------------------------------------------------------
+    # tool 정의 변환
+    # ------------------------------------------------------------------
+
+    def _convert(self, tool: Any) -> Dict[str, Any]:
+        started = time.perf_counter()
+        schema = self.converter(tool)
+        self.stats["convert_time"] += time.perf_counter() - started
+        self.stats["conversions"] += 1
+        return schema
+
+    def convert(self, tool: Any) -> Dict[str, Any]:
+        """tool 하나를 tool 정의로 변환 (캐시 사용)"""
+        if isinstance(tool, dict):
+            return self.converter(tool)  # 이미 정의 형식이면 변환 비용이 거의 없음
+
+        code = getattr(tool, "__code__", None)
+        state = schema_state(tool)
+        entry = self._by_identity.get(id(tool))
+        if entry is not None and entry[0] is tool and entry[1] is code and entry[2] == state:
+            self.stats["hits"] += 1
+            return entry[3]
+
+        with self._lock:
+            if code is not None:
+                # 팩토리로 만든 도구는 소스 / qualname이 같으므로 이름, 기본값 등도 함께 키에 포함
+                key = (tool.__module__, tool.__qualname__, source_hash(tool), state)
+                schema = self._by_source.get(key)
+                if schema is not None:
+                    self.stats["source_hits"] += 1
+                else:
+                    schema = self._convert(tool)
+                    self._by_source[key] = schema
+            else:
+                # BaseTool / Pydantic 클래스 등은 객체 identity로만 캐시
+                schema = self._convert(tool)
+            self._by_identity[id(tool)] = (tool, code, state, schema)
+        return schema
+
+    def convert_all(self, tools: Sequence[Any]) -> List[Dict[str, Any]]:
+        return [self.convert(tool) for tool in tools]
+
+    # ------------------------------------------------------------------
+    # 바인딩
+    # ------------------------------------------------------------------
+
+    def bind(self, llm, tools: Sequence[Any], **kwargs):
+        """llm.bind_tools(tools, **kwargs)와 같지만 tool 정의와 바인딩 결과를 재사용
+
+        tool 정의(dict)를 직접 넘긴 경우는 요청마다 새 객체일 수 있으므로 바인딩을 캐시하지 않습니다.
+        """
+        schemas = self.convert_all(tools)
+        if any(isinstance(tool, dict) for tool in tools):
+            return llm.bind_tools(schemas, **kwargs)
+
+        key = (
+            id(llm),
+            tuple(id(schema) for schema in schemas),
+            tuple(sorted((name, repr(value)) for name, value in kwargs.items())),
+        )
+        with self._lock:
+            entry = self._bound.get(key)
+            if entry is not None and entry[0] is llm and all(a is b for a, b in zip(entry[1], schemas)):
+                self._bound.move_to_end(key)
+                self.stats["bind_hits"] += 1
+                return entry[2]
+
+        bound = llm.bind_tools(schemas, **kwargs)
+        with self._lock:
+            self._bound[key] = (llm, schemas, bound)
+            self._bound.move_to_end(key)
+            self.stats["binds"] += 1
+            while len(self._bound) > self.max_bound:
+                self._bound.popitem(last=False)
+                self.stats["bind_evictions"] += 1
+        return bound
+
+    def clear(self):
+        with self._lock:
+            self._by_identity.clear()
+            self._by_source.clear()
+            self._bound.clear()
+
+    def get_report(self) -> str:
+        s = self.stats
+        lookups = s["hits"] + s["source_hits"] + s["conversions"]
+        hit_rate = (s["hits"] + s["source_hits"]) / lookups if lookups else 0.0
+        return f"""
+📊 tool 스키마 캐시 보고서
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+스키마 조회: {lookups}회 (적중 {hit_rate:.1%}, 소스 해시 적중 {s['source_hits']}회)
+스키마 변환: {s['conversions']}회 ({s['convert_time'] * 1000:.2f}ms)
+바인딩: 새로 생성 {s['binds']}회 / 재사용 {s['bind_hits']}회 / 제거 {s['bind_evictions']}회 (보관 {len(self._bound)}개 / 최대 {self.max_bound}개)
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+"""
+
+
+# 프로세스 전역 인스턴스
+tool_schema_cache = ToolSchemaCache()
+
+
+def bind_tools_cached(llm, tools: Sequence[Any], **kwargs):
+    """전역 캐시를 사용하는 llm.bind_tools() 대체 함수"""
+    return tool_schema_cache.bind(llm, tools, **kwargs)
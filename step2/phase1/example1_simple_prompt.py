@@ -4,22 +4,50 @@ Step 1 - 예제 1: 간단한 PromptTemplate 사용
 학습 목표:
 - PromptTemplate의 기본 사용법 이해
 - 변수를 사용한 동적 프롬프트 생성
+- 프롬프트만 만드는 경로는 LangChain import 비용 없이 (--compiled)
+
+실행:
+    python phase1/example1_simple_prompt.py             # PromptTemplate (사용 시점에 import)
+    python phase1/example1_simple_prompt.py --compiled  # CompiledPrompt (LangChain import 없음)
 """
 
-from langchain.prompts import PromptTemplate
+import argparse
+import sys
+from pathlib import Path
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.prompt_renderer import CompiledPrompt
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="간단한 PromptTemplate")
+    parser.add_argument(
+        "--compiled", action="store_true",
+        help="PromptTemplate 대신 CompiledPrompt로 렌더링 (같은 결과, LangChain import 없음)"
+    )
+    return parser.parse_args()
 
 
 def main():
+    args = parse_args()
+
     print("=" * 50)
     print("예제 1: 간단한 PromptTemplate")
     print("=" * 50)
 
     # 1. PromptTemplate 정의
     template = "안녕하세요, {name}님! {greeting}"
-    prompt = PromptTemplate(
-        input_variables=["name", "greeting"],
-        template=template
-    )
+    if args.compiled:
+        prompt = CompiledPrompt(template)
+    else:
+        # langchain.prompts는 PromptTemplate을 실제로 만들 때 import (--compiled면 import하지 않음)
+        from langchain.prompts import PromptTemplate
+
+        prompt = PromptTemplate(
+            input_variables=["name", "greeting"],
+            template=template
+        )
 
     # 2. 프롬프트 생성 (변수 삽입)
     result = prompt.format(name="철수", greeting="오늘 날씨가 좋네요.")
@@ -35,6 +63,7 @@ def main():
     print("2. input_variables로 사용할 변수를 선언합니다.")
     print("3. format() 메서드로 변수에 값을 삽입합니다.")
     print("4. 같은 템플릿을 다른 값으로 재사용할 수 있습니다.")
+    print("5. 프롬프트만 만들 때는 CompiledPrompt로 LangChain import 비용을 피할 수 있습니다.")
     print("=" * 50)
 
 
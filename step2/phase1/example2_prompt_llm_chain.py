@@ -8,9 +8,17 @@ Step 1 - 예제 2: PromptTemplate + LLM 체인
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
-from langchain_anthropic import ChatAnthropic
-from langchain.prompts import PromptTemplate
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.lazy import lazy_module
+
+# LLM 스택은 실제로 체인을 만들 때 import (API 키가 없을 때 등 시작 시간 단축)
+langchain_anthropic = lazy_module("langchain_anthropic")
+langchain_prompts = lazy_module("langchain.prompts")
 
 # 환경 변수 로드
 load_dotenv()
@@ -33,13 +41,13 @@ def main():
 
 사용자에게 관심사와 관련된 추천을 3가지 해주세요."""
 
-    prompt = PromptTemplate(
+    prompt = langchain_prompts.PromptTemplate(
         input_variables=["name", "interest"],
         template=template
     )
 
     # 2. LLM 설정 (Anthropic Claude)
-    llm = ChatAnthropic(
+    llm = langchain_anthropic.ChatAnthropic(
         model="claude-3-haiku-20240307",  # Claude 3 Haiku (가장 저렴)
         temperature=0.7
     )
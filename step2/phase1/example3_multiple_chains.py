@@ -7,9 +7,18 @@ Step 1 - 예제 3: 여러 입력으로 체인 반복 실행
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
-from langchain_anthropic import ChatAnthropic
-from langchain.prompts import PromptTemplate
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.lazy import lazy_module
+
+# LLM 스택은 실제로 체인을 만들 때 import (API 키가 없을 때 등 시작 시간 단축)
+langchain_anthropic = lazy_module("langchain_anthropic")
+langchain_prompts = lazy_module("langchain.prompts")
+llm_cache_module = lazy_module("common.llm_cache")
 
 # 환경 변수 로드
 load_dotenv()
@@ -28,17 +37,20 @@ def main():
 
     # 1. PromptTemplate 정의
     template = "{country}의 수도는 어디인가요? 간단히 답변해주세요."
-    prompt = PromptTemplate(
+    prompt = langchain_prompts.PromptTemplate(
         input_variables=["country"],
         template=template
     )
 
     # 2. LLM 설정 (temperature=0으로 일관된 답변, Anthropic Claude)
-    llm = ChatAnthropic(
+    llm = langchain_anthropic.ChatAnthropic(
         model="claude-3-haiku-20240307",  # Claude 3 Haiku (가장 저렴)
         temperature=0
     )
 
+    # 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+    llm_cache = llm_cache_module.enable_llm_cache_from_env()
+
     # 3. 체인 구성
     chain = prompt | llm
 
@@ -50,12 +62,16 @@ def main():
         response = chain.invoke({"country": country})
         print(f"{country}: {response.content}")
 
+    if llm_cache:
+        print(f"\n{llm_cache.get_report()}")
+
     print("\n" + "=" * 50)
     print("학습 포인트:")
     print("1. 한 번 정의한 체인을 여러 입력값으로 재사용할 수 있습니다.")
     print("2. temperature=0은 일관되고 결정적인 답변을 생성합니다.")
     print("3. 반복문으로 대량의 데이터를 효율적으로 처리할 수 있습니다.")
     print("4. 프롬프트 템플릿을 사용하면 코드 재사용성이 높아집니다.")
+    print("5. 입력이 많다면 example4_batch_mode.py의 chain.batch() 동시 실행을 사용하세요.")
     print("=" * 50)
 
 
@@ -0,0 +1,122 @@
+"""
+Step 1 - 예제 4: 배치 모드로 체인 동시 실행
+
+학습 목표:
+- 예제 3의 for 루프(순차 invoke)를 chain.batch() / abatch()로 대체
+- max_concurrency로 동시 요청 수 제한 (API rate limit 대응)
+- JSONL 입력 → JSONL 출력 (입력 순서 유지)
+- 처리량(rows/s)과 p50/p95 지연 시간 측정
+
+실행 예:
+    python phase1/example4_batch_mode.py
+    python phase1/example4_batch_mode.py --input countries.jsonl --output answers.jsonl --max-concurrency 16
+    python phase1/example4_batch_mode.py --input countries.jsonl --async
+
+입력 JSONL 한 줄 형식:
+    {"country": "대한민국"}
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
+from langchain.prompts import PromptTemplate
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.batch import read_jsonl, run_batch
+from common.llm_cache import enable_llm_cache_from_env
+
+# 환경 변수 로드
+load_dotenv()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="PromptTemplate | LLM 체인 배치 실행")
+    parser.add_argument("--input", help="입력 JSONL 파일 (없으면 예제 국가 목록 사용)")
+    parser.add_argument("--output", help="출력 JSONL 파일 (없으면 화면 출력)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="동시 요청 수 (기본 8)")
+    parser.add_argument("--chunk-size", type=int, default=1000, help="한 번에 batch로 넘길 행 수 (기본 1000)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="abatch()로 실행")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # API 키 확인
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("ERROR: ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        print(".env 파일을 생성하고 API 키를 설정해주세요.")
+        return
+
+    print("=" * 50)
+    print("예제 4: 배치 모드로 체인 동시 실행")
+    print("=" * 50)
+
+    # 1. 체인 구성 (예제 3과 동일)
+    template = "{country}의 수도는 어디인가요? 간단히 답변해주세요."
+    prompt = PromptTemplate(
+        input_variables=["country"],
+        template=template
+    )
+
+    llm = ChatAnthropic(
+        model="claude-3-haiku-20240307",  # Claude 3 Haiku (가장 저렴)
+        temperature=0
+    )
+
+    # 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+    llm_cache = enable_llm_cache_from_env()
+
+    chain = prompt | llm
+
+    # 2. 입력 준비
+    if args.input:
+        rows = read_jsonl(args.input)
+        source = args.input
+    else:
+        rows = [{"country": c} for c in ["대한민국", "일본", "프랑스", "브라질"]]
+        source = "예제 국가 목록"
+
+    print(f"\n입력: {source}")
+    print(f"실행 방식: {'abatch()' if args.use_async else 'batch()'}")
+    print(f"max_concurrency: {args.max_concurrency}")
+
+    # 3. 배치 실행
+    print("\n[실행 중...]\n")
+    results, stats = run_batch(
+        chain,
+        rows,
+        max_concurrency=args.max_concurrency,
+        chunk_size=args.chunk_size,
+        use_async=args.use_async,
+        output_path=args.output,
+    )
+
+    if args.output:
+        print(f"결과 저장: {args.output}")
+    else:
+        for result in results:
+            if result["error"]:
+                print(f"{result['input'].get('country', '?')}: ❌ {result['error']}")
+            else:
+                print(f"{result['input'].get('country', '?')}: {result['output']}")
+
+    print(stats.get_report())
+    if llm_cache:
+        print(llm_cache.get_report())
+
+    print("=" * 50)
+    print("학습 포인트:")
+    print("1. chain.batch()는 여러 입력을 동시에 실행하고, 결과를 입력 순서대로 반환합니다.")
+    print("2. max_concurrency로 동시 요청 수를 제한해 rate limit을 지킵니다.")
+    print("3. 처리량과 p95 지연 시간을 보고 동시성 수준을 조절합니다.")
+    print("4. 순차 invoke는 N건에 N번의 왕복 시간이 그대로 더해집니다.")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+"""
+Step 1 - 예제 5: 스트리밍 실행과 TTFT 측정
+
+학습 목표:
+- chain.invoke()(블로킹)와 chain.stream()(스트리밍)의 차이 이해
+- 토큰이 도착하는 즉시 화면에 출력하기
+- TTFT(Time To First Token), 토큰 간 지연, 전체 지연 시간 비교
+
+실행 예:
+    python phase1/example5_streaming.py
+    python phase1/example5_streaming.py --runs 3 --async
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
+from langchain.prompts import PromptTemplate
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.streaming import (
+    astream_with_timing,
+    format_comparison,
+    invoke_with_timing,
+    stream_with_timing,
+)
+
+# 환경 변수 로드
+load_dotenv()
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="블로킹 vs 스트리밍 지연 시간 비교")
+    parser.add_argument("--runs", type=int, default=1, help="모드별 반복 횟수 (기본 1)")
+    parser.add_argument("--async", dest="use_async", action="store_true", help="astream()으로 스트리밍")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # API 키 확인
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("ERROR: ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        print(".env 파일을 생성하고 API 키를 설정해주세요.")
+        return
+
+    print("=" * 50)
+    print("예제 5: 스트리밍 실행과 TTFT 측정")
+    print("=" * 50)
+
+    # 1. 체인 구성 (예제 2와 동일)
+    template = """당신은 친절한 AI 어시스턴트입니다.
+사용자의 이름은 {name}이고, 관심사는 {interest}입니다.
+
+사용자에게 관심사와 관련된 추천을 3가지 해주세요."""
+
+    prompt = PromptTemplate(
+        input_variables=["name", "interest"],
+        template=template
+    )
+
+    llm = ChatAnthropic(
+        model="claude-3-haiku-20240307",  # Claude 3 Haiku (가장 저렴)
+        temperature=0.7
+    )
+
+    chain = prompt | llm
+    inputs = {"name": "민수", "interest": "파이썬 프로그래밍"}
+
+    rows = []
+    for run in range(1, args.runs + 1):
+        # 2. 블로킹 실행: 전체 응답이 끝나야 출력 가능
+        print(f"\n[블로킹 실행 {run}/{args.runs}]\n")
+        text, timing = invoke_with_timing(chain, inputs)
+        print(text)
+        rows.append(("invoke", timing))
+
+        # 3. 스트리밍 실행: 토큰이 도착하는 즉시 출력
+        print(f"\n\n[스트리밍 실행 {run}/{args.runs}]\n")
+        if args.use_async:
+            _, timing = asyncio.run(astream_with_timing(chain, inputs))
+            rows.append(("astream", timing))
+        else:
+            _, timing = stream_with_timing(chain, inputs)
+            rows.append(("stream", timing))
+        print()
+
+    # 4. 비교
+    print("\n" + "=" * 50)
+    print("지연 시간 비교")
+    print("=" * 50)
+    print(format_comparison(rows))
+
+    print("\n" + "=" * 50)
+    print("학습 포인트:")
+    print("1. invoke()는 전체 응답이 끝난 뒤에야 첫 글자를 보여줄 수 있습니다 (TTFT = 전체 시간).")
+    print("2. stream()은 첫 토큰이 도착하자마자 출력하므로 체감 대기 시간이 줄어듭니다.")
+    print("3. 전체 지연 시간은 비슷하지만, 채팅 UI에서는 TTFT가 더 중요한 지표입니다.")
+    print("4. astream()은 비동기 서버(FastAPI 등)에서 같은 방식으로 사용합니다.")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,41 @@ Step 2 - 예제 2: PydanticOutputParser + LLM 체인
 - PydanticOutputParser를 LLM 체인에 통합
 - LLM 응답을 구조화된 Pydantic 객체로 변환
 - partial_variables로 포맷 지시문 주입
+- 형식이 조금 어긋난 응답은 로컬 복구 후 검증 (복구 실패 시에만 LLM 재요청)
+- --mode tool: 포맷 지시문 없이 모델의 tool calling 채널로 구조화 출력
+
+실행:
+    python phase2/example2_parser_llm_chain.py              # parser 모드 (기본)
+    python phase2/example2_parser_llm_chain.py --mode tool  # tool calling 모드
 """
 
+import argparse
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from langchain.prompts import PromptTemplate
-from langchain.output_parsers import PydanticOutputParser
+from langchain.output_parsers import OutputFixingParser
+from langchain_core.output_parsers import StrOutputParser
 from langchain_anthropic import ChatAnthropic
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.schema_registry import registry
+from common.json_repair import RepairingParser
+from common.structured_output import structured_chain
+
 # 환경 변수 로드
 load_dotenv()
 
+arg_parser = argparse.ArgumentParser(description="PydanticOutputParser + LLM 체인")
+arg_parser.add_argument(
+    "--mode", choices=["parser", "tool"], default="parser",
+    help="parser: 포맷 지시문 + 텍스트 파싱 / tool: with_structured_output (기본 parser)"
+)
+args = arg_parser.parse_args()
+
 print("=" * 50)
 print("예제 2: PydanticOutputParser + LLM 체인")
 print("=" * 50)
@@ -33,21 +56,24 @@ class MovieInfo(BaseModel):
 print("📌 1. Pydantic 모델 정의 완료")
 print()
 
-# 2. PydanticOutputParser 생성
-parser = PydanticOutputParser(pydantic_object=MovieInfo)
+# 2. PydanticOutputParser 생성 (레지스트리: 모델 클래스당 한 번만 생성)
+# warm_up()은 parser, JSON 스키마, 포맷 지시문, 검증기를 미리 만들어 둠
+warm_up_time = registry.warm_up(MovieInfo)
+parser = registry.get_parser(MovieInfo)
 
 print("📌 2. PydanticOutputParser 생성 완료")
+print(f"   - 스키마/검증기 준비(warm-up): {warm_up_time * 1000:.1f}ms")
 print()
 
-# 3. 포맷 지시문 확인
-format_instructions = parser.get_format_instructions()
+# 3. 포맷 지시문 확인 (캐시된 문자열 재사용)
+format_instructions = registry.get_format_instructions(MovieInfo)
 print("📌 3. Parser가 생성한 포맷 지시문:")
 print("-" * 50)
 print(format_instructions)
 print("-" * 50)
 print()
 
-# 4. PromptTemplate 정의 (포맷 지시문 포함)
+# 4. PromptTemplate 정의 (parser 모드만 포맷 지시문 포함)
 template = """당신은 영화 정보 제공 어시스턴트입니다.
 
 사용자가 요청한 영화에 대해 다음 정보를 제공해주세요:
@@ -63,13 +89,16 @@ template = """당신은 영화 정보 제공 어시스턴트입니다.
 
 prompt = PromptTemplate(
     input_variables=["movie_query"],
-    partial_variables={"format_instructions": parser.get_format_instructions()},
+    partial_variables={"format_instructions": format_instructions if args.mode == "parser" else ""},
     template=template
 )
 
 print("📌 4. PromptTemplate 생성 완료")
 print("   - input_variables: ['movie_query']")
-print("   - partial_variables: format_instructions (자동 주입)")
+if args.mode == "parser":
+    print("   - partial_variables: format_instructions (자동 주입)")
+else:
+    print("   - tool 모드: 포맷 지시문 생략 (스키마는 tool 정의로 전달)")
 print()
 
 # 5. LLM 설정
@@ -81,11 +110,25 @@ llm = ChatAnthropic(
 print("📌 5. LLM 설정 완료 (claude-3-haiku-20240307)")
 print()
 
-# 6. 체인 구성: prompt | llm | parser
-chain = prompt | llm | parser
+# 6. 체인 구성: prompt | llm | (로컬 복구 → parser 검증)
+# 로컬 복구로 못 고친 경우에만 OutputFixingParser가 LLM에 다시 요청
+repair_parser = RepairingParser(
+    MovieInfo,
+    fallback=OutputFixingParser.from_llm(llm=llm, parser=parser)
+)
+if args.mode == "parser":
+    chain = prompt | llm | StrOutputParser() | repair_parser.parse
 
-print("📌 6. 체인 구성 완료")
-print("   chain = prompt | llm | parser")
+    print("📌 6. 체인 구성 완료")
+    print("   chain = prompt | llm | StrOutputParser() | repair_parser.parse")
+    print("   - 후행 쉼표, 코드 펜스, 앞뒤 설명 문장, \"2010년\" 같은 숫자 문자열은 로컬에서 복구")
+    print("   - 로컬 복구 실패 시에만 OutputFixingParser로 재요청")
+else:
+    # 모델이 MovieInfo tool 호출로 답하도록 강제하고, tool 인자를 MovieInfo로 검증
+    chain = structured_chain(prompt, llm, MovieInfo)
+
+    print("📌 6. 체인 구성 완료 (tool 모드)")
+    print("   chain = prompt | llm.with_structured_output(MovieInfo)")
 print()
 
 # 7. 체인 실행 (사용자 확인 필요)
@@ -124,6 +167,43 @@ print("📌 딕셔너리 변환:")
 print(f"  {result.dict()}")
 print()
 
+# 9. 로컬 복구 예시 (LLM 호출 없음)
+print("=" * 50)
+print("📌 9. 형식이 어긋난 응답의 로컬 복구 예시")
+print("=" * 50)
+print()
+
+malformed_outputs = [
+    '```json\n{"title": "기생충", "director": "봉준호", "year": 2019, "genre": "드라마"}\n```',
+    '{"title": "올드보이", "director": "박찬욱", "year": 2003, "genre": "스릴러",}',
+    '요청하신 영화 정보입니다.\n{"title": "괴물", "director": "봉준호", "year": 2006, "genre": "SF"}',
+    '{"title": "살인의 추억", "director": "봉준호", "year": "2003년", "genre": "범죄"}',
+    '{"title": "매트릭스", "director": "워쇼스키", "year": "약 1,999년", "genre": "SF"}',
+]
+
+for text in malformed_outputs:
+    movie, fixes, _ = repair_parser.repair(text)
+    print(f"  - 복구: {', '.join(fixes)}")
+    print(f"    결과: {movie}")
+print()
+
+# 로컬에서 고치면 틀린 값이 통과하는 응답은 재요청(fallback)으로 넘김
+needs_reask = [
+    '{"title": "a", "year": 20',  # 잘린 응답: 괄호를 닫으면 year=20으로 통과
+    '{"title": "박하사탕", "director": "이창동", "year": "1999~2000년", "genre": "드라마"}',  # 숫자가 두 개
+]
+
+for text in needs_reask:
+    movie, _, error = repair_parser.repair(text)
+    if movie is not None:
+        raise RuntimeError(f"재요청으로 넘겨야 하는 응답을 로컬에서 통과시켰습니다: {text!r} → {movie}")
+    print(f"  - 재요청: {text!r}")
+    print(f"    이유: {str(error).splitlines()[0]}")
+print()
+
+if args.mode == "parser":
+    print(repair_parser.get_report())
+
 print("=" * 50)
 print("✅ 예제 2 완료!")
 print()
@@ -132,4 +212,7 @@ print("1. PydanticOutputParser로 LLM 응답 파싱")
 print("2. partial_variables로 포맷 지시문 자동 주입")
 print("3. chain = prompt | llm | parser 구성")
 print("4. 결과는 Pydantic 객체 (속성 접근 가능)")
+print("5. 흔한 형식 오류는 로컬 복구로 처리해 재요청 비용/지연 절약")
+print("6. --mode tool: with_structured_output으로 포맷 지시문 토큰 제거")
+print("   (토큰/지연 비교: python benchmarks/structured_output.py)")
 print("=" * 50)
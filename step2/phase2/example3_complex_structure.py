@@ -3,21 +3,44 @@ Step 2 - 예제 3: 복잡한 구조 (리스트 포함) + 반복 실행
 
 목표:
 - 리스트를 포함한 복잡한 Pydantic 모델 정의
-- 여러 입력으로 체인 재사용
+- 여러 입력으로 체인 재사용 (카테고리를 동시에 실행, 완료되는 대로 검증)
 - 실전적인 데이터 구조 활용
+- --mode tool: 포맷 지시문 없이 모델의 tool calling 채널로 구조화 출력
+
+실행:
+    python phase2/example3_complex_structure.py              # parser 모드 (기본)
+    python phase2/example3_complex_structure.py --mode tool  # tool calling 모드
 """
 
+import argparse
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 from typing import List
 from langchain.prompts import PromptTemplate
-from langchain.output_parsers import PydanticOutputParser
+from langchain.output_parsers import OutputFixingParser
 from langchain_anthropic import ChatAnthropic
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.schema_registry import registry
+from common.json_repair import RepairingParser
+from common.structured_output import structured_chain
+from common.batch import fan_out
+
 # 환경 변수 로드
 load_dotenv()
 
+arg_parser = argparse.ArgumentParser(description="복잡한 구조 (리스트 포함)")
+arg_parser.add_argument(
+    "--mode", choices=["parser", "tool"], default="parser",
+    help="parser: 포맷 지시문 + 텍스트 파싱 / tool: with_structured_output (기본 parser)"
+)
+arg_parser.add_argument("--max-concurrency", type=int, default=8, help="동시 요청 수 상한 (기본 8)")
+args = arg_parser.parse_args()
+
 print("=" * 50)
 print("예제 3: 복잡한 구조 (리스트 포함)")
 print("=" * 50)
@@ -41,8 +64,9 @@ print("   - Movie: 개별 영화 정보")
 print("   - MovieRecommendations: 영화 리스트 포함")
 print()
 
-# 3. PydanticOutputParser 생성
-parser = PydanticOutputParser(pydantic_object=MovieRecommendations)
+# 3. PydanticOutputParser 생성 (레지스트리: 모델 클래스당 한 번만 생성)
+registry.warm_up(MovieRecommendations)
+parser = registry.get_parser(MovieRecommendations)
 
 print("📌 2. PydanticOutputParser 생성 완료")
 print()
@@ -60,7 +84,10 @@ template = """당신은 영화 추천 전문가입니다.
 
 prompt = PromptTemplate(
     input_variables=["category"],
-    partial_variables={"format_instructions": parser.get_format_instructions()},
+    partial_variables={
+        # tool 모드는 스키마를 tool 정의로 전달하므로 포맷 지시문 생략
+        "format_instructions": registry.get_format_instructions(MovieRecommendations) if args.mode == "parser" else ""
+    },
     template=template
 )
 
@@ -76,17 +103,30 @@ llm = ChatAnthropic(
 print("📌 4. LLM 설정 완료 (temperature=0.3)")
 print()
 
-# 6. 체인 구성
-chain = prompt | llm | parser
-
-print("📌 5. 체인 구성 완료")
-print("   chain = prompt | llm | parser")
+# 6. 체인 구성 (로컬 복구 실패 시에만 OutputFixingParser로 재요청)
+repair_parser = RepairingParser(
+    MovieRecommendations,
+    fallback=OutputFixingParser.from_llm(llm=llm, parser=parser)
+)
+# fan-out은 호출 실패와 검증 실패를 구분하기 위해 검증(validate)을 체인 밖에서 실행
+if args.mode == "parser":
+    chain = prompt | llm
+    validate = repair_parser.parse
+
+    print("📌 5. 체인 구성 완료")
+    print("   chain = prompt | llm  →  완료되는 대로 repair_parser.parse로 검증")
+else:
+    chain = structured_chain(prompt, llm, MovieRecommendations)
+    validate = None
+
+    print("📌 5. 체인 구성 완료 (tool 모드)")
+    print("   chain = prompt | llm.with_structured_output(MovieRecommendations)")
 print()
 
 # 7. 여러 카테고리로 반복 실행
 categories = ["한국 영화", "SF 영화"]
 
-print(f"📌 6. {len(categories)}개 카테고리로 체인 반복 실행 준비")
+print(f"📌 6. {len(categories)}개 카테고리 동시 실행 준비 (동시 요청 상한 {args.max_concurrency})")
 for i, cat in enumerate(categories, 1):
     print(f"   {i}. {cat}")
 print()
@@ -97,20 +137,19 @@ print()
 input("Enter를 눌러 계속 진행하세요...")
 print()
 
-# 8. 반복 실행
-results = []
-
-for category in categories:
+# 8. 동시 실행 (완료되는 순서대로 검증 후 출력)
+def print_result(category, entry):
     print("=" * 50)
-    print(f"📌 카테고리: {category}")
+    print(f"📌 카테고리: {category} ({entry['latency']:.2f}초)")
     print("=" * 50)
     print()
-    print("[실행 중...]")
-    print()
 
-    result = chain.invoke({"category": category})
-    results.append(result)
+    if entry["status"] != "ok":
+        print(f"❌ {entry['status']}: {entry['error']}")
+        print()
+        return
 
+    result = entry["output"]
     print(f"✅ 카테고리: {result.category}")
     print(f"✅ 추천 영화 개수: {len(result.movies)}")
     print()
@@ -123,24 +162,46 @@ for category in categories:
 
     print()
 
+
+print("[실행 중...]")
+print()
+
+entries, stats = fan_out(
+    chain,
+    {category: {"category": category} for category in categories},
+    validate=validate,
+    max_concurrency=args.max_concurrency,
+    on_result=print_result,
+)
+
 # 9. 전체 결과 요약
 print("=" * 50)
 print("📌 전체 결과 요약")
 print("=" * 50)
 print()
 
-for result in results:
-    print(f"[{result.category}]")
-    for movie in result.movies:
-        print(f"  - {movie.title} ({movie.year}) - {movie.director}")
+for category, entry in entries.items():
+    print(f"[{category}] {entry['status']} / {entry['latency']:.2f}초")
+    if entry["status"] == "ok":
+        for movie in entry["output"].movies:
+            print(f"  - {movie.title} ({movie.year}) - {movie.director}")
     print()
 
+summary = stats.summary()
+print(f"전체 소요 시간: {summary['wall_time']:.2f}초 "
+      f"(순차 실행이었다면 약 {sum(e['latency'] for e in entries.values()):.2f}초, "
+      f"가장 느린 호출 {summary['max']:.2f}초)")
+print()
+
+if args.mode == "parser":
+    print(repair_parser.get_report())
+
 print("=" * 50)
 print("✅ 예제 3 완료!")
 print()
 print("핵심 학습 포인트:")
 print("1. List[Movie] 타입으로 리스트 구조 정의")
 print("2. 중첩된 Pydantic 모델 (MovieRecommendations > Movie)")
-print("3. 체인 재사용으로 여러 카테고리 처리")
+print("3. 체인 재사용으로 여러 카테고리 동시 처리 (fan_out, 완료 순서대로 검증)")
 print("4. result.movies로 리스트 접근 및 반복")
 print("=" * 50)
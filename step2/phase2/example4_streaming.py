@@ -0,0 +1,142 @@
+"""
+Step 2 - 예제 4: 스트리밍 + PydanticOutputParser
+
+목표:
+- prompt | llm 부분을 stream()으로 실행하여 토큰을 즉시 출력
+- 스트림이 끝난 뒤 누적된 텍스트를 parser로 검증
+- 블로킹(prompt | llm | parser)과 스트리밍의 TTFT / 전체 지연 시간 비교
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+from langchain.prompts import PromptTemplate
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.streaming import format_comparison, stream_with_timing
+from common.schema_registry import registry
+
+# 환경 변수 로드
+load_dotenv()
+
+print("=" * 50)
+print("예제 4: 스트리밍 + PydanticOutputParser")
+print("=" * 50)
+print()
+
+# 1. Pydantic 모델 및 Parser (예제 2와 동일)
+class MovieInfo(BaseModel):
+    """영화 정보를 담는 Pydantic 모델"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+    genre: str = Field(description="장르")
+
+registry.warm_up(MovieInfo)
+parser = registry.get_parser(MovieInfo)
+
+# 2. PromptTemplate 정의
+template = """당신은 영화 정보 제공 어시스턴트입니다.
+
+사용자가 요청한 영화에 대해 다음 정보를 제공해주세요:
+- 제목
+- 감독
+- 개봉 연도
+- 장르
+
+영화: {movie_query}
+
+{format_instructions}
+"""
+
+prompt = PromptTemplate(
+    input_variables=["movie_query"],
+    partial_variables={"format_instructions": registry.get_format_instructions(MovieInfo)},
+    template=template
+)
+
+# 3. LLM 설정
+llm = ChatAnthropic(
+    model="claude-3-haiku-20240307",
+    temperature=0
+)
+
+# 스트리밍용 체인은 parser를 분리해 두고, 스트림이 끝난 뒤 한 번 검증
+stream_chain = prompt | llm
+blocking_chain = prompt | llm | parser
+
+print("📌 1. 체인 구성 완료")
+print("   - 블로킹: prompt | llm | parser")
+print("   - 스트리밍: prompt | llm (토큰 출력) → parser.parse(전체 텍스트)")
+print()
+
+print("⚠️  이제 LLM API를 호출합니다 (총 2회).")
+print()
+
+input("Enter를 눌러 계속 진행하세요...")
+print()
+
+inputs = {"movie_query": "인셉션"}
+
+# 4. 블로킹 실행
+print("=" * 50)
+print("📌 2. 블로킹 실행")
+print("=" * 50)
+print()
+
+started = time.perf_counter()
+blocking_result = blocking_chain.invoke(inputs)
+blocking_total = time.perf_counter() - started
+
+print(f"✅ 결과: {blocking_result}")
+print()
+
+# 5. 스트리밍 실행
+print("=" * 50)
+print("📌 3. 스트리밍 실행 (토큰 도착 즉시 출력)")
+print("=" * 50)
+print()
+
+raw_text, stream_timing = stream_with_timing(stream_chain, inputs)
+print()
+print()
+
+parse_started = time.perf_counter()
+stream_result = parser.parse(raw_text)
+parse_time = time.perf_counter() - parse_started
+stream_timing["total"] += parse_time
+
+print(f"✅ 검증 결과: {stream_result}")
+print(f"   (파싱/검증 소요: {parse_time * 1000:.2f}ms)")
+print()
+
+# 6. 비교
+print("=" * 50)
+print("📌 4. 지연 시간 비교")
+print("=" * 50)
+print()
+
+blocking_timing = {
+    "ttft": blocking_total,
+    "total": blocking_total,
+    "chunks": 1,
+    "itl_mean": 0.0,
+    "itl_p95": 0.0,
+}
+print(format_comparison([("invoke", blocking_timing), ("stream", stream_timing)]))
+print()
+
+print("=" * 50)
+print("✅ 예제 4 완료!")
+print()
+print("핵심 학습 포인트:")
+print("1. chain.stream()은 토큰을 AIMessageChunk 단위로 반환")
+print("2. 구조화 출력은 스트림이 끝난 뒤 parser.parse()로 한 번 검증")
+print("3. TTFT는 스트리밍이 훨씬 짧고, 전체 시간은 비슷함")
+print("4. 사용자에게 보여줄 응답은 스트리밍, 후처리용 데이터는 검증 후 사용")
+print("=" * 50)
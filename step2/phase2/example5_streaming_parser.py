@@ -0,0 +1,141 @@
+"""
+Step 2 - 예제 5: 스트리밍 증분 파싱 (Movie 단위로 즉시 검증)
+
+목표:
+- 예제 3의 prompt | llm | parser는 JSON 전체가 도착해야 검증 가능
+- IncrementalListParser로 토큰을 받으면서 movies 리스트의 각 Movie가 닫히는 즉시 검증
+- 첫 Movie를 받기까지 걸린 시간 vs 전체 응답 완료 시간 비교
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+from pydantic import BaseModel, Field
+from typing import List
+from langchain.prompts import PromptTemplate
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.streaming import chunk_text
+from common.streaming_json import IncrementalListParser
+from common.schema_registry import registry
+
+# 환경 변수 로드
+load_dotenv()
+
+print("=" * 50)
+print("예제 5: 스트리밍 증분 파싱")
+print("=" * 50)
+print()
+
+# 1. Pydantic 모델 (예제 3과 동일)
+class Movie(BaseModel):
+    """개별 영화 정보"""
+    title: str = Field(description="영화 제목")
+    director: str = Field(description="감독 이름")
+    year: int = Field(description="개봉 연도")
+
+class MovieRecommendations(BaseModel):
+    """영화 추천 리스트"""
+    category: str = Field(description="추천 카테고리")
+    movies: List[Movie] = Field(description="추천 영화 리스트 (3개)")
+
+# 포맷 지시문은 레지스트리에 캐시된 PydanticOutputParser 것을 그대로 사용
+registry.warm_up(MovieRecommendations)
+parser = registry.get_parser(MovieRecommendations)
+
+# 2. PromptTemplate 정의 (긴 리스트를 받아 보기 위해 개수를 입력으로)
+template = """당신은 영화 추천 전문가입니다.
+
+다음 카테고리에 맞는 영화를 정확히 {count}개 추천해주세요:
+카테고리: {category}
+
+각 영화에 대해 제목, 감독, 개봉 연도를 포함해주세요.
+
+{format_instructions}
+"""
+
+prompt = PromptTemplate(
+    input_variables=["category", "count"],
+    partial_variables={"format_instructions": registry.get_format_instructions(MovieRecommendations)},
+    template=template
+)
+
+# 3. LLM 설정
+llm = ChatAnthropic(
+    model="claude-3-haiku-20240307",
+    temperature=0.3
+)
+
+# parser 대신 증분 파서를 사용하므로 체인은 prompt | llm 까지만
+chain = prompt | llm
+
+print("📌 1. 체인 구성 완료")
+print("   chain = prompt | llm  →  IncrementalListParser.feed(토큰)")
+print()
+
+categories = ["한국 영화", "SF 영화"]
+count = 10
+
+print(f"📌 2. {len(categories)}개 카테고리, 카테고리당 {count}편 추천 요청 준비")
+print()
+print("⚠️  이제 LLM API를 호출합니다.")
+print()
+
+input("Enter를 눌러 계속 진행하세요...")
+print()
+
+# 4. 카테고리별 스트리밍 실행
+results = []
+
+for category in categories:
+    print("=" * 50)
+    print(f"📌 카테고리: {category}")
+    print("=" * 50)
+    print()
+
+    stream_parser = IncrementalListParser(MovieRecommendations, list_key="movies")
+    first_item_time = None
+
+    started = time.perf_counter()
+    for chunk in chain.stream({"category": category, "count": count}):
+        for movie in stream_parser.feed(chunk_text(chunk)):
+            elapsed = time.perf_counter() - started
+            if first_item_time is None:
+                first_item_time = elapsed
+            print(f"  [+{elapsed:5.2f}s] {stream_parser.count}. {movie.title} ({movie.year}) - {movie.director}")
+    total_time = time.perf_counter() - started
+
+    result = stream_parser.close()
+    results.append(result)
+
+    print()
+    print(f"✅ 첫 Movie 검증까지: {first_item_time or total_time:.2f}초")
+    print(f"✅ 전체 응답 완료까지: {total_time:.2f}초")
+    print(f"✅ 검증된 영화: {len(result.movies)}개 / 검증 실패: {len(stream_parser.errors)}개")
+    for error in stream_parser.errors:
+        print(f"  ❌ {error['index'] + 1}번째 원소: {error['errors'][0]['msg']}")
+    print()
+
+# 5. 전체 결과 요약
+print("=" * 50)
+print("📌 전체 결과 요약")
+print("=" * 50)
+print()
+
+for result in results:
+    print(f"[{result.category}] {len(result.movies)}편")
+
+print()
+print("=" * 50)
+print("✅ 예제 5 완료!")
+print()
+print("핵심 학습 포인트:")
+print("1. PydanticOutputParser는 JSON 전체가 도착한 뒤에만 검증 가능")
+print("2. 증분 파서는 리스트 원소 객체가 닫히는 즉시 Movie로 검증해 반환")
+print("3. 후속 작업(저장, 화면 표시 등)을 전체 응답보다 먼저 시작 가능")
+print("4. keep_items=False로 두면 현재 원소 텍스트만 버퍼에 남아 메모리 사용량이 일정")
+print("=" * 50)
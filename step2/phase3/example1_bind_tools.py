@@ -8,9 +8,17 @@ Step 3 - 예제 1: 함수 정의 및 bind_tools() 기본
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+from common.tool_registry import ToolRegistry
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -60,11 +68,18 @@ llm = ChatAnthropic(
     temperature=0
 )
 
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
 print("📌 3. LLM 설정 완료 (함수 바인딩 없음)")
 print()
 
 # 4. bind_tools()로 함수 바인딩
-llm_with_tools = llm.bind_tools([get_weather])
+# bind_tools_cached(llm, tools)는 llm.bind_tools(tools)와 같은 결과를 내지만,
+# 함수 → JSON 스키마 변환 결과와 바인딩된 모델을 캐시해 두고 재사용
+# ToolRegistry는 tool_calls의 이름으로 실행할 함수를 찾는 레지스트리 (6-4에서 사용)
+tool_registry = ToolRegistry([get_weather])
+llm_with_tools = bind_tools_cached(llm, tool_registry.tools)
 
 print("📌 4. bind_tools()로 함수 바인딩 완료")
 print(f"  바인딩된 함수: {[get_weather.__name__]}")
@@ -125,14 +140,21 @@ if response.tool_calls:
     function_name = tool_call['name']
     function_args = tool_call['args']
 
-    if function_name == "get_weather":
-        result = get_weather(**function_args)
-        print(f"  {function_name}({function_args}) → {result}")
+    # 이름으로 함수를 찾고, 타입 힌트로 인자를 검증한 뒤 실행
+    result = tool_registry.execute(tool_call)
+    print(f"  {function_name}({function_args}) → {result['content']}")
 else:
     print(f"  ❌ LLM이 판단: 함수 호출 불필요")
 
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
+print(tool_registry.get_report())
+print()
+
 print("=" * 50)
 print("✅ 예제 1 완료!")
 print()
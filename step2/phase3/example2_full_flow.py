@@ -6,13 +6,24 @@ Step 3 - 예제 2: Function Calling 전체 플로우
 - 함수 실행
 - 결과를 LLM에 피드백
 - 최종 응답 생성
+- 추측 실행: 질문에서 도시 이름을 찾아 LLM 1차 호출과 동시에 함수를 미리 실행
 """
 
 import os
+import sys
+import time
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+from common.tool_registry import ToolRegistry
+from common.speculative import SpeculativeExecutor, keyword_predictor
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -22,6 +33,16 @@ print("=" * 50)
 print()
 
 # 1. 함수 정의
+weather_data = {
+    "서울": "맑음, 기온 15도",
+    "부산": "흐림, 기온 18도",
+    "제주": "비, 기온 20도"
+}
+
+# 실제 날씨 API 호출 지연을 흉내 (초)
+WEATHER_API_LATENCY = 0.5
+
+
 def get_weather(city: str) -> str:
     """
     지정된 도시의 현재 날씨를 조회합니다.
@@ -32,11 +53,7 @@ def get_weather(city: str) -> str:
     Returns:
         날씨 정보 문자열
     """
-    weather_data = {
-        "서울": "맑음, 기온 15도",
-        "부산": "흐림, 기온 18도",
-        "제주": "비, 기온 20도"
-    }
+    time.sleep(WEATHER_API_LATENCY)
     return weather_data.get(city, f"{city}의 날씨 정보를 찾을 수 없습니다.")
 
 print("📌 1. 함수 정의 완료: get_weather()")
@@ -48,7 +65,16 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-llm_with_tools = llm.bind_tools([get_weather])
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
+tool_registry = ToolRegistry([get_weather])
+llm_with_tools = bind_tools_cached(llm, tool_registry.tools)
+
+# 추측 실행: 질문에 weather_data의 도시 이름이 있으면 get_weather를 미리 실행
+speculator = SpeculativeExecutor(tool_registry, {
+    "get_weather": keyword_predictor("city", weather_data.keys()),
+})
 
 print("📌 2. LLM 설정 및 함수 바인딩 완료")
 print()
@@ -74,6 +100,11 @@ print("📌 4. 첫 번째 LLM 호출 (tool_calls 확인)")
 print("=" * 50)
 print()
 
+# LLM 응답을 기다리는 동안 추측한 함수 호출을 미리 실행
+speculation = speculator.start(user_query)
+for name, args in speculation.predicted:
+    print(f"  [추측 실행 시작] {name}({args})")
+
 print("[실행 중...]")
 print()
 
@@ -85,6 +116,8 @@ print(f"  tool_calls 개수: {len(response.tool_calls) if response.tool_calls el
 print()
 
 if not response.tool_calls:
+    speculator.finish(speculation)
+    speculator.close()
     print("❌ tool_calls가 없습니다. 함수 호출이 필요 없는 질문입니다.")
     exit()
 
@@ -102,10 +135,19 @@ print("📌 6. 함수 실행")
 function_name = tool_call['name']
 function_args = tool_call['args']
 
-if function_name == "get_weather":
-    function_result = get_weather(**function_args)
-    print(f"  {function_name}({function_args})")
-    print(f"  → 결과: '{function_result}'")
+# 추측이 맞으면 미리 실행한 결과를 사용, 아니면 지금 실행
+started = time.perf_counter()
+result = speculator.resolve(speculation, tool_call)
+wait_time = time.perf_counter() - started
+speculator.finish(speculation)
+
+function_result = result["content"]
+print(f"  {function_name}({function_args})")
+print(f"  → 결과: '{function_result}'")
+if result["speculative"]:
+    print(f"  → 추측 실행 적중: 함수 실행 {result['latency']:.2f}초 중 {wait_time:.2f}초만 대기")
+else:
+    print(f"  → 추측 실행 미적중: 지금 실행 ({wait_time:.2f}초)")
 print()
 
 # 7. 메시지 히스토리 구성
@@ -169,6 +211,14 @@ print("4️⃣  두 번째 LLM 호출 (결과 피드백):")
 print(f"    → 최종 응답: '{final_response.content}'")
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
+print(speculator.get_report())
+print()
+speculator.close()
+
 print("=" * 50)
 print("✅ 예제 2 완료!")
 print()
@@ -178,4 +228,5 @@ print("2. 함수 실행으로 실제 데이터 조회")
 print("3. ToolMessage로 결과를 LLM에 피드백")
 print("4. 두 번째 LLM 호출로 최종 응답 생성")
 print("5. 메시지 히스토리: HumanMessage → AIMessage → ToolMessage")
+print("6. 추측 실행으로 느린 함수 실행을 LLM 1차 호출과 겹쳐 지연 단축")
 print("=" * 50)
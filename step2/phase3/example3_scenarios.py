@@ -8,10 +8,17 @@ Step 3 - 예제 3: 여러 시나리오 테스트
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -47,7 +54,10 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-llm_with_tools = llm.bind_tools([get_weather])
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
+llm_with_tools = bind_tools_cached(llm, [get_weather])
 
 print("📌 2. LLM 설정 및 함수 바인딩 완료")
 print()
@@ -182,6 +192,10 @@ print("3. 일반적인 지식/조언은 LLM이 직접 응답")
 print("   예: '날씨가 좋으면 무엇을 하면 좋을까요?' → 직접 응답")
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
 print("=" * 50)
 print("✅ 예제 3 완료!")
 print()
@@ -8,10 +8,17 @@ Step 3 - 예제 4: 함수 호출이 불필요한 질문 테스트
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -47,7 +54,10 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-llm_with_tools = llm.bind_tools([get_weather])
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
+llm_with_tools = bind_tools_cached(llm, [get_weather])
 
 print("📌 2. LLM 설정 및 함수 바인딩 완료")
 print()
@@ -209,6 +219,10 @@ print("2. 예제 4: 날씨와 무관하거나 개념 질문 → 직접 답변")
 print("3. LLM은 키워드와 질문 의도를 종합적으로 판단")
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
 print("=" * 50)
 print("✅ 예제 4 완료!")
 print()
@@ -5,13 +5,23 @@ Phase 4 - 예제 1: 여러 도구 정의 및 LLM의 도구 선택
 - 3개 이상의 도구(함수) 정의
 - LLM에 여러 도구 바인딩
 - LLM이 질문에 따라 적절한 도구를 선택하는지 확인
+- 질문별로 관련 도구만 바인딩해 도구 정의 입력 토큰 줄이기 (common.tool_pruning)
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached, tool_schema_cache
+from common.tool_pruning import ToolSelector, estimate_tool_tokens
+from common.example_tools import TOOLS, calculate, get_weather, search_web
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -21,72 +31,8 @@ print("=" * 50)
 print()
 
 # 1. 여러 도구 정의
-def get_weather(city: str) -> str:
-    """
-    지정된 도시의 현재 날씨를 조회합니다.
-
-    실시간 날씨 정보가 필요할 때 사용하세요.
-
-    Args:
-        city: 날씨를 조회할 도시 이름 (예: "서울", "뉴욕")
-
-    Returns:
-        현재 날씨 정보 문자열
-    """
-    weather_data = {
-        "서울": "맑음, 기온 15도",
-        "뉴욕": "흐림, 기온 10도",
-        "도쿄": "비, 기온 18도",
-        "파리": "눈, 기온 2도"
-    }
-    return weather_data.get(city, f"{city}의 날씨 정보를 찾을 수 없습니다.")
-
-
-def calculate(expression: str) -> float:
-    """
-    수학 표현식을 계산합니다.
-
-    복잡한 수학 계산이 필요할 때 사용하세요.
-    예: "123 * 456", "(10 + 5) / 3", "2 ** 10"
-
-    Args:
-        expression: 계산할 수학 표현식 문자열
-
-    Returns:
-        계산 결과 (실수)
-    """
-    try:
-        result = eval(expression)
-        return float(result)
-    except Exception as e:
-        return f"계산 오류: {str(e)}"
-
-
-def search_web(query: str) -> str:
-    """
-    웹에서 정보를 검색합니다.
-
-    실시간 정보나 최신 뉴스, 일반 지식 검색이 필요할 때 사용하세요.
-
-    Args:
-        query: 검색할 쿼리 문자열
-
-    Returns:
-        검색 결과 요약
-    """
-    # 실제로는 검색 API를 호출하지만, 예제에서는 하드코딩
-    mock_results = {
-        "파이썬": "Python은 1991년 귀도 반 로섬이 개발한 프로그래밍 언어입니다.",
-        "langchain": "LangChain은 LLM 애플리케이션 개발을 위한 프레임워크입니다.",
-        "한강공원": "한강공원은 서울의 대표적인 야외 휴식 공간입니다."
-    }
-
-    for key in mock_results:
-        if key in query.lower():
-            return mock_results[key]
-
-    return f"'{query}'에 대한 검색 결과: 관련 정보를 찾았습니다."
-
+# 도구 정의(get_weather, calculate, search_web)는 common/example_tools.py에 있음
+# → 예제 5의 평가 하네스도 같은 정의를 사용하므로 docstring을 고치면 예제 5로 도구 선택 회귀 확인
 
 print("📌 1. 도구 정의 완료")
 print()
@@ -102,11 +48,17 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-tools = [get_weather, calculate, search_web]
-llm_with_tools = llm.bind_tools(tools)
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
 
-print("📌 2. LLM에 도구 바인딩 완료")
-print(f"  바인딩된 도구 개수: {len(tools)}")
+tools = TOOLS
+# 질문별 도구 사전 선택: 도구 이름 + docstring 어휘 점수로 상위 2개만 바인딩 (관련 도구가 없으면 전체)
+selector = ToolSelector(tools, top_k=2)
+full_tool_tokens = estimate_tool_tokens(tool_schema_cache.convert_all(tools))
+bound_tool_tokens = 0
+
+print("📌 2. LLM에 도구 바인딩 준비 완료")
+print(f"  전체 도구 개수: {len(tools)} (질문마다 관련 도구 최대 {selector.top_k}개만 바인딩)")
 print()
 
 # 3. 테스트 시나리오
@@ -156,6 +108,11 @@ for i, scenario in enumerate(test_scenarios, 1):
     print("=" * 50)
     print()
 
+    selected = selector.select(scenario['query'])
+    bound_tool_tokens += estimate_tool_tokens(tool_schema_cache.convert_all(selected))
+    llm_with_tools = bind_tools_cached(llm, selected)
+    print(f"  바인딩 도구: {', '.join(tool.__name__ for tool in selected)}")
+
     print("[실행 중...]")
     response = llm_with_tools.invoke([HumanMessage(content=scenario['query'])])
     print()
@@ -265,6 +222,16 @@ print("  - LLM이 알고 있는 일반 지식")
 print("  - 도구로 해결할 수 없는 질문")
 print()
 
+# 8. 도구 사전 선택 효과
+full_total = full_tool_tokens * len(test_scenarios)
+print(f"📌 도구 정의 토큰 (추정): 전체 바인딩 {full_total} → 질문별 선택 {bound_tool_tokens} "
+      f"({1 - bound_tool_tokens / full_total:.1%} 절감)")
+print(selector.get_report())
+
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
 print("=" * 50)
 print("✅ 예제 1 완료!")
 print()
@@ -274,4 +241,5 @@ print("2. LLM이 질문을 분석하여 적절한 도구 자동 선택")
 print("3. 각 도구의 docstring이 선택 기준에 중요한 역할")
 print("4. 도구가 필요 없는 경우 LLM이 직접 답변")
 print("5. Phase 3 (단일 도구) → Phase 4 (여러 도구)")
+print("6. 질문과 관련된 도구만 바인딩하면 매 요청의 도구 정의 토큰이 줄어듦")
 print("=" * 50)
@@ -6,13 +6,26 @@ Phase 4 - 예제 2: 수동 실행 루프 (Manual Execution Loop)
 - 메시지 히스토리 관리
 - 종료 조건 처리
 - Phase 3 (단일 호출) vs Phase 4 (반복 루프) 비교
+- 한 응답의 여러 tool_calls를 동시에 실행 (순차 실행 대비 시간 비교)
+- 토큰 예산 기반 히스토리 압축 (반복마다 입력 토큰 비교)
 """
 
 import os
+import sys
+import time
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+from common.calculator import evaluate
+from common.tool_registry import ToolRegistry
+from common.history import HistoryManager, estimate_tokens, find_orphans
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -21,6 +34,10 @@ print("예제 2: 수동 실행 루프 (Manual Execution Loop)")
 print("=" * 50)
 print()
 
+# 실제 외부 API 호출 지연을 흉내 (초)
+TOOL_LATENCY = 0.3
+
+
 # 1. 도구 정의 (예제 1과 동일)
 def get_weather(city: str) -> str:
     """
@@ -37,6 +54,7 @@ def get_weather(city: str) -> str:
         "뉴욕": "흐림, 기온 10도",
         "도쿄": "비, 기온 18도"
     }
+    time.sleep(TOOL_LATENCY)
     return weather_data.get(city, f"{city}의 날씨 정보를 찾을 수 없습니다.")
 
 
@@ -51,7 +69,8 @@ def calculate(expression: str) -> float:
         계산 결과
     """
     try:
-        result = eval(expression)
+        # eval() 대신 AST 기반 계산기 (산술 연산만 허용, 표현식별 캐시)
+        result = evaluate(expression)
         return str(float(result))
     except Exception as e:
         return f"계산 오류: {str(e)}"
@@ -68,8 +87,12 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-tools = [get_weather, calculate]
-llm_with_tools = llm.bind_tools(tools)
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
+# 이름 → 함수 레지스트리 (타입 힌트 기반 인자 검증, 도구별 통계)
+tool_registry = ToolRegistry([get_weather, calculate])
+llm_with_tools = bind_tools_cached(llm, tool_registry.tools)
 
 print("📌 2. LLM 및 도구 바인딩 완료")
 print()
@@ -106,6 +129,13 @@ messages = [HumanMessage(content=user_query)]
 # 최대 반복 횟수 (무한 루프 방지)
 MAX_ITERATIONS = 10
 iteration = 0
+turn_timings = []  # 회차별 (도구 수, 순차 실행 합계, 동시 실행 시간)
+
+# 히스토리 압축: 원래 질문 + 최근 1개 턴은 그대로, 오래된 도구 결과는 요약
+# (예제의 대화는 짧으므로 압축이 보이도록 예산을 작게 설정)
+HISTORY_TOKEN_BUDGET = 150
+history = HistoryManager(token_budget=HISTORY_TOKEN_BUDGET, keep_recent_turns=1)
+token_log = []  # 회차별 (전체 히스토리 추정, 압축 후 추정, 실제 input_tokens)
 
 while iteration < MAX_ITERATIONS:
     iteration += 1
@@ -115,7 +145,17 @@ while iteration < MAX_ITERATIONS:
 
     # LLM 호출
     print(f"[{iteration}] LLM 호출 중...")
-    response = llm_with_tools.invoke(messages)
+    # messages 원본은 그대로 두고, LLM에는 예산 안으로 압축한 히스토리를 전송
+    llm_messages = history.compact(messages)
+    orphans = find_orphans(llm_messages)
+    if orphans:
+        raise RuntimeError(f"압축 후 짝이 없는 tool_call_id가 있습니다: {orphans}")
+    response = llm_with_tools.invoke(llm_messages)
+    token_log.append((
+        estimate_tokens(messages),
+        estimate_tokens(llm_messages),
+        (response.usage_metadata or {}).get("input_tokens"),
+    ))
     print()
 
     # tool_calls 확인
@@ -133,31 +173,24 @@ while iteration < MAX_ITERATIONS:
     # AIMessage 추가
     messages.append(AIMessage(content="", tool_calls=response.tool_calls))
 
-    # 각 도구 실행
-    for i, tool_call in enumerate(response.tool_calls, 1):
-        tool_name = tool_call['name']
-        tool_args = tool_call['args']
-        tool_id = tool_call['id']
-
-        print(f"  [{i}] 도구: {tool_name}")
-        print(f"      매개변수: {tool_args}")
-
-        # 도구 실행
-        if tool_name == "get_weather":
-            result = get_weather(**tool_args)
-        elif tool_name == "calculate":
-            result = calculate(**tool_args)
-        else:
-            result = f"알 수 없는 도구: {tool_name}"
-
-        print(f"      결과: {result}")
+    # 도구 동시 실행 (if/elif 분기 대신 이름으로 조회, 에러는 결과 dict로 반환)
+    # 결과는 tool_calls 순서대로 반환되므로 ToolMessage 순서/ID가 항상 일치
+    started = time.perf_counter()
+    results = tool_registry.execute_many(response.tool_calls)
+    concurrent_time = time.perf_counter() - started
+    serial_time = sum(result["latency"] for result in results)
+    turn_timings.append((len(results), serial_time, concurrent_time))
+
+    for i, (tool_call, result) in enumerate(zip(response.tool_calls, results), 1):
+        print(f"  [{i}] 도구: {tool_call['name']}")
+        print(f"      매개변수: {tool_call['args']}")
+        print(f"      결과: {result['content']} ({result['latency']:.2f}초)")
         print()
 
         # ToolMessage 추가
-        messages.append(ToolMessage(
-            content=result,
-            tool_call_id=tool_id
-        ))
+        messages.append(tool_registry.to_message(result))
+
+    print(f"⏱️  도구 실행: 동시 {concurrent_time:.2f}초 (순차였다면 {serial_time:.2f}초)")
 
     print(f"📌 메시지 히스토리 길이: {len(messages)}")
     print()
@@ -178,6 +211,20 @@ print(f"✅ 총 LLM 호출: {iteration}회")
 print(f"✅ 총 도구 호출: {len([m for m in messages if isinstance(m, ToolMessage)])}회")
 print()
 
+print("🔢 회차별 입력 토큰 (메시지 추정치, 압축 전 → 후 / 실제 input_tokens는 도구 정의 포함):")
+for turn, (full_tokens, sent_tokens, input_tokens) in enumerate(token_log, 1):
+    print(f"  {turn}회차: {full_tokens} → {sent_tokens} (실제 {input_tokens})")
+print(history.get_report())
+
+print("⏱️  회차별 도구 실행 시간 (순차 합계 vs 동시 실행):")
+for turn, (count, serial_time, concurrent_time) in enumerate(turn_timings, 1):
+    print(f"  {turn}회차: 도구 {count}개, 순차 {serial_time:.2f}초 → 동시 {concurrent_time:.2f}초")
+if turn_timings:
+    total_serial = sum(t[1] for t in turn_timings)
+    total_concurrent = sum(t[2] for t in turn_timings)
+    print(f"  합계: 순차 {total_serial:.2f}초 → 동시 {total_concurrent:.2f}초 ({total_serial - total_concurrent:.2f}초 절약)")
+print()
+
 # 6. 메시지 히스토리 분석
 print("=" * 50)
 print("📌 메시지 히스토리 상세")
@@ -244,10 +291,9 @@ while True:
     # AIMessage 추가
     messages.append(AIMessage(..., tool_calls=...))
 
-    # 각 도구 실행
-    for tool_call in response.tool_calls:
-        result = execute_tool(tool_call)
-        messages.append(ToolMessage(...))
+    # 도구 동시 실행 (결과는 tool_calls 순서 유지)
+    for result in tool_registry.execute_many(response.tool_calls):
+        messages.append(tool_registry.to_message(result))
 
     # 다시 루프 (LLM이 추가 도구를 호출할 수 있음)
 """)
@@ -260,6 +306,13 @@ print("3️⃣  messages 리스트에 계속 추가하여 컨텍스트 유지")
 print("4️⃣  MAX_ITERATIONS로 무한 루프 방지")
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
+print(tool_registry.get_report())
+print()
+
 print("=" * 50)
 print("✅ 예제 2 완료!")
 print()
@@ -267,6 +320,6 @@ print("핵심 학습 포인트:")
 print("1. 수동 while 루프로 도구 반복 실행")
 print("2. tool_calls 확인하여 종료 조건 처리")
 print("3. 메시지 히스토리로 전체 대화 컨텍스트 유지")
-print("4. 여러 도구를 순차적으로 호출 가능")
+print("4. 여러 도구를 순차적으로 호출 가능 (한 응답의 tool_calls는 동시 실행)")
 print("5. 최대 반복 횟수로 무한 루프 방지")
 print("=" * 50)
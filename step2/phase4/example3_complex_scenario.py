@@ -5,12 +5,26 @@ Phase 4 - 예제 3: 복잡한 시나리오
 - 여러 도구를 조합하여 복잡한 질문 처리
 - 도구 실행 결과를 다른 도구의 입력으로 사용
 - 실전 활용 예시
+- 같은 인자의 도구 결과는 시나리오 간 캐시로 재사용
+- 반복별 LLM 지연 / 토큰 / 도구 시간을 JSONL로 기록
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
-from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from langchain_core.messages import HumanMessage, AIMessage
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+from common.calculator import evaluate
+from common.search_index import KeywordIndex
+from common.tool_registry import ToolRegistry
+from common.tool_cache import tool_cache
+from common.telemetry import LoopTelemetry
 
 # 환경 변수 로드
 load_dotenv()
@@ -21,6 +35,7 @@ print("=" * 50)
 print()
 
 # 1. 여러 도구 정의
+@tool_cache.memoize(ttl=600)  # 날씨는 10분간 재사용
 def get_weather(city: str) -> str:
     """
     지정된 도시의 현재 날씨를 조회합니다.
@@ -43,6 +58,7 @@ def get_weather(city: str) -> str:
     return result
 
 
+# 수식별 결과는 common.calculator가 캐시 (tool_cache로 한 번 더 감싸지 않음)
 def calculate(expression: str) -> str:
     """
     수학 표현식을 계산합니다.
@@ -54,7 +70,8 @@ def calculate(expression: str) -> str:
         계산 결과
     """
     try:
-        result = eval(expression)
+        # eval() 대신 AST 기반 계산기 (산술 연산만 허용, 표현식별 캐시)
+        result = evaluate(expression)
         result_str = str(float(result))
         print(f"    [도구 실행] calculate('{expression}') → {result_str}")
         return result_str
@@ -64,6 +81,17 @@ def calculate(expression: str) -> str:
         return error_msg
 
 
+# 검색 결과 (키워드 → 결과)
+SEARCH_RESULTS = {
+    "파이썬": "Python은 1991년 귀도 반 로섬이 개발한 프로그래밍 언어입니다.",
+    "langchain": "LangChain은 LLM 애플리케이션 개발 프레임워크입니다.",
+    "날씨 추천": "날씨가 좋을 때는 한강공원, 비가 올 때는 박물관 방문을 추천합니다."
+}
+# 키워드 인덱스는 로드 시 한 번만 생성
+search_index = KeywordIndex(SEARCH_RESULTS)
+
+
+@tool_cache.memoize(ttl=3600)
 def search_web(query: str) -> str:
     """
     웹에서 정보를 검색합니다.
@@ -74,17 +102,12 @@ def search_web(query: str) -> str:
     Returns:
         검색 결과
     """
-    mock_results = {
-        "파이썬": "Python은 1991년 귀도 반 로섬이 개발한 프로그래밍 언어입니다.",
-        "langchain": "LangChain은 LLM 애플리케이션 개발 프레임워크입니다.",
-        "날씨 추천": "날씨가 좋을 때는 한강공원, 비가 올 때는 박물관 방문을 추천합니다."
-    }
-
-    for key in mock_results:
-        if key in query.lower():
-            result = mock_results[key]
-            print(f"    [도구 실행] search_web('{query}') → {result[:50]}...")
-            return result
+    # 질문에 포함된 키워드를 인덱스로 한 번에 찾음 (키워드 수와 무관하게 질문 길이에 비례)
+    key = search_index.first(query)
+    if key is not None:
+        result = SEARCH_RESULTS[key]
+        print(f"    [도구 실행] search_web('{query}') → {result[:50]}...")
+        return result
 
     result = f"'{query}'에 대한 검색 결과를 찾았습니다."
     print(f"    [도구 실행] search_web('{query}') → {result}")
@@ -103,8 +126,16 @@ llm = ChatAnthropic(
     temperature=0
 )
 
-tools = [get_weather, calculate, search_web]
-llm_with_tools = llm.bind_tools(tools)
+# 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+llm_cache = enable_llm_cache_from_env()
+
+# 이름 → 함수 레지스트리 (타입 힌트 기반 인자 검증, 도구별 통계)
+tool_registry = ToolRegistry([get_weather, calculate, search_web])
+llm_with_tools = bind_tools_cached(llm, tool_registry.tools)
+
+# 반복별 텔레메트리 (.env의 LOOP_TELEMETRY_PATH, 기본 phase4/loop_telemetry.jsonl에 추가 기록)
+# 실행 위치(cwd)와 관계없이 같은 파일에 쌓이도록 기본 경로는 스크립트 디렉토리 기준
+telemetry = LoopTelemetry(os.getenv("LOOP_TELEMETRY_PATH", str(Path(__file__).resolve().parent / "loop_telemetry.jsonl")))
 
 print("📌 2. LLM 및 도구 바인딩 완료")
 print()
@@ -166,11 +197,14 @@ for scenario_num, scenario in enumerate(scenarios, 1):
 
         print(f"--- 루프 {iteration}회차 ---")
 
-        # LLM 호출
+        # LLM 호출 (보낸 히스토리 크기, 지연 시간, 토큰 기록)
+        event = telemetry.start(scenario['name'], iteration, messages)
         response = llm_with_tools.invoke(messages)
+        telemetry.llm_done(event, response)
 
         # 종료 조건
         if not response.tool_calls:
+            telemetry.finish(event)
             print(f"✅ 최종 답변:")
             print(f"  '{response.content}'")
             print()
@@ -181,29 +215,22 @@ for scenario_num, scenario in enumerate(scenarios, 1):
 
         messages.append(AIMessage(content="", tool_calls=response.tool_calls))
 
+        tool_results = []
         for tool_call in response.tool_calls:
             tool_calls_count += 1
-            tool_name = tool_call['name']
-            tool_args = tool_call['args']
-            tool_id = tool_call['id']
-
-            # 도구 실행
-            if tool_name == "get_weather":
-                result = get_weather(**tool_args)
-            elif tool_name == "calculate":
-                result = calculate(**tool_args)
-            elif tool_name == "search_web":
-                result = search_web(**tool_args)
-            else:
-                result = f"알 수 없는 도구: {tool_name}"
-                print(f"    [오류] {result}")
-
-            # ToolMessage 추가
-            messages.append(ToolMessage(
-                content=result,
-                tool_call_id=tool_id
-            ))
 
+            # 도구 실행 (이름으로 조회, 인자 검증 실패/알 수 없는 도구는 에러 결과로 반환)
+            result = tool_registry.execute(tool_call)
+            tool_results.append(result)
+            if not result["ok"]:
+                print(f"    [오류] {result['content']}")
+
+            # ToolMessage 추가 (실패 시 status="error")
+            messages.append(tool_registry.to_message(result))
+
+        event = telemetry.finish(event, tool_results)
+        print(f"⏱️  LLM {event['llm_latency']:.2f}초, 도구 {event['tool_time'] * 1000:.1f}ms, "
+              f"토큰 {event['input_tokens']}→{event['output_tokens']}")
         print()
 
     else:
@@ -279,6 +306,22 @@ print("  - ReAct 패턴")
 print("  - Phase 4의 수동 루프를 자동화")
 print()
 
+if llm_cache:
+    print(llm_cache.get_report())
+    print()
+
+print(tool_registry.get_report())
+print()
+
+# 시나리오 전체의 시간 / 토큰 분포 (JSONL은 load_events()로 다시 집계 가능)
+telemetry.close()
+print(telemetry.get_report())
+print()
+
+# 시나리오마다 반복되는 get_weather("서울") 등은 캐시에서 재사용
+print(tool_cache.get_report())
+print()
+
 print("=" * 50)
 print("✅ Phase 4 완료!")
 print()
@@ -288,4 +331,6 @@ print("2. 도구 실행 결과를 다른 도구의 입력으로 활용")
 print("3. 수동 루프로 전체 흐름 제어")
 print("4. LLM이 자율적으로 다음 단계 결정")
 print("5. Phase 6 (Agent)의 기초 이해")
+print("6. 결정적인 도구 결과는 캐시하여 시나리오 간 재사용")
+print("7. 반복별 텔레메트리로 시간과 토큰이 쓰이는 곳을 확인")
 print("=" * 50)
@@ -0,0 +1,220 @@
+"""
+Phase 4 - 예제 4: async 수동 루프 + 부하 테스트
+
+목표:
+- 예제 2의 while 루프를 ainvoke 기반 async 루프로 변환
+- 여러 대화를 한 프로세스에서 동시에 처리 (전역 세마포어로 동시 LLM 요청 수 제한)
+- 대화마다 독립된 반복 횟수 상한
+- 예제 3의 시나리오를 일정한 도착률로 재생하여 처리량 / 꼬리 지연 시간(p95, p99) 측정
+
+실행 예:
+    python phase4/example4_async_loop.py                       # 시나리오 3개를 한 번에
+    python phase4/example4_async_loop.py --count 30 --rate 2   # 초당 2개씩 30개 대화
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.llm_cache import enable_llm_cache_from_env
+from common.tool_schema import bind_tools_cached
+from common.calculator import evaluate
+from common.search_index import KeywordIndex
+from common.tool_registry import ToolRegistry
+from common.tool_cache import tool_cache
+from common.tool_loop import arun_conversations
+
+
+# 1. 도구 정의 (예제 3과 동일, 동시 실행 시 출력이 섞이지 않도록 print 제거)
+@tool_cache.memoize(ttl=600)  # 날씨는 10분간 재사용
+def get_weather(city: str) -> str:
+    """
+    지정된 도시의 현재 날씨를 조회합니다.
+
+    Args:
+        city: 날씨를 조회할 도시 이름
+
+    Returns:
+        현재 날씨 정보 문자열
+    """
+    weather_data = {
+        "서울": "맑음, 기온 15도",
+        "뉴욕": "흐림, 기온 10도",
+        "도쿄": "비, 기온 18도",
+        "파리": "눈, 기온 2도",
+        "런던": "안개, 기온 8도"
+    }
+    return weather_data.get(city, f"{city}의 날씨 정보를 찾을 수 없습니다.")
+
+
+# 수식별 결과는 common.calculator가 캐시 (tool_cache로 한 번 더 감싸지 않음)
+def calculate(expression: str) -> str:
+    """
+    수학 표현식을 계산합니다.
+
+    Args:
+        expression: 계산할 수학 표현식
+
+    Returns:
+        계산 결과
+    """
+    try:
+        # eval() 대신 AST 기반 계산기 (산술 연산만 허용, 표현식별 캐시)
+        result = evaluate(expression)
+        return str(float(result))
+    except Exception as e:
+        return f"계산 오류: {str(e)}"
+
+
+# 검색 결과 (키워드 → 결과)
+SEARCH_RESULTS = {
+    "파이썬": "Python은 1991년 귀도 반 로섬이 개발한 프로그래밍 언어입니다.",
+    "langchain": "LangChain은 LLM 애플리케이션 개발 프레임워크입니다.",
+    "날씨 추천": "날씨가 좋을 때는 한강공원, 비가 올 때는 박물관 방문을 추천합니다."
+}
+# 키워드 인덱스는 로드 시 한 번만 생성
+search_index = KeywordIndex(SEARCH_RESULTS)
+
+
+@tool_cache.memoize(ttl=3600)
+def search_web(query: str) -> str:
+    """
+    웹에서 정보를 검색합니다.
+
+    Args:
+        query: 검색 쿼리
+
+    Returns:
+        검색 결과
+    """
+    # 질문에 포함된 키워드를 인덱스로 한 번에 찾음 (키워드 수와 무관하게 질문 길이에 비례)
+    key = search_index.first(query)
+    if key is not None:
+        return SEARCH_RESULTS[key]
+
+    return f"'{query}'에 대한 검색 결과를 찾았습니다."
+
+
+# 예제 3의 시나리오 질문
+SCENARIO_QUERIES = [
+    "서울과 뉴욕의 날씨를 비교해줘",
+    "서울, 뉴욕, 도쿄의 평균 기온을 계산해줘",
+    "서울 날씨가 좋으면 추천 장소 알려줘",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="async 수동 루프 부하 테스트")
+    parser.add_argument("--count", type=int, default=len(SCENARIO_QUERIES),
+                        help=f"실행할 대화 수 (시나리오를 순환 재생, 기본 {len(SCENARIO_QUERIES)})")
+    parser.add_argument("--rate", type=float, default=None, help="초당 시작할 대화 수 (기본: 모두 즉시 시작)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="동시 LLM 요청 수 상한 (기본 8)")
+    parser.add_argument("--max-iterations", type=int, default=10, help="대화별 LLM 호출 상한 (기본 10)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # 환경 변수 로드
+    load_dotenv()
+
+    if not os.getenv("ANTHROPIC_API_KEY"):
+        print("❌ ANTHROPIC_API_KEY가 설정되지 않았습니다.")
+        return
+
+    print("=" * 50)
+    print("예제 4: async 수동 루프 + 부하 테스트")
+    print("=" * 50)
+    print()
+
+    # 2. LLM 설정 및 도구 바인딩
+    llm = ChatAnthropic(
+        model="claude-3-haiku-20240307",
+        temperature=0
+    )
+
+    # 응답 캐시 (.env에 LLM_CACHE_PATH 설정 시 temperature=0 호출 재사용)
+    llm_cache = enable_llm_cache_from_env()
+
+    tool_registry = ToolRegistry([get_weather, calculate, search_web])
+    llm_with_tools = bind_tools_cached(llm, tool_registry.tools)
+
+    queries = [SCENARIO_QUERIES[i % len(SCENARIO_QUERIES)] for i in range(args.count)]
+
+    print("📌 실행 설정")
+    print(f"  - 대화 수: {len(queries)}개")
+    print(f"  - 도착률: {f'{args.rate}개/초' if args.rate else '모두 즉시 시작'}")
+    print(f"  - 동시 LLM 요청 상한: {args.max_concurrency}")
+    print(f"  - 대화별 반복 상한: {args.max_iterations}회")
+    print()
+
+    print("⚠️  이제 LLM API를 여러 번 호출합니다.")
+    print()
+
+    input("Enter를 눌러 계속 진행하세요...")
+    print()
+
+    # 3. 여러 대화 동시 실행 (끝나는 순서대로 출력)
+    def print_result(index, result):
+        status = "✅" if result["status"] == "done" else "❌"
+        print(f"{status} [{index + 1}] {result['query']} "
+              f"({result['latency']:.2f}초, LLM {result['iterations']}회, 도구 {result['tool_calls']}회)")
+        if result["error"]:
+            print(f"    오류: {result['error']}")
+
+    results, stats = asyncio.run(arun_conversations(
+        llm_with_tools,
+        tool_registry,
+        queries,
+        max_concurrency=args.max_concurrency,
+        max_iterations=args.max_iterations,
+        rate=args.rate,
+        on_result=print_result,
+    ))
+    print()
+
+    # 4. 결과 요약
+    print("=" * 50)
+    print("📌 결과 요약")
+    print("=" * 50)
+    print()
+
+    statuses = {}
+    for result in results:
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+    print(f"대화 상태: {statuses}")
+    print(f"총 LLM 호출: {sum(r['iterations'] for r in results)}회")
+    print(f"총 도구 호출: {sum(r['tool_calls'] for r in results)}회")
+
+    # 대화 단위 처리량 / 지연 시간 (rows = 대화 수)
+    print(stats.get_report())
+
+    if llm_cache:
+        print(llm_cache.get_report())
+
+    print(tool_registry.get_report())
+
+    # 같은 시나리오를 반복 재생하므로 대부분의 도구 호출이 캐시 적중
+    print(tool_cache.get_report())
+
+    print("=" * 50)
+    print("✅ 예제 4 완료!")
+    print()
+    print("핵심 학습 포인트:")
+    print("1. ainvoke + asyncio.gather로 여러 대화를 한 프로세스에서 동시 처리")
+    print("2. 세마포어는 LLM 요청에만 적용 (도구 실행 중에는 다른 대화가 진행)")
+    print("3. 대화마다 독립된 메시지 히스토리와 반복 상한")
+    print("4. 도착률(--rate)을 고정하고 p95/p99로 꼬리 지연 시간을 확인")
+    print("5. 대화 간 같은 도구 호출은 TTL 캐시로 재사용")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
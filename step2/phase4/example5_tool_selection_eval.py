@@ -0,0 +1,188 @@
+"""
+Phase 4 - 예제 5: 도구 선택 평가 하네스
+
+목표:
+- 예제 1의 도구 선택 정확도 확인을 파일 기반 평가로 확장 (같은 도구 정의: common/example_tools.py)
+- (query, expected_tool) 케이스를 JSONL에서 로드해 동시 실행
+- 모델 응답을 한 번 기록(record)해 두고 API 없이 재생(replay)
+- 정확도, 도구별 혼동 행렬, 처리량 보고
+- (선택) 질문별 도구 사전 선택으로 바인딩 도구를 줄였을 때의 토큰 / 정확도 비교
+
+실행 예:
+    python phase4/example5_tool_selection_eval.py --mode record     # 기록이 없는 질문만 API 호출 + 응답 기록
+    python phase4/example5_tool_selection_eval.py --mode replay     # 기록된 응답으로 채점 (기본, API 키 불필요)
+                                                                    # 기록이 없으면 --mode record를 먼저 실행하라고 안내
+    python phase4/example5_tool_selection_eval.py --cases my_cases.jsonl --max-concurrency 16
+    python phase4/example5_tool_selection_eval.py --mode record --prune-top-k 1   # 전체 도구 vs 상위 1개
+
+케이스 JSONL 한 줄 형식:
+    {"query": "서울의 날씨를 알려주세요", "expected_tool": "get_weather"}
+    (도구를 호출하지 않아야 하면 "expected_tool": "None")
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+from langchain_anthropic import ChatAnthropic
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.tool_schema import bind_tools_cached
+from common.example_tools import TOOLS
+from common.tool_eval import (
+    ResponseStore,
+    binding_fingerprint,
+    evaluate_tool_selection,
+    format_confusion_matrix,
+    load_cases,
+    score_selections,
+    usage_totals,
+)
+from common.tool_pruning import ToolSelector
+
+HERE = Path(__file__).resolve().parent
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="도구 선택 평가 (record / replay)")
+    parser.add_argument("--cases", default=str(HERE / "tool_selection_cases.jsonl"),
+                        help="케이스 JSONL 파일 (기본: phase4/tool_selection_cases.jsonl)")
+    parser.add_argument("--mode", choices=["live", "record", "replay"], default="replay",
+                        help="live: API만 호출 / record: 기록이 없는 질문만 API 호출 + 기록 / replay: 기록된 응답 사용 (기본)")
+    parser.add_argument("--store", default="tool_selection_responses.jsonl",
+                        help="응답 기록 파일 (기본 tool_selection_responses.jsonl)")
+    parser.add_argument("--max-concurrency", type=int, default=8, help="동시 요청 수 (기본 8)")
+    parser.add_argument("--show-errors", type=int, default=10, help="틀린 케이스 출력 개수 (기본 10)")
+    parser.add_argument("--prune-top-k", type=int, default=0,
+                        help="질문별로 상위 k개 도구만 바인딩해 전체 도구와 비교 (기본 0: 비교 안 함)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+
+    # 환경 변수 로드
+    load_dotenv()
+
+    if args.mode != "replay" and not os.getenv("ANTHROPIC_API_KEY"):
+        print("❌ ANTHROPIC_API_KEY가 설정되지 않았습니다. (--mode replay는 API 키 없이 실행 가능)")
+        return
+
+    store = ResponseStore(args.store) if args.mode != "live" else None
+
+    # 기록이 없으면 모든 케이스가 "응답 없음"이 되므로 채점하지 않고 안내
+    if args.mode == "replay" and not len(store):
+        print(f"❌ 기록된 응답이 없습니다: {args.store}")
+        print("   먼저 --mode record로 실행해 응답을 기록하세요 (API 키 필요). 이후 replay는 API 키 없이 실행됩니다.")
+        return
+
+    print("=" * 50)
+    print("예제 5: 도구 선택 평가 하네스")
+    print("=" * 50)
+    print()
+
+    # 1. LLM 설정 및 도구 바인딩 (replay 모드에서는 도구 정의 해시 계산에만 사용)
+    #    도구는 예제 1과 같은 common/example_tools.py의 정의
+    llm = ChatAnthropic(
+        model="claude-3-haiku-20240307",
+        temperature=0,
+        api_key=os.getenv("ANTHROPIC_API_KEY") or "replay-only",
+    )
+    tools = TOOLS
+    llm_with_tools = bind_tools_cached(llm, tools)
+
+    print("📌 실행 설정")
+    print(f"  - 케이스: {args.cases}")
+    print(f"  - 모드: {args.mode}")
+    if store is not None:
+        print(f"  - 응답 기록: {args.store} ({len(store)}개 저장됨)")
+    print(f"  - 도구 정의 해시: {binding_fingerprint(llm_with_tools)} (docstring이 바뀌면 달라짐)")
+    print(f"  - 동시 요청 수: {args.max_concurrency}")
+    if args.prune_top_k:
+        print(f"  - 도구 사전 선택: 질문별 상위 {args.prune_top_k}개 (관련 도구가 없으면 전체)")
+    print()
+
+    # 2. 평가 실행 (입력 순서대로 결과 반환)
+    results, stats = evaluate_tool_selection(
+        llm_with_tools,
+        load_cases(args.cases),
+        mode=args.mode,
+        store=store,
+        max_concurrency=args.max_concurrency,
+    )
+    score = score_selections(results)
+
+    # 3. 결과 보고
+    print("=" * 50)
+    print("📌 결과")
+    print("=" * 50)
+    print()
+    print(f"✅ 정확도: {score['correct']}/{score['total']} ({score['accuracy']:.1%})")
+    if score["errors"]:
+        print(f"⚠️  응답 없음: {score['errors']}개")
+        first_error = next(row["error"] for row in results if row["error"])
+        print(f"    예: {first_error}")
+    if args.mode == "record":
+        reused = sum(1 for row in results if row["error"] is None and row["output"]["source"] == "replay")
+        print(f"📌 API 호출: {len(results) - reused}회 / 기록 재사용: {reused}회")
+    print()
+
+    print("📌 혼동 행렬 (행: 예상 도구, 열: 실제 선택)")
+    print(format_confusion_matrix(score))
+    print()
+
+    wrong = [row for row in results if row["error"] is None and row["output"]["tool"] != row["input"]["expected_tool"]]
+    if wrong:
+        print(f"📌 틀린 케이스 ({len(wrong)}개 중 {min(len(wrong), args.show_errors)}개)")
+        for row in wrong[:args.show_errors]:
+            print(f"  - '{row['input']['query']}': 예상 {row['input']['expected_tool']}, 실제 {row['output']['tool']}")
+        print()
+
+    # 처리량 / 지연 시간 (replay는 API 호출 없이 채점만 하므로 매우 빠름)
+    print(stats.get_report())
+
+    # 4. 도구 사전 선택 비교 (같은 케이스를 질문별 도구 조합으로 다시 평가)
+    if args.prune_top_k:
+        selector = ToolSelector(tools, top_k=args.prune_top_k)
+        pruned_results, _ = evaluate_tool_selection(
+            llm_with_tools,
+            load_cases(args.cases),
+            mode=args.mode,
+            store=store,
+            max_concurrency=args.max_concurrency,
+            bind_for_query=lambda query: bind_tools_cached(llm, selector.select(query)),
+        )
+        pruned_score = score_selections(pruned_results)
+        full_usage, pruned_usage = usage_totals(results), usage_totals(pruned_results)
+
+        print("=" * 50)
+        print(f"📌 도구 사전 선택 비교 (전체 {len(tools)}개 vs 상위 {args.prune_top_k}개)")
+        print("=" * 50)
+        print(f"{'':<22}{'전체 도구':>12}{'사전 선택':>12}")
+        print(f"{'정확도':<22}{score['accuracy']:>12.1%}{pruned_score['accuracy']:>12.1%}")
+        print(f"{'평균 바인딩 도구 수':<22}{full_usage['tools_bound']:>12.2f}{pruned_usage['tools_bound']:>12.2f}")
+        print(f"{'도구 정의 토큰 (추정)':<22}{full_usage['tool_tokens']:>12.0f}{pruned_usage['tool_tokens']:>12.0f}")
+        if full_usage["input_tokens"] is not None and pruned_usage["input_tokens"] is not None:
+            print(f"{'입력 토큰 (실제 평균)':<22}{full_usage['input_tokens']:>12.0f}{pruned_usage['input_tokens']:>12.0f}")
+        saved = 1 - pruned_usage["tool_tokens"] / full_usage["tool_tokens"] if full_usage["tool_tokens"] else 0.0
+        print(f"도구 정의 토큰 절감: {saved:.1%} / 정확도 변화: {pruned_score['accuracy'] - score['accuracy']:+.1%}")
+        if pruned_score["errors"]:
+            print(f"⚠️  사전 선택 응답 없음: {pruned_score['errors']}개 (--mode record로 도구 조합별 응답 기록 필요)")
+        print(selector.get_report())
+
+    print("=" * 50)
+    print("✅ 예제 5 완료!")
+    print()
+    print("핵심 학습 포인트:")
+    print("1. 도구 선택 케이스를 파일로 관리하고 동시 실행으로 빠르게 평가")
+    print("2. 응답을 기록해 두면 이후 채점은 API 호출 없이 재생")
+    print("3. 도구 정의 해시가 기록 키에 포함 → docstring을 바꾸면 다시 record")
+    print("4. 혼동 행렬로 어떤 도구끼리 헷갈리는지 확인")
+    print("5. 질문과 관련된 도구만 바인딩하면 요청마다 도구 정의 토큰 절감")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,14 +5,20 @@ Phase 5 - 예제 2: 병렬 파이프라인 (Parallel Pipeline)
 - RunnableParallel로 여러 작업 동시 실행
 - 독립적인 작업들을 병렬로 처리하여 성능 향상
 - 기사를 입력받아 요약 + 감정 분석 + 키워드 추출을 동시에 수행
+- 세 작업이 공유하는 기사를 프롬프트 앞부분에 두고 프롬프트 캐시 지정
 """
 
+import sys
 import time
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnableParallel, RunnableLambda
+from langchain_core.runnables import RunnableLambda
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.prompt_cache import PROMPT_CACHING_HEADERS, PromptCacheUsage, shared_prefix_parallel, shared_prefix_prompt
 
 # 환경 변수 로드
 load_dotenv()
@@ -20,9 +26,13 @@ load_dotenv()
 # LLM 초기화
 llm = ChatAnthropic(
     model="claude-3-haiku-20240307",
-    temperature=0
+    temperature=0,
+    default_headers=PROMPT_CACHING_HEADERS
 )
 
+# 작업별 캐시 읽기/쓰기 토큰 집계
+cache_usage = PromptCacheUsage()
+
 print("=" * 70)
 print("Phase 5 - 예제 2: 병렬 파이프라인")
 print("=" * 70)
@@ -33,12 +43,13 @@ print("=" * 70)
 
 print("\n[1단계] 각 독립 작업 정의\n")
 
+# 세 작업 모두 [기사 (공통 접두사, 캐시 지정)] + [작업별 지시문] 형태로 요청
+
 # 작업 1: 요약
 summarizer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사를 3문장 이내로 요약해주세요:\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사를 3문장 이내로 요약해주세요.")
     | llm
+    | cache_usage.track("summary")
     | StrOutputParser()
 )
 
@@ -48,10 +59,9 @@ print("   다른 작업과 무관하게 실행 가능")
 
 # 작업 2: 감정 분석
 sentiment_analyzer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사의 전체적인 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나로만 답변):\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사의 전체적인 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나로만 답변).")
     | llm
+    | cache_usage.track("sentiment")
     | StrOutputParser()
 )
 
@@ -61,10 +71,9 @@ print("   요약 결과가 필요 없음")
 
 # 작업 3: 키워드 추출
 keyword_extractor = (
-    PromptTemplate.from_template(
-        "다음 영문 기사에서 핵심 키워드 3개를 추출해주세요 (쉼표로 구분):\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사에서 핵심 키워드 3개를 추출해주세요 (쉼표로 구분).")
     | llm
+    | cache_usage.track("keywords")
     | StrOutputParser()
 )
 
@@ -80,11 +89,12 @@ print("\n" + "=" * 70)
 print("[2단계] 병렬 파이프라인 구성")
 print("=" * 70)
 
-parallel_workflow = RunnableParallel(
-    summary=summarizer,
-    sentiment=sentiment_analyzer,
-    keywords=keyword_extractor
-)
+# RunnableParallel과 같은 결과 (기사가 캐시 최소 길이 이상이면 summary를 먼저 실행해 캐시 기록)
+parallel_workflow = shared_prefix_parallel({
+    "summary": summarizer,
+    "sentiment": sentiment_analyzer,
+    "keywords": keyword_extractor,
+})
 
 print("""
 ✅ RunnableParallel 생성:
@@ -106,6 +116,7 @@ print("""
 - 각 작업은 모두 같은 입력 ({article}) 받음
 - 서로 독립적이라 병렬 실행 가능
 - 모든 작업이 완료되면 결과를 딕셔너리로 반환
+- 같은 기사 접두사는 캐시에서 읽음 (긴 기사만, 캐시 기록용 첫 작업 이후 병렬)
 """)
 
 # ============================================================================
@@ -259,6 +270,9 @@ formatted_result = complete_workflow.invoke({"article": article})
 
 print(formatted_result)
 
+# 작업별 프롬프트 캐시 사용량 (병렬 + 순차 + 후처리 실행 합계)
+print(cache_usage.get_report())
+
 # ============================================================================
 # 핵심 학습 포인트
 # ============================================================================
@@ -282,6 +296,7 @@ print("""
    - 순차 실행 대비 약 3배 빠름
    - LLM API 호출이 동시에 이루어짐
    - 독립적인 작업이 많을수록 효과 큼
+   - 공통 입력(기사)은 프롬프트 앞부분에 두고 캐시 → 긴 기사도 한 번만 처리
 
 4️⃣ 결과 후처리
    - 병렬 결과(딕셔너리)를 다음 단계로 전달
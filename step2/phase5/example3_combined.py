@@ -5,13 +5,19 @@ Phase 5 - 예제 3: 순차 + 병렬 조합 워크플로우
 - 순차 실행과 병렬 실행을 조합한 복잡한 워크플로우
 - 전처리 → 병렬 분석 → 결과 통합 패턴
 - 실전에서 자주 사용되는 파이프라인 구조
+- 병렬 분석이 공유하는 기사를 프롬프트 캐시 접두사로 사용
 """
 
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnableParallel, RunnableLambda, RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.prompt_cache import PROMPT_CACHING_HEADERS, PromptCacheUsage, shared_prefix_parallel, shared_prefix_prompt
 
 # 환경 변수 로드
 load_dotenv()
@@ -19,9 +25,13 @@ load_dotenv()
 # LLM 초기화
 llm = ChatAnthropic(
     model="claude-3-haiku-20240307",
-    temperature=0
+    temperature=0,
+    default_headers=PROMPT_CACHING_HEADERS
 )
 
+# 분석별 캐시 읽기/쓰기 토큰 집계
+cache_usage = PromptCacheUsage()
+
 print("=" * 70)
 print("Phase 5 - 예제 3: 순차 + 병렬 조합 워크플로우")
 print("=" * 70)
@@ -70,50 +80,48 @@ print("\n" + "=" * 70)
 print("[2단계] 병렬 분석 체인 정의")
 print("=" * 70)
 
+# 모든 분석: [기사 (공통 접두사, 캐시 지정)] + [분석별 지시문]
+
 # 분석 1: 요약
 summarizer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사를 3문장 이내로 요약해주세요:\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사를 3문장 이내로 요약해주세요.")
     | llm
+    | cache_usage.track("summary")
     | StrOutputParser()
 )
 
 # 분석 2: 감정 분석
 sentiment_analyzer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사의 전체적인 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나):\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사의 전체적인 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나).")
     | llm
+    | cache_usage.track("sentiment")
     | StrOutputParser()
 )
 
 # 분석 3: 주제 분류
 topic_classifier = (
-    PromptTemplate.from_template(
-        "다음 영문 기사의 주제를 하나의 단어로 분류해주세요 (예: Technology, Health, Politics):\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사의 주제를 하나의 단어로 분류해주세요 (예: Technology, Health, Politics).")
     | llm
+    | cache_usage.track("topic")
     | StrOutputParser()
 )
 
 # 분석 4: 키워드 추출
 keyword_extractor = (
-    PromptTemplate.from_template(
-        "다음 영문 기사에서 핵심 키워드 3개를 추출해주세요 (쉼표로 구분):\n\n{article}"
-    )
+    shared_prefix_prompt("위 영문 기사에서 핵심 키워드 3개를 추출해주세요 (쉼표로 구분).")
     | llm
+    | cache_usage.track("keywords")
     | StrOutputParser()
 )
 
-# 병렬 분석
-parallel_analysis = RunnableParallel(
-    summary=summarizer,
-    sentiment=sentiment_analyzer,
-    topic=topic_classifier,
-    keywords=keyword_extractor,
-    metadata=RunnablePassthrough()  # 원본 데이터 보존
-)
+# 병렬 분석 (기사가 캐시 최소 길이 이상이면 summary를 먼저 실행해 캐시 기록 후 나머지 병렬)
+parallel_analysis = shared_prefix_parallel({
+    "summary": summarizer,
+    "sentiment": sentiment_analyzer,
+    "topic": topic_classifier,
+    "keywords": keyword_extractor,
+    "metadata": RunnablePassthrough()  # 원본 데이터 보존
+})
 
 print("""
 ✅ 병렬 분석 체인 생성:
@@ -308,6 +316,9 @@ print("-" * 70)
 integrated = integration.invoke(analysis_results)
 print("최종 보고서 생성 완료")
 
+# 분석별 프롬프트 캐시 사용량 (전체 실행 + 단계별 실행 합계)
+print(cache_usage.get_report())
+
 # ============================================================================
 # 핵심 학습 포인트
 # ============================================================================
@@ -420,6 +431,7 @@ print("""
    - 같은 입력에 대한 결과 캐싱
    - LangChain 캐싱 기능 활용
    - 반복 호출 비용 절감
+   - 병렬 분석이 공유하는 입력은 프롬프트 앞부분에 두고 프롬프트 캐시 지정
 
 5️⃣ 배치 처리
    - 여러 입력을 한 번에 처리
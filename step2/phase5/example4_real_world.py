@@ -6,17 +6,30 @@ Phase 5 - 예제 4: 실전 시나리오 (뉴스 기사 분석 시스템)
 - 에러 처리 및 재시도 로직
 - 로깅 및 모니터링
 - 실전에서 사용 가능한 완전한 파이프라인
+- 병렬 분석이 공유하는 기사를 프롬프트 캐시 접두사로 사용 (분석별 캐시 토큰 보고)
+- --mode fused: 5개 분석을 한 번의 구조화 호출로 (기사를 입력 토큰으로 1번만 전송)
+
+실행:
+    python phase5/example4_real_world.py               # fanout 모드 (기본, 5개 호출 병렬)
+    python phase5/example4_real_world.py --mode fused  # fused 모드 (1개 호출)
 """
 
+import argparse
+import sys
 import time
 import logging
+from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
-from langchain_core.runnables import RunnableParallel, RunnableLambda, RunnablePassthrough
+from langchain_core.runnables import RunnableLambda, RunnablePassthrough
+
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.news_analysis import ANALYSIS_FIELDS, build_fused_analyzer, to_report_fields
+from common.prompt_cache import PROMPT_CACHING_HEADERS, PromptCacheUsage, shared_prefix_parallel, shared_prefix_prompt
 
 # ============================================================================
 # 로깅 설정
@@ -31,12 +44,22 @@ logger = logging.getLogger(__name__)
 # 환경 변수 로드
 load_dotenv()
 
+arg_parser = argparse.ArgumentParser(description="실전 뉴스 기사 분석 시스템")
+arg_parser.add_argument(
+    "--mode", choices=["fanout", "fused"], default="fanout",
+    help="fanout: 분석별 5개 호출 병렬 / fused: 구조화 출력 1개 호출 (기본 fanout)"
+)
+args = arg_parser.parse_args()
+
 # LLM 초기화
 llm = ChatAnthropic(
     model="claude-3-haiku-20240307",
     temperature=0
 )
 
+# 프롬프트 캐시 헤더는 기사 접두사를 공유하는 fanout 분석 체인에만 적용 (fused 모드는 1회 호출)
+cached_llm = llm.bind(extra_headers=PROMPT_CACHING_HEADERS)
+
 print("=" * 70)
 print("Phase 5 - 예제 4: 실전 뉴스 기사 분석 시스템")
 print("=" * 70)
@@ -118,6 +141,9 @@ class WorkflowMonitor:
 # 전역 모니터
 monitor = WorkflowMonitor()
 
+# 분석별 프롬프트 캐시 토큰 집계
+cache_usage = PromptCacheUsage()
+
 # ============================================================================
 # 2. 에러 처리 및 재시도 래퍼
 # ============================================================================
@@ -163,8 +189,9 @@ def validate_input(data: Dict[str, Any]) -> Dict[str, Any]:
     if len(article) < 50:
         raise ValueError(f"기사가 너무 짧습니다 (최소 50자 필요, 현재 {len(article)}자)")
 
-    if len(article) > 10000:
-        raise ValueError(f"기사가 너무 깁니다 (최대 10000자, 현재 {len(article)}자)")
+    # 프롬프트 캐시 최소 길이(약 8,000자)를 넘는 실제 크기의 기사도 허용
+    if len(article) > 50000:
+        raise ValueError(f"기사가 너무 깁니다 (최대 50000자, 현재 {len(article)}자)")
 
     monitor.step_complete(step_name)
     return data
@@ -206,44 +233,39 @@ print("✅ 전처리 파이프라인 생성 완료")
 
 print("\n[2단계] 병렬 분석 파이프라인 구성\n")
 
-# 분석 체인들
+# 분석 체인들: [기사 (공통 접두사, 캐시 지정)] + [분석별 지시문]
 summarizer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사를 3문장 이내로 요약해주세요:\n\n{article}"
-    )
-    | llm
+    shared_prefix_prompt("위 영문 기사를 3문장 이내로 요약해주세요.")
+    | cached_llm
+    | cache_usage.track("summary")
     | StrOutputParser()
 )
 
 sentiment_analyzer = (
-    PromptTemplate.from_template(
-        "다음 영문 기사의 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나):\n\n{article}"
-    )
-    | llm
+    shared_prefix_prompt("위 영문 기사의 감정을 분석해주세요 (긍정적/중립적/부정적 중 하나).")
+    | cached_llm
+    | cache_usage.track("sentiment")
     | StrOutputParser()
 )
 
 topic_classifier = (
-    PromptTemplate.from_template(
-        "다음 영문 기사의 주제를 분류해주세요 (Technology/Health/Politics/Business/Other 중 하나):\n\n{article}"
-    )
-    | llm
+    shared_prefix_prompt("위 영문 기사의 주제를 분류해주세요 (Technology/Health/Politics/Business/Other 중 하나).")
+    | cached_llm
+    | cache_usage.track("topic")
     | StrOutputParser()
 )
 
 keyword_extractor = (
-    PromptTemplate.from_template(
-        "다음 영문 기사에서 핵심 키워드 5개를 추출해주세요 (쉼표로 구분):\n\n{article}"
-    )
-    | llm
+    shared_prefix_prompt("위 영문 기사에서 핵심 키워드 5개를 추출해주세요 (쉼표로 구분).")
+    | cached_llm
+    | cache_usage.track("keywords")
     | StrOutputParser()
 )
 
 entity_extractor = (
-    PromptTemplate.from_template(
-        "다음 영문 기사에서 주요 인물, 조직, 장소를 추출해주세요 (각각 쉼표로 구분하여 나열):\n\n{article}"
-    )
-    | llm
+    shared_prefix_prompt("위 영문 기사에서 주요 인물, 조직, 장소를 추출해주세요 (각각 쉼표로 구분하여 나열).")
+    | cached_llm
+    | cache_usage.track("entities")
     | StrOutputParser()
 )
 
@@ -264,17 +286,37 @@ def safe_analyze(analyzer, name: str):
 
     return RunnableLambda(analyze_with_fallback)
 
-# 병렬 분석 (에러 처리 포함)
-parallel_analysis = RunnableParallel(
-    summary=safe_analyze(summarizer, "요약 분석"),
-    sentiment=safe_analyze(sentiment_analyzer, "감정 분석"),
-    topic=safe_analyze(topic_classifier, "주제 분류"),
-    keywords=safe_analyze(keyword_extractor, "키워드 추출"),
-    entities=safe_analyze(entity_extractor, "개체명 추출"),
-    metadata=RunnablePassthrough()
-)
-
-print("✅ 병렬 분석 파이프라인 생성 완료 (에러 처리 포함)")
+# 병렬 분석 (에러 처리 포함, 긴 기사는 요약 분석이 먼저 캐시를 기록한 뒤 나머지 병렬)
+parallel_analysis = shared_prefix_parallel({
+    "summary": safe_analyze(summarizer, "요약 분석"),
+    "sentiment": safe_analyze(sentiment_analyzer, "감정 분석"),
+    "topic": safe_analyze(topic_classifier, "주제 분류"),
+    "keywords": safe_analyze(keyword_extractor, "키워드 추출"),
+    "entities": safe_analyze(entity_extractor, "개체명 추출"),
+    "metadata": RunnablePassthrough()
+})
+
+# 통합 분석 (fused 모드): 기사 1번 전송 → ArticleAnalysis → 같은 5개 문자열 필드
+fused_analyzer = build_fused_analyzer(llm)
+
+def fused_analyze(data: Dict[str, Any]) -> Dict[str, Any]:
+    """5개 분석을 한 번에 실행 (parallel_analysis와 같은 출력 형태)"""
+    name = "통합 분석"
+    try:
+        logger.info(f"📊 {name} 시작")
+        results = to_report_fields(fused_analyzer.invoke(data))
+        monitor.step_complete(name)
+    except Exception as e:
+        logger.error(f"❌ {name} 실패: {e}")
+        monitor.record_error(name, e)
+        results = dict.fromkeys(ANALYSIS_FIELDS, f"[분석 실패: {str(e)}]")
+    return {**results, "metadata": data}
+
+fused_analysis = RunnableLambda(fused_analyze)
+
+analysis = fused_analysis if args.mode == "fused" else parallel_analysis
+
+print(f"✅ 분석 파이프라인 생성 완료 (에러 처리 포함, {args.mode} 모드)")
 
 # ============================================================================
 # 5. 결과 통합 및 포맷팅
@@ -392,7 +434,7 @@ print("=" * 70)
 # 전체 워크플로우
 production_workflow = (
     preprocessing       # 전처리 (검증 + 정제)
-    | parallel_analysis # 병렬 분석 (5개 분석 동시 실행)
+    | analysis          # 분석 (fanout: 5개 분석 동시 실행 / fused: 1개 호출)
     | integration       # 결과 통합 (검증 + 포맷팅)
 )
 
@@ -405,7 +447,7 @@ print("""
      ├→ 입력 검증 (재시도 3회)
      └→ 텍스트 정제
      ↓
-    [병렬 분석] (에러 처리 포함)
+    [병렬 분석] (에러 처리 포함, --mode fused면 1개 호출로 통합)
      ├→ 요약 분석
      ├→ 감정 분석
      ├→ 주제 분류
@@ -423,6 +465,7 @@ print("""
 ✅ 에러 처리 및 Fallback
 ✅ 로깅 및 모니터링
 ✅ 품질 검증
+✅ 공통 기사 접두사 프롬프트 캐시 (분석별 캐시 토큰 보고)
 """)
 
 # ============================================================================
@@ -475,6 +518,10 @@ try:
     print("=" * 70)
     print(monitor.get_report())
 
+    # 분석별 프롬프트 캐시 사용량 (fanout 모드)
+    if args.mode == "fanout":
+        print(cache_usage.get_report())
+
 except Exception as e:
     monitor.end()
     logger.error(f"🚨 워크플로우 실행 중 치명적 에러 발생: {e}")
@@ -538,6 +585,17 @@ print("""
    - 전처리 → 병렬 분석 → 통합
    - 각 단계마다 에러 처리
    - 전체 실행 모니터링
+
+6️⃣ 프롬프트 캐시 (fanout 모드)
+   - 기사를 모든 분석에 공통인 앞부분으로, 지시문은 뒤로
+   - cache_control로 지정 → 두 번째 분석부터 기사 토큰은 캐시 읽기
+   - 캐시는 첫 응답 이후에 사용 가능 → 첫 분석을 먼저 실행한 뒤 병렬
+
+7️⃣ 호출 통합 (--mode fused)
+   - 같은 기사를 5번 보내는 대신 1번만 전송 → 입력 토큰 약 1/5
+   - 구조화 출력(Pydantic)으로 감정/주제 값을 허용된 레이블로 제한
+   - 출력 형태가 같으므로 결과 통합 단계는 그대로
+   - 비교: python benchmarks/news_analysis.py
 """)
 
 # ============================================================================
@@ -9,12 +9,18 @@ Phase 6 - 예제 2: ReAct 패턴 상세 분석
 """
 
 import os
+import sys
+from pathlib import Path
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
 from langchain.agents import create_react_agent, AgentExecutor
 from langchain_core.tools import tool
 from langchain_core.prompts import PromptTemplate
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.calculator import evaluate
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -86,12 +92,8 @@ def calculate(expression: str) -> str:
         계산 결과 문자열
     """
     try:
-        # 안전한 계산을 위해 기본적인 수학 연산만 허용
-        allowed_chars = set("0123456789+-*/(). ")
-        if not all(c in allowed_chars for c in expression):
-            return "허용되지 않는 문자가 포함되어 있습니다."
-
-        result = eval(expression)
+        # 안전한 계산을 위해 기본적인 수학 연산만 허용 (AST 검사, 표현식별 캐시)
+        result = evaluate(expression)
         return str(float(result))
     except Exception as e:
         return f"계산 오류: {str(e)}"
@@ -9,8 +9,10 @@ Phase 6 - 예제 3: 커스텀 도구와 Agent
 """
 
 import os
+import sys
 import json
 import re
+from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 from langchain_anthropic import ChatAnthropic
@@ -18,6 +20,11 @@ from langchain.agents import create_react_agent, AgentExecutor
 from langchain_core.tools import tool
 from langchain_core.prompts import PromptTemplate
 
+# step2/common 모듈 사용을 위해 상위 디렉토리를 경로에 추가
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from common.search_index import NgramIndex
+from common.tool_cache import tool_cache
+
 # 환경 변수 로드
 load_dotenv()
 
@@ -31,7 +38,33 @@ print()
 # ============================================================================
 
 
+# 모의 뉴스 데이터
+NEWS_DATA = {
+    "AI 기술": {
+        "title": "AI 기술 혁신, GPT-5보다 10배 뛰어넘",
+        "content": "OpenAI가 최신 AI 모델 GPT-5를 공개하며, 이전 모델보다 10배 더 뛰어난 성능을 보여줬다. 연구원들은 이 모델의 안전성에 대해 우려를 표명하고 있다.",
+        "date": "2024-12-10",
+        "source": "테크뉴스",
+    },
+    "애플 주식": {
+        "title": "애플의 최신 분기 실적 발표",
+        "content": "애플이 최신 분기 실적을 발표했다. 매출 119조 달러를 기록하며, 시장의 예상을 뛰어넘었다. 주요 애플들의 주가가 상승했으며, 투자들은 긍정적인 반응을 보이고 있다.",
+        "date": "2024-12-09",
+        "source": "경제신문",
+    },
+    "환경 정책": {
+        "title": "정부, 탄소중립 목표 2030년 달성",
+        "content": "정부가 2050년까지 탄소중립을 목표로 삼고, 관련 산업에 대한 지원 정책을 발표했다. 기업들은 탄소 배출권 거래에 참여해야 한다.",
+        "date": "2024-12-08",
+        "source": "정부부 보도자료",
+    },
+}
+# 분류와 제목을 검색 대상으로 하는 2-gram 인덱스 (로드 시 한 번만 생성)
+news_index = NgramIndex({category: (category, news["title"]) for category, news in NEWS_DATA.items()})
+
+
 @tool
+@tool_cache.memoize(ttl=600)  # 같은 키워드 검색은 10분간 재사용
 def search_news(query: str) -> str:
     """
     최신 뉴스를 검색합니다.
@@ -42,47 +75,26 @@ def search_news(query: str) -> str:
     Returns:
         검색된 뉴스 정보 (JSON 형식)
     """
-    # 모의 뉴스 데이터
-    news_data = {
-        "AI 기술": {
-            "title": "AI 기술 혁신, GPT-5보다 10배 뛰어넘",
-            "content": "OpenAI가 최신 AI 모델 GPT-5를 공개하며, 이전 모델보다 10배 더 뛰어난 성능을 보여줬다. 연구원들은 이 모델의 안전성에 대해 우려를 표명하고 있다.",
-            "date": "2024-12-10",
-            "source": "테크뉴스",
-        },
-        "애플 주식": {
-            "title": "애플의 최신 분기 실적 발표",
-            "content": "애플이 최신 분기 실적을 발표했다. 매출 119조 달러를 기록하며, 시장의 예상을 뛰어넘었다. 주요 애플들의 주가가 상승했으며, 투자들은 긍정적인 반응을 보이고 있다.",
-            "date": "2024-12-09",
-            "source": "경제신문",
-        },
-        "환경 정책": {
-            "title": "정부, 탄소중립 목표 2030년 달성",
-            "content": "정부가 2050년까지 탄소중립을 목표로 삼고, 관련 산업에 대한 지원 정책을 발표했다. 기업들은 탄소 배출권 거래에 참여해야 한다.",
-            "date": "2024-12-08",
-            "source": "정부부 보도자료",
-        },
-    }
-
-    # 키워드로 뉴스 검색
+    # 키워드로 뉴스 검색 (분류/제목 n-gram 인덱스로 후보만 확인)
     results = []
-    for category, news in news_data.items():
-        if query.lower() in category.lower() or query.lower() in news["title"].lower():
-            results.append(
-                {
-                    "category": category,
-                    "title": news["title"],
-                    "content": news["content"][:100] + "...",  # 요약
-                    "date": news["date"],
-                    "source": news["source"],
-                }
-            )
+    for category in news_index.search(query):
+        news = NEWS_DATA[category]
+        results.append(
+            {
+                "category": category,
+                "title": news["title"],
+                "content": news["content"][:100] + "...",  # 요약
+                "date": news["date"],
+                "source": news["source"],
+            }
+        )
 
     print(f"    [도구 실행] search_news('{query}') → {len(results)}개 결과")
     return json.dumps(results, ensure_ascii=False)
 
 
 @tool
+@tool_cache.memoize(ttl=None)
 def analyze_sentiment(text: str) -> str:
     """
     텍스트의 감정을 분석합니다.
@@ -113,6 +125,7 @@ def analyze_sentiment(text: str) -> str:
 
 
 @tool
+@tool_cache.memoize(ttl=None)
 def extract_key_info(news_json: str) -> str:
     """
     뉴스 JSON에서 핵심 정보를 추출합니다.
@@ -143,6 +156,7 @@ def extract_key_info(news_json: str) -> str:
 
 
 @tool
+@tool_cache.memoize(ttl=None)
 def generate_summary(news_info: str, sentiment: str) -> str:
     """
     뉴스 정보와 감정을 바탕으로 요약을 생성합니다.
@@ -170,6 +184,7 @@ def generate_summary(news_info: str, sentiment: str) -> str:
 
 
 @tool
+@tool_cache.memoize(enabled=False)  # 작성 시각이 매번 달라지므로 캐시 제외
 def create_report(title: str, content: str, analysis: str) -> str:
     """
     최종 보고서를 생성합니다.
@@ -492,6 +507,9 @@ Agent의 동적 도구 선택 능력:
 - 콘텐츠 생성 및 관리
 """)
 
+# 테스트 1과 의존성 테스트가 같은 search_news("AI 기술")를 호출하면 캐시에서 재사용
+print(tool_cache.get_report())
+
 print("\n" + "=" * 70)
 print("✅ Phase 6 예제 3 완료!")
 print("=" * 70)